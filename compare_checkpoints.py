@@ -6,6 +6,7 @@ checkpoint性能对比脚本
 
 import os
 import argparse
+import json
 from pathlib import Path
 
 def analyze_checkpoint_performance():
@@ -73,14 +74,60 @@ def analyze_checkpoint_performance():
     
     return "agent_650000.pt"
 
+def inspect_checkpoints(checkpoint_dir):
+    """列出目录中的checkpoint（紧凑格式只读取文件头，不加载张量）"""
+    try:
+        from arm.utils.checkpoint_format import CompactCheckpoint, is_compact_checkpoint
+    except ImportError:
+        CompactCheckpoint = is_compact_checkpoint = None
+
+    print(f"\n📂 Checkpoint列表: {checkpoint_dir}")
+    print(f"{'文件':<24} {'大小(MB)':<10} {'格式':<20} {'张量数':<8} {'权重类型'}")
+    print("-" * 80)
+    for path in sorted(Path(checkpoint_dir).glob("*.pt"), key=lambda p: p.stat().st_mtime):
+        size_mb = path.stat().st_size / 1024 / 1024
+        if is_compact_checkpoint is not None and is_compact_checkpoint(str(path)):
+            with CompactCheckpoint(str(path)) as checkpoint:
+                names = checkpoint.names("policy")
+                dtype = checkpoint.info(names[0])["stored_dtype"] if names else "-"
+                fmt = f"compact-{checkpoint.variant}"
+                print(f"{path.name:<24} {size_mb:<10.1f} {fmt:<20} {len(checkpoint.names()):<8} {dtype}")
+        else:
+            print(f"{path.name:<24} {size_mb:<10.1f} {'torch':<20} {'-':<8} -")
+
+def read_retention_index(checkpoint_dir):
+    """读取训练时的top-k保留记录（retention.json），返回最佳checkpoint名称"""
+    index_path = Path(checkpoint_dir) / "retention.json"
+    if not index_path.exists():
+        return None
+    with open(index_path) as f:
+        index = json.load(f)
+
+    print(f"🎯 在线指标排名 ({index['metric']}, {index['mode']})")
+    print("=" * 80)
+    reverse = index["mode"] == "max"
+    for name, score in sorted(index["scores"].items(), key=lambda item: item[1], reverse=reverse):
+        marks = ("⭐ 最佳 " if name == index["best"] else "") + ("最新" if name == index["latest"] else "")
+        print(f"{name:<24} {score:<12.4f} {marks}")
+    print("=" * 80)
+    return index["best"]
+
 def main():
     parser = argparse.ArgumentParser(description="Checkpoint性能对比")
     parser.add_argument("--checkpoint-dir", 
                        default="./logs/skrl/arm/2025-07-01_01-25-09_ppo_torch/checkpoints/",
                        help="Checkpoint目录路径")
+    parser.add_argument("--inspect", action="store_true",
+                       help="列出目录中所有checkpoint的大小和格式")
     args = parser.parse_args()
+
+    if args.inspect:
+        inspect_checkpoints(args.checkpoint_dir)
     
-    best_checkpoint = analyze_checkpoint_performance()
+    # 优先使用训练时记录的在线指标，否则使用手动分析结果
+    best_checkpoint = read_retention_index(args.checkpoint_dir)
+    if best_checkpoint is None:
+        best_checkpoint = analyze_checkpoint_performance()
     
     checkpoint_path = Path(args.checkpoint_dir) / best_checkpoint
     if checkpoint_path.exists():
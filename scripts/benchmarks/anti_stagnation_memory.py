@@ -0,0 +1,78 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to measure the memory allocations of the anti-stagnation reward term per step.
+
+The term is evaluated on a stub environment (no simulation is created), e.g.:
+
+    python scripts/benchmarks/anti_stagnation_memory.py --headless --device cuda:0
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Measure the allocations of the anti-stagnation reward term.")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[4096, 16384], help="Numbers of environments.")
+parser.add_argument("--num_calls", type=int, default=200, help="Number of measured calls.")
+
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+
+from common import allocations_per_call, make_stub_env, step_stub_env, time_per_call
+
+from isaaclab.managers import RewardTermCfg, SceneEntityCfg
+
+import arm.tasks.manager_based.arm.mdp as mdp
+
+
+def main():
+    """Report the allocations, buffer memory and time per call of the term."""
+    device = args_cli.device if args_cli.device is not None else "cpu"
+    for num_envs in args_cli.num_envs:
+        env = make_stub_env(num_envs, device)
+        step_stub_env(env)
+        cfg = RewardTermCfg(
+            func=mdp.anti_stagnation_reward,
+            weight=1.0,
+            params={"asset_cfg": SceneEntityCfg("robot"), "target_cfg": SceneEntityCfg("target_marker")},
+        )
+        if torch.device(device).type == "cuda":
+            torch.cuda.reset_peak_memory_stats(device)
+            memory_before = torch.cuda.memory_allocated(device)
+        term = mdp.anti_stagnation_reward(cfg, env)
+
+        def call():
+            # the env step counter is not advanced: the shared kinematics stay cached and only the term is measured
+            term(env, **cfg.params)
+
+        allocations = allocations_per_call(call, args_cli.num_calls, device)
+        step_time = time_per_call(call, args_cli.num_calls, device)
+        print(f"[INFO] num_envs: {num_envs} | device: {device}")
+        print(f"  - allocations per step: {allocations:.2f}")
+        print(f"  - time per step:        {1e6 * step_time:.1f} us")
+        if torch.device(device).type == "cuda":
+            buffer_memory = torch.cuda.max_memory_allocated(device) - memory_before
+            print(f"  - term buffers:         {buffer_memory / 2**20:.2f} MiB")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
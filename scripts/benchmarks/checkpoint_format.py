@@ -0,0 +1,90 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to compare the size and the save/load times of skrl's checkpoint format (``torch.save``) and the compact
+format (full-resume and inference-only variants, float16/bfloat16 weights, with and without compression).
+
+The state has the modules and sizes of the PPO agent of the arm task. It also checks that the compact checkpoints
+round-trip (exactly for float32, within the precision of the reduced dtype otherwise) and times reading a single
+tensor lazily. No simulator is needed, e.g.:
+
+    python scripts/benchmarks/checkpoint_format.py
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import torch
+
+from common import make_agent_state
+
+from arm.utils.checkpoint_format import CompactCheckpoint, load_checkpoint, save_compact_checkpoint
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the compact checkpoint format.")
+parser.add_argument("--repeats", type=int, default=5, help="Number of timed saves/loads of every format.")
+args_cli = parser.parse_args()
+
+FORMATS = {
+    "torch": None,
+    "full (fp32, zlib)": dict(variant="full"),
+    "full (fp32, none)": dict(variant="full", compression="none"),
+    "full (bf16, zlib)": dict(variant="full", dtype="bfloat16"),
+    "inference (fp16, zlib)": dict(variant="inference"),
+    "inference (fp16, none)": dict(variant="inference", compression="none"),
+    "inference (bf16, zlib)": dict(variant="inference", dtype="bfloat16"),
+}
+
+
+def _timed(func, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats * 1e3
+
+
+def _max_error(reference, loaded) -> float:
+    """Maximum absolute difference of the tensors of two nested states."""
+    if isinstance(reference, torch.Tensor):
+        return (reference.double() - loaded.double()).abs().max().item() if reference.numel() else 0.0
+    if isinstance(reference, dict):
+        return max((_max_error(value, loaded[key]) for key, value in reference.items()), default=0.0)
+    if isinstance(reference, (list, tuple)):
+        return max((_max_error(value, other) for value, other in zip(reference, loaded)), default=0.0)
+    if reference != loaded:
+        raise ValueError(f"Value mismatch: {reference} != {loaded}")
+    return 0.0
+
+
+def main():
+    """Compare the checkpoint formats."""
+    state = make_agent_state("cpu")
+    columns = ["size (MB)", "save (ms)", "load (ms)", "1 tensor (ms)", "max error"]
+    print(f"{'format':<24} " + " ".join(f"{column:>{max(len(column), 10)}}" for column in columns))
+    with tempfile.TemporaryDirectory() as directory:
+        for name, kwargs in FORMATS.items():
+            path = os.path.join(directory, "agent.pt")
+            if kwargs is None:
+                save_ms = _timed(lambda: torch.save(state, path), args_cli.repeats)
+                tensor_ms = float("nan")
+            else:
+                save_ms = _timed(lambda: save_compact_checkpoint(state, path, **kwargs), args_cli.repeats)
+
+                def read_tensor():
+                    with CompactCheckpoint(path) as checkpoint:
+                        checkpoint.tensor("policy/0.weight")
+
+                tensor_ms = _timed(read_tensor, args_cli.repeats)
+            load_ms = _timed(lambda: load_checkpoint(path), args_cli.repeats)
+            loaded = load_checkpoint(path)
+            error = _max_error({key: value for key, value in state.items() if key in loaded}, loaded)
+            size_mb = os.path.getsize(path) / 2**20
+            print(f"{name:<24} {size_mb:>10.2f} {save_ms:>10.1f} {load_ms:>10.1f} {tensor_ms:>13.2f} {error:>10.2e}")
+
+
+if __name__ == "__main__":
+    main()
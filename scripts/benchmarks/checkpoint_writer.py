@@ -0,0 +1,87 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to compare the time the training thread spends on a checkpoint with the synchronous (``torch.save``) and
+the asynchronous writer.
+
+The state has the modules and sizes of the PPO agent of the arm task (policy, value, Adam, preprocessors). Between
+two checkpoints, the training thread runs a few optimizer steps (so that the asynchronous writes overlap with
+work). No simulator is needed, e.g.:
+
+    python scripts/benchmarks/checkpoint_writer.py --device cuda:0 --num_checkpoints 20
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import torch
+
+from common import make_agent_state, synchronize
+
+from arm.utils.checkpoint_writer import AsyncCheckpointWriter
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the synchronous and asynchronous checkpoint writers.")
+parser.add_argument("--device", type=str, default="cpu", help="Device of the agent state.")
+parser.add_argument("--num_checkpoints", type=int, default=20, help="Number of checkpoints to write.")
+parser.add_argument("--work_ms", type=float, default=50.0, help="Training work between two checkpoints (in ms).")
+parser.add_argument("--max_pending", type=int, default=2, help="Maximum pending writes of the async writer.")
+parser.add_argument("--output", type=str, default=None, help="Directory of the checkpoints (default: temporary).")
+args_cli = parser.parse_args()
+
+
+def train_work(state: dict, duration_ms: float):
+    """Modify the state in place for about ``duration_ms`` (as the optimizer steps between checkpoints do)."""
+    end = time.perf_counter() + duration_ms * 1e-3
+    while time.perf_counter() < end:
+        for tensor in state["policy"].values():
+            tensor.add_(1e-6)
+        synchronize(args_cli.device)
+
+
+def benchmark(directory: str, save) -> list[float]:
+    """Write the checkpoints with ``save(path, state)`` and return the time spent on the training thread (in ms)."""
+    state = make_agent_state(args_cli.device)
+    stalls = []
+    for index in range(args_cli.num_checkpoints):
+        train_work(state, args_cli.work_ms)
+        start = time.perf_counter()
+        save(os.path.join(directory, f"agent_{index}.pt"), state)
+        stalls.append((time.perf_counter() - start) * 1e3)
+    return stalls
+
+
+def main():
+    """Compare the stall of the training thread of both writers."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        directory = args_cli.output if args_cli.output is not None else tmp_dir
+        os.makedirs(directory, exist_ok=True)
+
+        sync_stalls = benchmark(directory, lambda path, state: torch.save(state, path))
+
+        writer = AsyncCheckpointWriter(max_pending=args_cli.max_pending)
+        start = time.perf_counter()
+        async_stalls = benchmark(directory, writer.submit)
+        train_s = time.perf_counter() - start
+        writer.close()
+        total_s = time.perf_counter() - start
+
+        # the last asynchronous checkpoint is complete and loads to the snapshotted values
+        state = torch.load(os.path.join(directory, f"agent_{args_cli.num_checkpoints - 1}.pt"), weights_only=False)
+        print(f"[INFO] Last checkpoint has {len(state['policy'])} policy tensors.")
+
+    print(f"Device: {args_cli.device} | checkpoints: {args_cli.num_checkpoints} | work: {args_cli.work_ms} ms")
+    print(f"{'writer':<8} {'mean stall (ms)':>16} {'max stall (ms)':>16}")
+    for name, stalls in (("sync", sync_stalls), ("async", async_stalls)):
+        print(f"{name:<8} {sum(stalls) / len(stalls):>16.2f} {max(stalls):>16.2f}")
+    print(f"Async: {train_s:.2f} s of training, {total_s - train_s:.2f} s to drain the queue.")
+    print("Async write latencies:")
+    print(writer.summary())
+
+
+if __name__ == "__main__":
+    main()
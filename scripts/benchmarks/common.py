@@ -0,0 +1,281 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Shared helpers for the benchmark scripts.
+
+The stub environment mimics the parts of :class:`isaaclab.envs.ManagerBasedRLEnv` (scene entities and their
+data buffers) that the MDP terms of the arm task read. It allows calling the terms on random tensors without
+creating a simulation. The stub vectorized environment and the shared Gaussian model have the interfaces of skrl's
+environment wrappers and models, for the learners that run without a simulation.
+"""
+
+import math
+import re
+import time
+import torch
+from types import SimpleNamespace
+
+ARM_BODY_NAMES = ["base_link"] + [f"link_{i}" for i in range(1, 8)] + ["arm_end"]
+ARM_JOINT_NAMES = [f"joint_{i}" for i in range(1, 9)]
+
+
+class StubArticulation:
+    """Articulation with random body/joint state."""
+
+    def __init__(self, num_envs: int, device: str):
+        self.body_names = ARM_BODY_NAMES
+        self.joint_names = ARM_JOINT_NAMES
+        self.num_bodies = len(self.body_names)
+        self.num_joints = len(self.joint_names)
+        self.data = SimpleNamespace(
+            root_pos_w=torch.zeros(num_envs, 3, device=device),
+            body_pos_w=torch.zeros(num_envs, self.num_bodies, 3, device=device),
+            joint_pos=torch.zeros(num_envs, self.num_joints, device=device),
+            joint_vel=torch.zeros(num_envs, self.num_joints, device=device),
+            default_joint_pos=torch.zeros(num_envs, self.num_joints, device=device),
+            default_joint_vel=torch.zeros(num_envs, self.num_joints, device=device),
+        )
+
+    def find_bodies(self, name_keys, preserve_order: bool = False) -> tuple[list[int], list[str]]:
+        return _find(self.body_names, name_keys)
+
+    def find_joints(self, name_keys, joint_subset=None, preserve_order: bool = False) -> tuple[list[int], list[str]]:
+        return _find(self.joint_names, name_keys)
+
+    def randomize(self):
+        self.data.body_pos_w.uniform_(-0.5, 0.5)
+        self.data.joint_pos.uniform_(-3.0, 3.0)
+        self.data.joint_vel.normal_(0.0, 2.0)
+
+
+class StubRigidObject:
+    """Rigid object with a random root position."""
+
+    def __init__(self, num_envs: int, device: str):
+        self.data = SimpleNamespace(root_pos_w=torch.zeros(num_envs, 3, device=device))
+
+
+def _find(names: list[str], name_keys) -> tuple[list[int], list[str]]:
+    if isinstance(name_keys, str):
+        name_keys = [name_keys]
+    ids = [i for i, name in enumerate(names) if any(re.fullmatch(key, name) for key in name_keys)]
+    if not ids:
+        raise ValueError(f"No names match {name_keys}. Available: {names}")
+    return ids, [names[i] for i in ids]
+
+
+def make_stub_env(num_envs: int, device: str) -> SimpleNamespace:
+    """Create a stub of the arm environment with a robot and a target marker."""
+    return SimpleNamespace(
+        num_envs=num_envs,
+        device=device,
+        scene={"robot": StubArticulation(num_envs, device), "target_marker": StubRigidObject(num_envs, device)},
+        common_step_counter=0,
+        step_dt=1.0 / 60.0,
+        max_episode_length_s=20.0,
+        extras={},
+    )
+
+
+def step_stub_env(env: SimpleNamespace, target_noise: float = 0.05):
+    """Advance the stub environment by one step with random data.
+
+    The target is placed close to the end-effector (normal noise with std ``target_noise``) so that all
+    distance thresholds of the reach terms are exercised.
+    """
+    robot = env.scene["robot"]
+    robot.randomize()
+    ee_pos = robot.data.body_pos_w[:, -1]
+    env.scene["target_marker"].data.root_pos_w.copy_(ee_pos + target_noise * torch.randn_like(ee_pos))
+    env.common_step_counter += 1
+
+
+def synchronize(device: str):
+    """Wait for all kernels on the device (no-op on CPU)."""
+    if torch.device(device).type == "cuda":
+        torch.cuda.synchronize(device)
+
+
+def time_per_call(fn, num_calls: int, device: str, warmup: int = 10) -> float:
+    """Average wall-clock time of ``fn()`` in seconds."""
+    for _ in range(warmup):
+        fn()
+    synchronize(device)
+    start_time = time.perf_counter()
+    for _ in range(num_calls):
+        fn()
+    synchronize(device)
+    return (time.perf_counter() - start_time) / num_calls
+
+
+def allocations_per_call(fn, num_calls: int, device: str) -> float:
+    """Average number of memory allocations of ``fn()`` (after one warm-up call).
+
+    On CUDA, this uses the allocator statistics of the caching allocator. On CPU, it counts the operators that
+    allocated memory themselves in a memory profile.
+    """
+    fn()
+    synchronize(device)
+    if torch.device(device).type == "cuda":
+        before = torch.cuda.memory_stats(device)["allocation.all.allocated"]
+        for _ in range(num_calls):
+            fn()
+        synchronize(device)
+        return (torch.cuda.memory_stats(device)["allocation.all.allocated"] - before) / num_calls
+    with torch.profiler.profile(activities=[torch.profiler.ProfilerActivity.CPU], profile_memory=True) as prof:
+        for _ in range(num_calls):
+            fn()
+    return sum(1 for event in prof.events() if event.self_cpu_memory_usage > 0) / num_calls
+
+
+POLICY_LAYERS = [512, 512, 256, 256, 128, 128, 64]
+"""Hidden layers of the policy and value networks of the skrl agent config."""
+
+
+def make_mlp(num_inputs: int, num_outputs: int, layers: list[int] = POLICY_LAYERS) -> torch.nn.Sequential:
+    """MLP with ELU activations, as instantiated by skrl's model instantiator."""
+    modules = []
+    for num_units in layers:
+        modules += [torch.nn.Linear(num_inputs, num_units), torch.nn.ELU()]
+        num_inputs = num_units
+    modules.append(torch.nn.Linear(num_inputs, num_outputs))
+    return torch.nn.Sequential(*modules)
+
+
+def make_agent_state(device: str, num_observations: int = 22, num_actions: int = 8) -> dict:
+    """Checkpoint state of the PPO agent of the arm task (same modules and sizes as skrl's ``agent_*.pt``).
+
+    The Adam moments are populated by one optimizer step. The preprocessors are running standard scalers.
+    """
+    policy = make_mlp(num_observations, num_actions).to(device)
+    policy.log_std_parameter = torch.nn.Parameter(torch.zeros(num_actions, device=device))
+    value = make_mlp(num_observations, 1).to(device)
+    optimizer = torch.optim.Adam(list(policy.parameters()) + list(value.parameters()), lr=3e-5)
+    states = torch.randn(64, num_observations, device=device)
+    loss = policy(states).square().mean() + value(states).square().mean() + policy.log_std_parameter.sum()
+    loss.backward()
+    optimizer.step()
+    state_scaler = {
+        "running_mean": torch.zeros(num_observations, dtype=torch.float64, device=device),
+        "running_variance": torch.ones(num_observations, dtype=torch.float64, device=device),
+        "current_count": torch.ones(1, dtype=torch.float64, device=device),
+    }
+    value_scaler = {key: buffer[:1].clone() for key, buffer in state_scaler.items()}
+    return {
+        "policy": policy.state_dict(),
+        "value": value.state_dict(),
+        "optimizer": optimizer.state_dict(),
+        "state_preprocessor": state_scaler,
+        "value_preprocessor": value_scaler,
+    }
+
+
+def ppo_loss(policy, value, log_std, states, actions, old_log_prob, advantages, returns) -> torch.Tensor:
+    """Clipped PPO surrogate, value and entropy loss (as computed by skrl's PPO update of the agent config)."""
+    mean = policy(states)
+    log_prob = -0.5 * (((actions - mean) / log_std.exp()) ** 2 + 2.0 * log_std + math.log(2.0 * math.pi))
+    log_prob = log_prob.sum(dim=-1)
+    ratio = torch.exp(log_prob - old_log_prob)
+    surrogate = torch.min(advantages * ratio, advantages * torch.clip(ratio, 0.8, 1.2))
+    entropy = (0.5 + 0.5 * math.log(2.0 * math.pi) + log_std).sum()
+    value_loss = (returns - value(states).squeeze(-1)).square().mean()
+    return -surrogate.mean() + 1.5 * value_loss - 0.02 * entropy
+
+
+"""
+Stub vectorized environment and models (skrl interfaces).
+"""
+
+
+class ReachStubVecEnv:
+    """Point-mass reach task with the interface of skrl's environment wrappers.
+
+    The point moves with the (clipped) actions as velocity, integrated in ``substeps`` substeps (a stand-in for the
+    cost of the physics). The observations are its position and the offset to the target; the reward is the
+    negative distance. Episodes terminate when the target is reached and are truncated (time-out) after
+    ``episode_length`` steps; the environments reset automatically, as in Isaac Lab. Groups of environments can be
+    stepped on their own (:meth:`step_group`).
+    """
+
+    def __init__(self, num_envs: int, device: str, episode_length: int = 100, dt: float = 0.05, substeps: int = 1):
+        self.num_envs = num_envs
+        self.device = device
+        self.episode_length = episode_length
+        self.dt = dt
+        self.substeps = substeps
+        self.num_observations = 6
+        self.num_actions = 3
+        self.position = torch.zeros(num_envs, 3, device=device)
+        self.velocity = torch.zeros(num_envs, 3, device=device)
+        self.target = torch.zeros(num_envs, 3, device=device)
+        # note: staggered episodes, as after the first resets of a training
+        self.episode_step = torch.randint(0, episode_length, (num_envs,), device=device)
+
+    def _observations(self, env_ids: slice = slice(None)) -> torch.Tensor:
+        position = self.position[env_ids]
+        return torch.cat((position, self.target[env_ids] - position), dim=-1)
+
+    def _reset(self, env_ids: torch.Tensor):
+        self.position[env_ids] = torch.rand(len(env_ids), 3, device=self.device) - 0.5
+        self.velocity[env_ids] = 0.0
+        self.target[env_ids] = torch.rand(len(env_ids), 3, device=self.device) - 0.5
+        self.episode_step[env_ids] = 0
+
+    def reset(self) -> tuple[torch.Tensor, dict]:
+        self._reset(torch.arange(self.num_envs, device=self.device))
+        return self._observations(), {}
+
+    def step(self, actions: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, dict]:
+        return self.step_group(slice(None), actions)
+
+    def step_group(
+        self, env_ids: slice, actions: torch.Tensor
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, dict]:
+        position, velocity = self.position[env_ids], self.velocity[env_ids]
+        # first-order velocity tracking of the (clipped) actions
+        command = actions.clamp(-1.0, 1.0)
+        for _ in range(self.substeps):
+            velocity += (command - velocity) * (1.0 / self.substeps)
+            position += (self.dt / self.substeps) * velocity
+        episode_step = self.episode_step[env_ids]
+        episode_step += 1
+        distance = torch.linalg.norm(self.target[env_ids] - position, dim=-1)
+        rewards = -distance
+        terminated = distance < 0.05
+        truncated = (episode_step >= self.episode_length) & ~terminated
+        infos = {"log": {"distance": distance.mean()}}
+        done_ids = (terminated | truncated).nonzero(as_tuple=False).squeeze(-1)
+        if len(done_ids):
+            self._reset(done_ids + (env_ids.start or 0))
+        observations = self._observations(env_ids)
+        return observations, rewards.unsqueeze(-1), terminated.unsqueeze(-1), truncated.unsqueeze(-1), infos
+
+
+class SharedGaussianModel(torch.nn.Module):
+    """Shared policy (Gaussian) and value MLP with the ``act`` interface of skrl's models."""
+
+    def __init__(self, num_observations: int, num_actions: int, layers: list[int] = [64, 64]):
+        super().__init__()
+        self.net = make_mlp(num_observations, num_actions + 1, layers)
+        self.log_std = torch.nn.Parameter(torch.zeros(num_actions))
+        self._distribution = None
+
+    def act(self, inputs: dict, role: str = "") -> tuple[torch.Tensor, torch.Tensor | None, dict]:
+        output = self.net(inputs["states"])
+        if role == "value":
+            return output[:, -1:], None, {}
+        mean_actions = output[:, :-1]
+        self._distribution = torch.distributions.Normal(mean_actions, self.log_std.exp())
+        actions = inputs.get("taken_actions")
+        if actions is None:
+            actions = self._distribution.sample()
+        log_prob = self._distribution.log_prob(actions).sum(dim=-1, keepdim=True)
+        return actions, log_prob, {"mean_actions": mean_actions}
+
+    def get_entropy(self, role: str = "") -> torch.Tensor:
+        return self._distribution.entropy()
+
+    def distribution(self, role: str = "") -> torch.distributions.Normal:
+        return self._distribution
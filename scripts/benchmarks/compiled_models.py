@@ -0,0 +1,104 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to measure the speedup of compiling the policy/value networks (and the PPO loss) with ``torch.compile``.
+
+The networks have the sizes of the skrl agent config of the arm task. Two workloads are timed:
+
+* act: policy forward pass for all environments, without gradients (rollouts),
+* update: PPO loss on a mini-batch (policy and value forward), backward pass and Adam step.
+
+Every workload runs in eager mode, with compiled networks and (update only) with the compiled loss function.
+No simulator is needed, e.g.:
+
+    python scripts/benchmarks/compiled_models.py --device cpu --num_envs 2048
+"""
+
+import argparse
+import copy
+import torch
+
+from common import make_mlp, ppo_loss, time_per_call
+
+from arm.utils.compile_models import compile_method
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark torch.compile of the policy and value networks.")
+parser.add_argument("--device", type=str, default="cpu", help="Device of the networks.")
+parser.add_argument("--num_envs", type=int, default=2048, help="Number of environments (act batch size).")
+parser.add_argument("--rollouts", type=int, default=64, help="Rollout length.")
+parser.add_argument("--mini_batches", type=int, default=16, help="Number of mini-batches per epoch.")
+parser.add_argument("--num_calls", type=int, default=50, help="Number of timed calls.")
+parser.add_argument("--mode", type=str, default=None, help="Compilation mode of torch.compile.")
+parser.add_argument("--backend", type=str, default="inductor", help="Backend of torch.compile.")
+args_cli = parser.parse_args()
+
+NUM_OBSERVATIONS = 22
+NUM_ACTIONS = 8
+
+
+def main():
+    """Time the act and update workloads in eager and compiled mode."""
+    device = args_cli.device
+    batch_size = args_cli.rollouts * args_cli.num_envs // args_cli.mini_batches
+    compile_kwargs = dict(mode=args_cli.mode, backend=args_cli.backend)
+
+    policy = make_mlp(NUM_OBSERVATIONS, NUM_ACTIONS).to(device)
+    value = make_mlp(NUM_OBSERVATIONS, 1).to(device)
+    log_std = torch.nn.Parameter(torch.zeros(NUM_ACTIONS, device=device))
+    act_states = torch.randn(args_cli.num_envs, NUM_OBSERVATIONS, device=device)
+    batch = (
+        torch.randn(batch_size, NUM_OBSERVATIONS, device=device),
+        torch.randn(batch_size, NUM_ACTIONS, device=device),
+        torch.randn(batch_size, device=device),
+        torch.randn(batch_size, device=device),
+        torch.randn(batch_size, device=device),
+    )
+
+    def make_update(policy, value, log_std, loss_fn):
+        optimizer = torch.optim.Adam(list(policy.parameters()) + list(value.parameters()) + [log_std], lr=3e-5)
+
+        def update():
+            loss = loss_fn(policy, value, log_std, *batch)
+            optimizer.zero_grad()
+            loss.backward()
+            optimizer.step()
+
+        return update
+
+    results = {}
+    # -- eager
+    with torch.no_grad():
+        results["act", "eager"] = time_per_call(lambda: policy(act_states), args_cli.num_calls, device)
+    update = make_update(policy, value, log_std, ppo_loss)
+    results["update", "eager"] = time_per_call(update, args_cli.num_calls, device)
+
+    # -- compiled networks (copies, so that the eager networks stay eager)
+    compiled_policy, compiled_value = copy.deepcopy(policy), copy.deepcopy(value)
+    compiled = compile_method(compiled_policy, "forward", lambda: compiled_policy(act_states), **compile_kwargs)
+    compiled &= compile_method(compiled_value, "forward", lambda: compiled_value(batch[0]), **compile_kwargs)
+    if compiled:
+        with torch.no_grad():
+            results["act", "compiled"] = time_per_call(lambda: compiled_policy(act_states), args_cli.num_calls, device)
+        update = make_update(compiled_policy, compiled_value, log_std, ppo_loss)
+        results["update", "compiled"] = time_per_call(update, args_cli.num_calls, device)
+        # -- compiled loss (networks and loss in one graph)
+        try:
+            compiled_loss = torch.compile(ppo_loss, **compile_kwargs)
+            update = make_update(copy.deepcopy(policy), copy.deepcopy(value), log_std, compiled_loss)
+            results["update", "compiled loss"] = time_per_call(update, args_cli.num_calls, device)
+        except Exception as e:
+            print(f"[WARN] Compiling the loss failed: {e}")
+
+    print(f"Device: {device} | act batch: {args_cli.num_envs} | mini-batch: {batch_size} | mode: {args_cli.mode}")
+    print(f"{'workload':<10} {'variant':<14} {'time (ms)':>10} {'speedup':>8}")
+    for (workload, variant), elapsed in results.items():
+        speedup = results[workload, "eager"] / elapsed
+        print(f"{workload:<10} {variant:<14} {elapsed * 1e3:>10.3f} {speedup:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to check that the fused reach reward kernel matches the separate reward terms and to time both.
+
+The terms are evaluated on random tensors of a stub environment (no simulation is created), e.g.:
+
+    python scripts/benchmarks/fused_rewards.py --headless --device cpu --num_envs 4096
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Check and time the fused reach reward kernel.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of environments.")
+parser.add_argument("--num_steps", type=int, default=20, help="Number of random steps to compare.")
+parser.add_argument("--num_calls", type=int, default=200, help="Number of timed calls.")
+
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+
+from common import make_stub_env, step_stub_env, time_per_call
+
+from isaaclab.managers import RewardTermCfg, SceneEntityCfg
+
+import arm.tasks.manager_based.arm.mdp as mdp
+from arm.utils.reward_kernels import REACH_REWARD_KINDS, fused_reach_rewards
+
+# (name, kind, weight) of the fused terms, as in the reward config of the task
+TERMS = [
+    ("end_effector_position", "end_effector_distance", -0.1),
+    ("distance_guidance", "distance_guidance", 2.0),
+    ("approach_progress", "approach_progress", 1.0),
+    ("joint_velocity_reward", "joint_velocity", 0.1),
+    ("joint_vel", "joint_vel_l1", -0.00005),
+    ("joint_vel_smooth", "joint_vel_l1", -0.0001),
+]
+
+
+def main():
+    """Compare and time the separate and fused reward terms."""
+    device = args_cli.device if args_cli.device is not None else "cpu"
+    env = make_stub_env(args_cli.num_envs, device)
+    robot_cfg = SceneEntityCfg("robot")
+    target_cfg = SceneEntityCfg("target_marker")
+    l1_cfg = SceneEntityCfg("robot", joint_ids=list(range(8)))
+    guidance_cfg = RewardTermCfg(
+        func=mdp.distance_guidance_reward,
+        weight=1.0,
+        params={"asset_cfg": robot_cfg, "target_cfg": target_cfg, "body_name": "arm_end"},
+    )
+    distance_guidance = mdp.distance_guidance_reward(guidance_cfg, env)
+
+    def separate_terms() -> list[torch.Tensor]:
+        return [
+            mdp.end_effector_position_to_marker_l2(env, robot_cfg, target_cfg, "arm_end"),
+            distance_guidance(env, **guidance_cfg.params),
+            mdp.approach_progress_reward(env, robot_cfg, target_cfg, "arm_end"),
+            mdp.joint_velocity_reward(env, robot_cfg),
+            mdp.joint_vel_l1(env, l1_cfg),
+            mdp.joint_vel_l1(env, l1_cfg),
+        ]
+
+    term_kinds = torch.tensor([REACH_REWARD_KINDS.index(kind) for _, kind, _ in TERMS], device=device)
+    weights = torch.tensor([weight for _, _, weight in TERMS], device=device)
+    prev_distance = None
+
+    def fused_terms() -> tuple[torch.Tensor, torch.Tensor]:
+        distance = mdp.reach_kinematics(env, robot_cfg, target_cfg, "arm_end").distance
+        joint_vel = env.scene["robot"].data.joint_vel
+        return fused_reach_rewards(
+            distance,
+            distance if prev_distance is None else prev_distance,
+            joint_vel,
+            joint_vel[:, l1_cfg.joint_ids],
+            term_kinds,
+            weights,
+        )
+
+    # -- equivalence over random steps (the guidance term keeps the previous distance of every env)
+    max_error = torch.zeros(len(TERMS), device=device)
+    for _ in range(args_cli.num_steps):
+        step_stub_env(env)
+        expected = torch.stack(separate_terms(), dim=1) * weights
+        total, breakdown = fused_terms()
+        prev_distance = mdp.reach_kinematics(env, robot_cfg, target_cfg, "arm_end").distance.clone()
+        max_error = torch.maximum(max_error, torch.amax(torch.abs(breakdown - expected), dim=0))
+        torch.testing.assert_close(breakdown, expected, rtol=1e-5, atol=1e-6)
+        torch.testing.assert_close(total, expected.sum(dim=1), rtol=1e-5, atol=1e-5)
+
+    print(f"[INFO] Fused kernel matches the separate terms over {args_cli.num_steps} random steps.")
+    for (name, _, _), error in zip(TERMS, max_error.tolist()):
+        print(f"  - {name:<24} max abs error: {error:.3e}")
+
+    # -- timing
+    separate_time = time_per_call(separate_terms, args_cli.num_calls, device)
+    fused_time = time_per_call(fused_terms, args_cli.num_calls, device)
+    print(f"[INFO] num_envs: {args_cli.num_envs} | device: {device}")
+    print(f"[INFO] Separate terms: {1e6 * separate_time:.1f} us/step")
+    print(f"[INFO] Fused kernel:   {1e6 * fused_time:.1f} us/step ({separate_time / fused_time:.2f}x)")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,112 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to compare the GAE backends of :mod:`arm.utils.advantages` with the advantage loop of skrl's PPO.
+
+The rollout buffers have skrl's memory layout ``(rollouts, num_envs, 1)``. For every number of environments, the
+script checks that all backends (with truncations handled like terminations) match skrl's loop and times them,
+e.g.:
+
+    python scripts/benchmarks/gae.py --device cuda:0 --num_envs 2048 4096 8192 16384
+"""
+
+import argparse
+import torch
+
+from common import time_per_call
+
+from arm.utils.advantages import GAE_BACKENDS, compute_gae, normalize_advantages
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the GAE backends against skrl's advantage loop.")
+parser.add_argument("--device", type=str, default="cpu", help="Device of the rollout buffers.")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[2048, 4096, 8192, 16384], help="Numbers of envs.")
+parser.add_argument("--rollouts", type=int, default=64, help="Rollout length.")
+parser.add_argument("--episode_length", type=int, default=300, help="Mean episode length (in steps).")
+parser.add_argument("--num_calls", type=int, default=50, help="Number of timed calls.")
+args_cli = parser.parse_args()
+
+DISCOUNT_FACTOR = 0.99
+LAMBDA = 0.95
+
+
+def skrl_gae(rewards, dones, values, next_values, discount_factor=0.99, lambda_coefficient=0.95):
+    """The advantage computation of skrl's PPO (``PPO._update``, skrl 1.4)."""
+    advantage = 0
+    advantages = torch.zeros_like(rewards)
+    not_dones = dones.logical_not()
+    memory_size = rewards.shape[0]
+    last_values = next_values
+
+    # advantages computation
+    for i in reversed(range(memory_size)):
+        next_values = values[i + 1] if i < memory_size - 1 else last_values
+        advantage = (
+            rewards[i] - values[i] + discount_factor * not_dones[i] * (next_values + lambda_coefficient * advantage)
+        )
+        advantages[i] = advantage
+    # returns computation
+    returns = advantages + values
+    # normalize advantages
+    advantages = (advantages - advantages.mean()) / (advantages.std() + 1e-8)
+
+    return returns, advantages
+
+
+def make_rollout(num_envs: int) -> dict:
+    """Random rollout with terminations and time-outs."""
+    shape = (args_cli.rollouts, num_envs, 1)
+    device = args_cli.device
+    return {
+        "rewards": torch.randn(shape, device=device),
+        "values": torch.randn(shape, device=device),
+        "last_values": torch.randn(num_envs, 1, device=device),
+        "terminated": torch.rand(shape, device=device) < 0.5 / args_cli.episode_length,
+        "truncated": torch.rand(shape, device=device) < 0.5 / args_cli.episode_length,
+    }
+
+
+def main():
+    """Check and time the GAE backends."""
+    print(f"Device: {args_cli.device} | rollouts: {args_cli.rollouts}")
+    print(f"{'num_envs':>8} {'backend':<12} {'time (ms)':>10} {'speedup':>8} {'max error':>10}")
+    for num_envs in args_cli.num_envs:
+        rollout = make_rollout(num_envs)
+        dones = rollout["terminated"] | rollout["truncated"]
+
+        def run_skrl():
+            return skrl_gae(
+                rollout["rewards"], dones, rollout["values"], rollout["last_values"], DISCOUNT_FACTOR, LAMBDA
+            )
+
+        def make_run(backend: str, bootstrap_truncated: bool = False):
+            def run():
+                returns, advantages = compute_gae(
+                    **rollout,
+                    discount_factor=DISCOUNT_FACTOR,
+                    lambda_coefficient=LAMBDA,
+                    bootstrap_truncated=bootstrap_truncated,
+                    backend=backend,
+                )
+                return returns, normalize_advantages(advantages)
+
+            return run
+
+        reference = run_skrl()
+        baseline = time_per_call(run_skrl, args_cli.num_calls, args_cli.device)
+        print(f"{num_envs:>8} {'skrl':<12} {baseline * 1e3:>10.3f} {1.0:>8.2f} {0.0:>10.2e}")
+        runs = {backend: make_run(backend) for backend in GAE_BACKENDS}
+        runs["scan (boot)"] = make_run("scan", bootstrap_truncated=True)
+        for name, run in runs.items():
+            returns, advantages = run()
+            # note: with bootstrapping, the returns of the truncated episodes differ from skrl's by design
+            error = max((returns - reference[0]).abs().max().item(), (advantages - reference[1]).abs().max().item())
+            elapsed = time_per_call(run, args_cli.num_calls, args_cli.device)
+            print(f"{num_envs:>8} {name:<12} {elapsed * 1e3:>10.3f} {baseline / elapsed:>8.2f} {error:>10.2e}")
+
+
+if __name__ == "__main__":
+    main()
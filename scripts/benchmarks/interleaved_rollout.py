@@ -0,0 +1,114 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to measure the overlap of the policy inference and the environment steps of interleaved rollouts.
+
+The lean PPO learner collects rollouts on the stub reach environment (the substeps stand in for the cost of the
+physics) with the networks of the skrl agent config, once with all environments stepping together and once per
+number of groups. For every run it reports the rollout time per step (the updates are excluded) and the speedup,
+next to the times of the inference and of the step of all environments alone: the time per step of the interleaved
+rollouts approaches their maximum when the stages overlap.
+
+Before every update, the stored log-probabilities and values are compared with the ones of the stored states and
+actions under the (not yet updated) policy, to check that the interleaved storage is consistent, e.g.:
+
+    python scripts/benchmarks/interleaved_rollout.py --device cuda:0 --num_envs 4096 --groups 1 2 4
+"""
+
+import argparse
+import time
+import torch
+
+from common import POLICY_LAYERS, ReachStubVecEnv, SharedGaussianModel, synchronize, time_per_call
+
+from arm.utils.lean_ppo import LeanPPO
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Measure the overlap of interleaved rollouts on the stub environment.")
+parser.add_argument("--device", type=str, default="cpu", help="Device of the environment and the model.")
+parser.add_argument("--num_envs", type=int, default=2048, help="Number of environments.")
+parser.add_argument("--groups", type=int, nargs="+", default=[1, 2], help="Numbers of groups (1: not interleaved).")
+parser.add_argument("--substeps", type=int, default=40, help="Substeps of the stub environment (physics cost).")
+parser.add_argument("--rollouts", type=int, default=16, help="Rollout length.")
+parser.add_argument("--updates", type=int, default=4, help="Number of updates.")
+parser.add_argument("--seed", type=int, default=42, help="Seed.")
+args_cli = parser.parse_args()
+
+
+def make_learner(env: ReachStubVecEnv) -> LeanPPO:
+    model = SharedGaussianModel(env.num_observations, env.num_actions, POLICY_LAYERS).to(args_cli.device)
+    return LeanPPO(
+        model,
+        model,
+        torch.optim.Adam(model.parameters(), lr=1e-4),
+        num_envs=env.num_envs,
+        num_observations=env.num_observations,
+        num_actions=env.num_actions,
+        device=args_cli.device,
+        rollouts=args_cli.rollouts,
+        learning_epochs=1,
+        mini_batches=4,
+    )
+
+
+def run(num_groups: int) -> tuple[float, float]:
+    """Collect the rollouts and return the rollout time per step and the largest storage inconsistency."""
+    torch.manual_seed(args_cli.seed)
+    device = args_cli.device
+    env = ReachStubVecEnv(args_cli.num_envs, device, substeps=args_cli.substeps)
+    learner = make_learner(env)
+    update_times = []
+    errors = []
+    update = learner.update
+
+    def checked_update(next_states):
+        synchronize(device)
+        start = time.perf_counter()
+        buffer = learner.buffer
+        states = buffer["states"].reshape(-1, env.num_observations)
+        with torch.no_grad():
+            _, log_prob, _ = learner.policy.act(
+                {"states": states, "taken_actions": buffer["actions"].reshape(-1, env.num_actions)}, role="policy"
+            )
+            values, _, _ = learner.value.act({"states": states}, role="value")
+        errors.append((log_prob - buffer["log_prob"].reshape(-1, 1)).abs().max().item())
+        errors.append((values - buffer["values"].reshape(-1, 1)).abs().max().item())
+        update(next_states)
+        synchronize(device)
+        update_times.append(time.perf_counter() - start)
+
+    learner.update = checked_update
+    synchronize(device)
+    start = time.perf_counter()
+    learner.train(env, args_cli.rollouts * args_cli.updates, num_groups=num_groups)
+    synchronize(device)
+    elapsed = time.perf_counter() - start - sum(update_times)
+    return elapsed / (args_cli.rollouts * args_cli.updates), max(errors)
+
+
+def main():
+    """Time the stages alone and the rollouts per number of groups."""
+    device = args_cli.device
+    torch.manual_seed(args_cli.seed)
+    env = ReachStubVecEnv(args_cli.num_envs, device, substeps=args_cli.substeps)
+    learner = make_learner(env)
+    states = env.reset()[0]
+    actions = torch.zeros(env.num_envs, env.num_actions, device=device)
+    inference = time_per_call(lambda: learner._act(states), 20, device)
+    step = time_per_call(lambda: env.step(actions), 20, device)
+
+    print(f"Device: {device} | num_envs: {args_cli.num_envs} | substeps: {args_cli.substeps}")
+    print(f"Inference (all envs): {inference * 1e3:.3f} ms | step (all envs): {step * 1e3:.3f} ms")
+    print(f"{'groups':>6} {'step (ms)':>10} {'speedup':>8} {'max storage error':>18}")
+    baseline = None
+    for num_groups in args_cli.groups:
+        elapsed, error = run(num_groups)
+        baseline = baseline or elapsed
+        print(f"{num_groups:>6} {elapsed * 1e3:>10.3f} {baseline / elapsed:>8.2f} {error:>18.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to measure the throughput of the kinematic surrogate of the reach task (``Template-Arm-Kinematic-v0``).
+
+For every number of environments, it reports the environment steps per second of the full steps (random actions),
+of the same steps taken group by group (:meth:`step_group`) and of the forward kinematics alone. At the end, the
+episodic reward terms logged by the environment are printed (e.g. to prototype reward weights), e.g.:
+
+    python scripts/benchmarks/kinematic_env.py --device cpu --num_envs 1024 4096 16384
+"""
+
+import argparse
+import torch
+
+from common import time_per_call
+
+from arm.tasks.kinematic.arm.kinematic_env import KinematicArmEnv
+from arm.tasks.kinematic.arm.kinematic_env_cfg import KinematicArmEnvCfg
+from arm.utils.interleaved import split_groups
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Measure the throughput of the kinematic surrogate environment.")
+parser.add_argument("--device", type=str, default="cpu", help="Device of the environment.")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[1024, 4096, 16384], help="Numbers of environments.")
+parser.add_argument("--groups", type=int, default=4, help="Number of groups of the grouped steps.")
+parser.add_argument("--iterations", type=int, default=100, help="Timed steps per measurement.")
+parser.add_argument("--chain", type=str, default=None, help="Kinematic chain (the asset or its JSON export).")
+parser.add_argument("--seed", type=int, default=42, help="Seed.")
+args_cli = parser.parse_args()
+
+
+def main():
+    """Time the steps per number of environments and print the logged reward terms."""
+    device = args_cli.device
+    torch.manual_seed(args_cli.seed)
+    print(f"Device: {device} | threads: {torch.get_num_threads()} | chain: {args_cli.chain or 'nominal'}")
+    print(f"{'num_envs':>9} {'steps/s':>12} {f'grouped ({args_cli.groups})':>13} {'FK (steps/s)':>13}")
+    for num_envs in args_cli.num_envs:
+        env = KinematicArmEnv(KinematicArmEnvCfg(num_envs=num_envs, device=device, chain_path=args_cli.chain))
+        env.reset()
+        actions = torch.empty(num_envs, env.cfg.action_space, device=device)
+
+        def step():
+            env.step(actions.uniform_(-1.0, 1.0))
+
+        groups = split_groups(num_envs, args_cli.groups)
+
+        def step_groups():
+            actions.uniform_(-1.0, 1.0)
+            for env_ids in groups:
+                env.step_group(env_ids, actions[env_ids])
+
+        step_time = time_per_call(step, args_cli.iterations, device)
+        grouped_time = time_per_call(step_groups, args_cli.iterations, device)
+        fk = env.kinematics.end_effector_positions
+        fk_time = time_per_call(lambda: fk(env.joint_pos), args_cli.iterations, device)
+        print(
+            f"{num_envs:>9} {num_envs / step_time:>12.0f} {num_envs / grouped_time:>13.0f} {num_envs / fk_time:>13.0f}"
+        )
+
+    # episodic reward terms of the last run (random actions)
+    for _ in range(env.max_episode_length):
+        env.step(actions.uniform_(-1.0, 1.0))
+        if "log" in env.extras:
+            log = env.extras["log"]
+    print("Episodic reward terms (random actions, per second of episode):")
+    for name, value in log.items():
+        print(f"  {name:<40} {value.item():>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
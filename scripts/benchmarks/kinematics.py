@@ -0,0 +1,117 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to measure the batched kinematics of the arm (:mod:`arm.utils.kinematics`) and to solve IK datasets.
+
+For every batch size, it reports the time of the forward kinematics, of the Jacobians and of the damped
+least-squares IK of targets sampled in the target range of the reach task (from random initial joint positions),
+with the fraction of solved targets and the error percentiles. The Jacobians are checked against finite
+differences of the forward kinematics.
+
+The IK solutions of the largest batch can be saved as a dataset (targets, initial and solved joint positions, errors,
+solved mask and the chain), e.g. to validate targets or to seed demonstrations:
+
+    python scripts/benchmarks/kinematics.py --num_targets 1024 16384 65536 --output logs/ik_dataset.pt
+"""
+
+import argparse
+import os
+import torch
+
+from common import time_per_call
+
+from arm.utils.kinematics import NOMINAL_ARM_CHAIN, ArmKinematics, KinematicChain
+
+# default target position and offset range of the reach task (w.r.t. the robot root)
+TARGET_INIT_POS = (0.0, 0.0, 0.2)
+TARGET_POS_RANGE = ((-0.3, 0.3), (-0.3, 0.3), (0.1, 0.3))
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Measure the batched kinematics of the arm and solve IK datasets.")
+parser.add_argument("--device", type=str, default="cpu", help="Device of the tensors.")
+parser.add_argument("--num_targets", type=int, nargs="+", default=[1024, 4096, 16384], help="Batch sizes.")
+parser.add_argument("--chain", type=str, default=None, help="Kinematic chain (the asset or its JSON export).")
+parser.add_argument("--damping", type=float, default=0.05, help="Damping of the least squares.")
+parser.add_argument("--max_iterations", type=int, default=100, help="Maximum number of IK iterations.")
+parser.add_argument("--tolerance", type=float, default=1e-3, help="Position tolerance of the IK (in m).")
+parser.add_argument("--iterations", type=int, default=20, help="Timed calls per measurement.")
+parser.add_argument("--output", type=str, default=None, help="Path of the IK dataset of the largest batch.")
+parser.add_argument("--seed", type=int, default=42, help="Seed.")
+args_cli = parser.parse_args()
+
+
+def sample_targets(num_targets: int, device: str) -> torch.Tensor:
+    """Sample targets uniformly in the target range of the reach task."""
+    lower = torch.tensor([low for low, _ in TARGET_POS_RANGE], device=device)
+    span = torch.tensor([high - low for low, high in TARGET_POS_RANGE], device=device)
+    return torch.rand(num_targets, 3, device=device) * span + lower + torch.tensor(TARGET_INIT_POS, device=device)
+
+
+def jacobian_error(kinematics: ArmKinematics, joint_pos: torch.Tensor, epsilon: float = 1e-3) -> float:
+    """Largest difference of the linear Jacobian rows to central finite differences of the forward kinematics."""
+    jacobian, _ = kinematics.jacobian(joint_pos)
+    error = 0.0
+    for j in range(kinematics.num_joints):
+        offset = torch.zeros_like(joint_pos)
+        offset[:, j] = epsilon
+        upper = kinematics.end_effector_positions(joint_pos + offset)
+        lower = kinematics.end_effector_positions(joint_pos - offset)
+        column = (upper - lower) / (2 * epsilon)
+        error = max(error, (column - jacobian[:, :3, j]).abs().max().item())
+    return error
+
+
+def main():
+    """Time the kinematics per batch size and save the IK dataset of the largest batch."""
+    device = args_cli.device
+    torch.manual_seed(args_cli.seed)
+    chain = NOMINAL_ARM_CHAIN if args_cli.chain is None else KinematicChain.load(args_cli.chain)
+    kinematics = ArmKinematics(chain, device)
+    print(f"Device: {device} | threads: {torch.get_num_threads()} | chain: {chain.source} ({chain.num_joints} joints)")
+    joint_pos = torch.empty(256, chain.num_joints, device=device).uniform_(-torch.pi, torch.pi)
+    print(f"Jacobian vs finite differences (max error): {jacobian_error(kinematics, joint_pos):.2e}")
+
+    print(f"{'N':>7} {'FK (ms)':>9} {'Jacobian (ms)':>14} {'IK (ms)':>9} {'solved':>7} {'p50 (mm)':>9} {'p99 (mm)':>9}")
+    for num_targets in args_cli.num_targets:
+        targets = sample_targets(num_targets, device)
+        initial = torch.empty(num_targets, chain.num_joints, device=device).uniform_(-0.5, 0.5)
+        fk_time = time_per_call(lambda: kinematics.forward_kinematics(initial), args_cli.iterations, device)
+        jacobian_time = time_per_call(lambda: kinematics.jacobian(initial), args_cli.iterations, device)
+
+        def solve():
+            return kinematics.inverse_kinematics(
+                targets,
+                initial,
+                damping=args_cli.damping,
+                max_iterations=args_cli.max_iterations,
+                tolerance=args_cli.tolerance,
+            )
+
+        ik_time = time_per_call(solve, max(1, args_cli.iterations // 10), device, warmup=1)
+        solution, error = solve()
+        solved = error <= args_cli.tolerance
+        p50, p99 = torch.quantile(error, torch.tensor([0.5, 0.99], device=device)).mul(1e3).tolist()
+        print(
+            f"{num_targets:>7} {fk_time * 1e3:>9.3f} {jacobian_time * 1e3:>14.3f} {ik_time * 1e3:>9.2f}"
+            f" {solved.float().mean().item():>7.3f} {p50:>9.3f} {p99:>9.3f}"
+        )
+
+    if args_cli.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args_cli.output)), exist_ok=True)
+        dataset = {
+            "chain": chain.to_dict(),
+            "targets": targets.cpu(),
+            "initial_joint_pos": initial.cpu(),
+            "joint_pos": solution.cpu(),
+            "error": error.cpu(),
+            "solved": solved.cpu(),
+        }
+        torch.save(dataset, args_cli.output)
+        print(f"Saved the IK dataset ({num_targets} targets) to: {args_cli.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to run the lean PPO learner (:mod:`arm.utils.lean_ppo`) on the stub reach environment, without a simulator.
+
+It trains a shared Gaussian model on CPU (or any device) and reports, per update, the mean distance to the target
+and the times of the rollout and of the update. At the end, the checkpoint of the learner (skrl's format) is saved
+and loaded into a new model, whose actions must match, e.g.:
+
+    python scripts/benchmarks/lean_ppo.py --device cpu --num_envs 1024 --updates 30
+"""
+
+import argparse
+import io
+import time
+import torch
+
+from common import ReachStubVecEnv, SharedGaussianModel, synchronize
+
+from arm.utils.lean_ppo import LeanPPO
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Run the lean PPO learner on the stub reach environment.")
+parser.add_argument("--device", type=str, default="cpu", help="Device of the environment and the model.")
+parser.add_argument("--num_envs", type=int, default=1024, help="Number of environments.")
+parser.add_argument("--rollouts", type=int, default=32, help="Rollout length.")
+parser.add_argument("--updates", type=int, default=30, help="Number of updates.")
+parser.add_argument("--mini_batches", type=int, default=4, help="Number of mini-batches per epoch.")
+parser.add_argument("--gae", type=str, default="scan", help="GAE backend.")
+parser.add_argument("--no_shuffle", action="store_true", default=False, help="Sample consecutive mini-batches.")
+parser.add_argument("--seed", type=int, default=42, help="Seed.")
+args_cli = parser.parse_args()
+
+
+def main():
+    """Train on the stub environment and check the checkpoint round trip."""
+    torch.manual_seed(args_cli.seed)
+    device = args_cli.device
+    env = ReachStubVecEnv(args_cli.num_envs, device)
+    model = SharedGaussianModel(env.num_observations, env.num_actions).to(device)
+    learner = LeanPPO(
+        model,
+        model,
+        torch.optim.Adam(model.parameters(), lr=1e-3),
+        num_envs=env.num_envs,
+        num_observations=env.num_observations,
+        num_actions=env.num_actions,
+        device=device,
+        rollouts=args_cli.rollouts,
+        mini_batches=args_cli.mini_batches,
+        entropy_loss_scale=0.001,
+        gae_backend=args_cli.gae,
+        shuffle=not args_cli.no_shuffle,
+    )
+
+    # time the rollouts and the updates
+    times = {"update": []}
+    update = learner.update
+
+    def timed_update(next_states):
+        synchronize(device)
+        start = time.perf_counter()
+        update(next_states)
+        synchronize(device)
+        times["update"].append(time.perf_counter() - start)
+
+    learner.update = timed_update
+    synchronize(device)
+    start = time.perf_counter()
+    learner.train(env, args_cli.rollouts * args_cli.updates)
+    synchronize(device)
+    elapsed = time.perf_counter() - start
+
+    distances = learner.tracking_data["Info / distance"]
+    print(f"Device: {device} | num_envs: {env.num_envs} | rollouts: {args_cli.rollouts} | GAE: {args_cli.gae}")
+    print(f"{'update':>6} {'distance':>9} {'policy loss':>12} {'value loss':>11} {'update (ms)':>12}")
+    for i in range(args_cli.updates):
+        distance = sum(distances[i * args_cli.rollouts : (i + 1) * args_cli.rollouts]) / args_cli.rollouts
+        policy_loss = learner.tracking_data["Loss / Policy loss"][i]
+        value_loss = learner.tracking_data["Loss / Value loss"][i]
+        print(f"{i:>6} {distance:>9.4f} {policy_loss:>12.4f} {value_loss:>11.4f} {times['update'][i] * 1e3:>12.2f}")
+    update_time = sum(times["update"])
+    samples = args_cli.rollouts * args_cli.updates * env.num_envs
+    print(
+        f"Total: {elapsed:.2f} s ({samples / elapsed:.0f} samples/sec) | rollouts: {elapsed - update_time:.2f} s |"
+        f" updates: {update_time:.2f} s"
+    )
+
+    # checkpoint round trip (skrl's format: state dicts by module name)
+    buffer = io.BytesIO()
+    torch.save(learner.state_dict(), buffer)
+    buffer.seek(0)
+    checkpoint = torch.load(buffer, map_location=device)
+    restored = SharedGaussianModel(env.num_observations, env.num_actions).to(device)
+    restored.load_state_dict(checkpoint["policy"])
+    states = env.reset()[0]
+    with torch.no_grad():
+        actions = model.act({"states": states})[2]["mean_actions"]
+        difference = actions - restored.act({"states": states})[2]["mean_actions"]
+    print(f"Checkpoint modules: {list(checkpoint)} | max action difference: {difference.abs().max().item():.2e}")
+
+
+if __name__ == "__main__":
+    main()
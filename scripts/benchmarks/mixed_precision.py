@@ -0,0 +1,127 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to check the mixed-precision PPO update and the bfloat16 rollout storage against the float32 baseline.
+
+It reports:
+
+* the size of the rollout memory of the PPO agent (tensors and shapes as created by skrl's PPO) in float32 and with
+  the observations in bfloat16,
+* the loss curves of PPO updates on the same (seeded) synthetic rollout data in float32 and in mixed precision
+  (bfloat16 autocast, observations stored in bfloat16), and their largest relative deviation.
+
+No simulator is needed, e.g.:
+
+    python scripts/benchmarks/mixed_precision.py --device cpu --num_envs 2048
+"""
+
+import argparse
+import torch
+
+from common import make_mlp, ppo_loss
+
+from arm.utils.mixed_precision import REDUCED_PRECISION_TENSORS
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Check the mixed-precision PPO update and bfloat16 rollout storage.")
+parser.add_argument("--device", type=str, default="cpu", help="Device of the networks.")
+parser.add_argument("--num_envs", type=int, default=2048, help="Number of environments.")
+parser.add_argument("--rollouts", type=int, default=64, help="Rollout length.")
+parser.add_argument("--mini_batches", type=int, default=16, help="Number of mini-batches per epoch.")
+parser.add_argument("--epochs", type=int, default=5, help="Number of learning epochs.")
+parser.add_argument("--dtype", type=str, default="bfloat16", help="Autocast dtype.")
+parser.add_argument("--seed", type=int, default=42, help="Seed of the data and the networks.")
+args_cli = parser.parse_args()
+
+NUM_OBSERVATIONS = 22
+NUM_ACTIONS = 8
+
+# tensors of skrl's PPO memory: name -> (size, dtype)
+PPO_MEMORY_TENSORS = {
+    "states": (NUM_OBSERVATIONS, torch.float32),
+    "actions": (NUM_ACTIONS, torch.float32),
+    "rewards": (1, torch.float32),
+    "terminated": (1, torch.bool),
+    "truncated": (1, torch.bool),
+    "log_prob": (1, torch.float32),
+    "values": (1, torch.float32),
+    "returns": (1, torch.float32),
+    "advantages": (1, torch.float32),
+}
+
+
+def memory_mb(reduced_dtype: torch.dtype | None) -> float:
+    """Size of the rollout memory (in MB), optionally with the reduced precision tensors."""
+    total = 0
+    for name, (size, dtype) in PPO_MEMORY_TENSORS.items():
+        if reduced_dtype is not None and name in REDUCED_PRECISION_TENSORS:
+            dtype = reduced_dtype
+        total += args_cli.rollouts * args_cli.num_envs * size * torch.empty((), dtype=dtype).element_size()
+    return total / 2**20
+
+
+def train(mixed_precision: bool) -> list[float]:
+    """Run the PPO updates of one rollout and return the loss of every mini-batch."""
+    device = args_cli.device
+    dtype = getattr(torch, args_cli.dtype)
+    generator = torch.Generator(device=device).manual_seed(args_cli.seed)
+    torch.manual_seed(args_cli.seed)
+    policy = make_mlp(NUM_OBSERVATIONS, NUM_ACTIONS).to(device)
+    value = make_mlp(NUM_OBSERVATIONS, 1).to(device)
+    log_std = torch.nn.Parameter(torch.zeros(NUM_ACTIONS, device=device))
+    optimizer = torch.optim.Adam(list(policy.parameters()) + list(value.parameters()) + [log_std], lr=3e-4)
+    scaler = torch.amp.GradScaler(device, enabled=mixed_precision and dtype == torch.float16)
+
+    # synthetic rollout data (observations in the ranges of joint positions/velocities and positions)
+    num_samples = args_cli.rollouts * args_cli.num_envs
+    states = torch.randn(num_samples, NUM_OBSERVATIONS, device=device, generator=generator) * 3.0
+    if mixed_precision:
+        # stored in reduced precision, sampled as float32
+        states = states.to(dtype).float()
+    actions = torch.randn(num_samples, NUM_ACTIONS, device=device, generator=generator)
+    old_log_prob = torch.randn(num_samples, device=device, generator=generator) - 10.0
+    advantages = torch.randn(num_samples, device=device, generator=generator)
+    returns = torch.randn(num_samples, device=device, generator=generator)
+
+    losses = []
+    batch_size = num_samples // args_cli.mini_batches
+    for _ in range(args_cli.epochs):
+        permutation = torch.randperm(num_samples, device=device, generator=generator)
+        for start in range(0, num_samples - batch_size + 1, batch_size):
+            index = permutation[start : start + batch_size]
+            batch = (states[index], actions[index], old_log_prob[index], advantages[index], returns[index])
+            with torch.autocast(device_type=torch.device(device).type, dtype=dtype, enabled=mixed_precision):
+                loss = ppo_loss(policy, value, log_std, *batch)
+            optimizer.zero_grad()
+            scaler.scale(loss).backward()
+            scaler.unscale_(optimizer)
+            torch.nn.utils.clip_grad_norm_(list(policy.parameters()) + list(value.parameters()), 1.0)
+            scaler.step(optimizer)
+            scaler.update()
+            losses.append(loss.item())
+    return losses
+
+
+def main():
+    """Compare the memory and the loss curves of float32 and mixed precision."""
+    reduced_dtype = getattr(torch, args_cli.dtype)
+    fp32_mb, reduced_mb = memory_mb(None), memory_mb(reduced_dtype)
+    print(f"Rollout memory ({args_cli.rollouts} x {args_cli.num_envs}):")
+    print(f"  float32: {fp32_mb:.1f} MB | {args_cli.dtype} {REDUCED_PRECISION_TENSORS}: {reduced_mb:.1f} MB")
+    print(f"  saved: {fp32_mb - reduced_mb:.1f} MB ({100.0 * (1.0 - reduced_mb / fp32_mb):.0f}%)")
+
+    fp32_losses = train(mixed_precision=False)
+    mixed_losses = train(mixed_precision=True)
+    deviations = [abs(m - f) / max(abs(f), 1e-8) for f, m in zip(fp32_losses, mixed_losses)]
+    print(f"Loss curves over {len(fp32_losses)} mini-batches (float32 vs mixed {args_cli.dtype}):")
+    step = max(len(fp32_losses) // 10, 1)
+    for i in range(0, len(fp32_losses), step):
+        print(f"  {i:>4}: {fp32_losses[i]:>12.5f} {mixed_losses[i]:>12.5f}")
+    print(f"  max relative deviation: {max(deviations):.2e} | final: {deviations[-1]:.2e}")
+
+
+if __name__ == "__main__":
+    main()
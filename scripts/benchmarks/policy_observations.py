@@ -0,0 +1,94 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to check that the fused policy observation term matches the separate terms and to report the allocations
+and time per step of both.
+
+The terms are evaluated on random tensors of a stub environment (no simulation is created), e.g.:
+
+    python scripts/benchmarks/policy_observations.py --headless --device cuda:0 --num_envs 4096
+
+The separate terms are concatenated as done by the observation manager. With ``concatenate_terms=True``, the
+manager also copies the output of the fused term once, which is not included here.
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Check and benchmark the fused policy observation term.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of environments.")
+parser.add_argument("--num_steps", type=int, default=20, help="Number of random steps to compare.")
+parser.add_argument("--num_calls", type=int, default=200, help="Number of timed calls.")
+
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+
+from common import allocations_per_call, make_stub_env, step_stub_env, time_per_call
+
+from isaaclab.managers import ObservationTermCfg, SceneEntityCfg
+
+import arm.tasks.manager_based.arm.mdp as mdp
+
+
+def main():
+    """Compare the separate and fused policy observation terms."""
+    device = args_cli.device if args_cli.device is not None else "cpu"
+    env = make_stub_env(args_cli.num_envs, device)
+    robot_cfg = SceneEntityCfg("robot")
+    ee_cfg = SceneEntityCfg("robot", body_names=["arm_end"])
+    target_cfg = SceneEntityCfg("target_marker")
+
+    body_pos_cfg = ObservationTermCfg(func=mdp.body_pos_w, params={"asset_cfg": ee_cfg})
+    body_pos = mdp.body_pos_w(body_pos_cfg, env)
+    fused_cfg = ObservationTermCfg(func=mdp.policy_observations, params={"asset_cfg": ee_cfg, "target_cfg": target_cfg})
+    fused = mdp.policy_observations(fused_cfg, env)
+
+    def separate_terms() -> torch.Tensor:
+        return torch.cat(
+            [
+                mdp.joint_pos_rel(env, robot_cfg),
+                mdp.joint_vel_rel(env, robot_cfg),
+                body_pos(env, ee_cfg),
+                mdp.root_pos_w(env, target_cfg),
+            ],
+            dim=-1,
+        )
+
+    def fused_term() -> torch.Tensor:
+        return fused(env, ee_cfg, target_cfg)
+
+    # -- equivalence over random steps
+    for _ in range(args_cli.num_steps):
+        step_stub_env(env)
+        torch.testing.assert_close(fused_term(), separate_terms(), rtol=0.0, atol=0.0)
+    print(f"[INFO] Fused term matches the separate terms over {args_cli.num_steps} random steps.")
+
+    # -- allocations and timing
+    print(f"[INFO] num_envs: {args_cli.num_envs} | device: {device} | observation dim: {fused_term().shape[1]}")
+    for name, fn in (("Separate terms", separate_terms), ("Fused term", fused_term)):
+        allocations = allocations_per_call(fn, args_cli.num_calls, device)
+        step_time = time_per_call(fn, args_cli.num_calls, device)
+        print(f"  - {name:<15} allocations per step: {allocations:5.2f} | time per step: {1e6 * step_time:.1f} us")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
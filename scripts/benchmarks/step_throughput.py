@@ -0,0 +1,89 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to measure the stepping throughput (steps/sec) of an environment with random actions.
+
+Run it on two revisions (e.g. before and after a change to the MDP terms) with the same arguments to get a
+before/after comparison, e.g.:
+
+    python scripts/benchmarks/step_throughput.py --task Template-Arm-v0 --num_envs 2048 --headless
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Measure the stepping throughput of an environment.")
+parser.add_argument("--num_envs", type=int, default=None, help="Number of environments to simulate.")
+parser.add_argument("--task", type=str, default="Template-Arm-v0", help="Name of the task.")
+parser.add_argument("--warmup_steps", type=int, default=50, help="Number of steps to run before timing.")
+parser.add_argument("--steps", type=int, default=500, help="Number of timed steps.")
+parser.add_argument(
+    "--disable_fabric", action="store_true", default=False, help="Disable fabric and use USD I/O operations."
+)
+
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import gymnasium as gym
+import time
+import torch
+
+import isaaclab_tasks  # noqa: F401
+from isaaclab_tasks.utils import parse_env_cfg
+
+import arm.tasks  # noqa: F401
+
+
+def main():
+    """Step the environment with random actions and report the throughput."""
+    env_cfg = parse_env_cfg(
+        args_cli.task, device=args_cli.device, num_envs=args_cli.num_envs, use_fabric=not args_cli.disable_fabric
+    )
+    env = gym.make(args_cli.task, cfg=env_cfg)
+    num_envs = env.unwrapped.num_envs
+    device = env.unwrapped.device
+    action_shape = env.action_space.shape
+
+    env.reset()
+
+    def _run(num_steps: int) -> float:
+        start_time = time.perf_counter()
+        with torch.inference_mode():
+            for _ in range(num_steps):
+                actions = 2 * torch.rand(action_shape, device=device) - 1
+                env.step(actions)
+        if torch.device(device).type == "cuda":
+            torch.cuda.synchronize(device)
+        return time.perf_counter() - start_time
+
+    _run(args_cli.warmup_steps)
+    elapsed = _run(args_cli.steps)
+
+    print(f"[INFO] Task: {args_cli.task} | num_envs: {num_envs} | device: {device}")
+    print(f"[INFO] Steps/sec:     {args_cli.steps / elapsed:.2f}")
+    print(f"[INFO] Env-steps/sec: {args_cli.steps * num_envs / elapsed:.2f}")
+    print(f"[INFO] Step time:     {1000.0 * elapsed / args_cli.steps:.3f} ms")
+
+    # close the environment
+    env.close()
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
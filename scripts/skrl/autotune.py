@@ -0,0 +1,302 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Autotuning of the number of environments, the rollout length and the number of mini-batches for ``train.py``.
+
+With ``--autotune``, ``train.py`` does not train. Instead, it runs one worker process per number of environments
+(a process can only create one simulation). A worker creates the environment once and, for every combination of
+rollout length and mini-batches, creates the skrl runner and trains for a few updates. The samples/sec are
+measured over the updates after the first one (warm-up); the peak device memory over the whole trial.
+
+The fastest combination whose peak memory fits the budget is written as an overlay file (``autotune.yaml``) next to
+the results (``results.csv`` and ``results.md``), e.g.:
+
+    python scripts/skrl/train.py --task Template-Arm-v0 --headless --autotune --autotune_num_envs 2048 4096 8192
+
+The overlay is applied to the task and agent configs with ``--overlay``:
+
+    python scripts/skrl/train.py --task Template-Arm-v0 --headless --overlay logs/skrl/arm/autotune/.../autotune.yaml
+"""
+
+import argparse
+import copy
+import csv
+import gc
+import itertools
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import yaml
+
+FIELDS = [
+    "num_envs",
+    "rollouts",
+    "mini_batches",
+    "status",
+    "samples_per_s",
+    "iteration_s",
+    "peak_device_mb",
+    "device_total_mb",
+    "peak_host_mb",
+    "fits_budget",
+]
+
+
+def add_autotune_args(parser: argparse.ArgumentParser):
+    """Add the autotuning arguments to the parser of ``train.py``."""
+    group = parser.add_argument_group("autotune", description="Arguments of the autotuning mode.")
+    group.add_argument(
+        "--autotune", action="store_true", default=False, help="Autotune num_envs, rollouts and mini_batches."
+    )
+    group.add_argument(
+        "--autotune_num_envs", type=int, nargs="+", default=[1024, 2048, 4096, 8192], help="Numbers of envs."
+    )
+    group.add_argument("--autotune_rollouts", type=int, nargs="+", default=[16, 32, 64], help="Rollout lengths.")
+    group.add_argument("--autotune_mini_batches", type=int, nargs="+", default=[4, 8, 16], help="Mini-batches.")
+    group.add_argument(
+        "--autotune_updates", type=int, default=3, help="Number of timed updates per trial (after one warm-up)."
+    )
+    group.add_argument(
+        "--autotune_memory_gb",
+        type=float,
+        default=None,
+        help="Device memory budget (in GB). Defaults to 90%% of the device memory.",
+    )
+    group.add_argument("--autotune_output", type=str, default=None, help="Output directory of the results.")
+    group.add_argument("--autotune_timeout", type=float, default=3600.0, help="Timeout of a worker (in s).")
+    # internal: run the trials of a single number of envs and write the results to the given file
+    group.add_argument("--autotune_worker", type=str, default=None, help=argparse.SUPPRESS)
+    group.add_argument("--overlay", type=str, default=None, help="Apply an autotune overlay (YAML) to the configs.")
+
+
+"""
+Overlay.
+"""
+
+
+def apply_overlay(path: str, env_cfg, agent_cfg: dict):
+    """Apply an overlay file to the task config (attributes) and the agent config (nested dict) in place."""
+    with open(path) as f:
+        overlay = yaml.safe_load(f) or {}
+
+    def apply_env(cfg, values: dict, prefix: str):
+        for key, value in values.items():
+            if not hasattr(cfg, key):
+                raise KeyError(f"The task config has no attribute '{prefix}{key}' (overlay: {path}).")
+            if isinstance(value, dict):
+                apply_env(getattr(cfg, key), value, f"{prefix}{key}.")
+            else:
+                setattr(cfg, key, value)
+
+    def apply_agent(cfg: dict, values: dict):
+        for key, value in values.items():
+            if isinstance(value, dict) and isinstance(cfg.get(key), dict):
+                apply_agent(cfg[key], value)
+            else:
+                cfg[key] = value
+
+    apply_env(env_cfg, overlay.get("env", {}), "")
+    apply_agent(agent_cfg, overlay.get("agent", {}))
+    return overlay
+
+
+def _write_overlay(path: str, best: dict, args_cli):
+    overlay = {
+        "env": {"scene": {"num_envs": best["num_envs"]}},
+        "agent": {"agent": {"rollouts": best["rollouts"], "mini_batches": best["mini_batches"]}},
+    }
+    with open(path, "w") as f:
+        f.write(f"# autotune result of {args_cli.task}: {best['samples_per_s']:.0f} samples/sec,")
+        f.write(f" peak device memory {best['peak_device_mb']:.0f} MB\n")
+        yaml.safe_dump(overlay, f, sort_keys=False)
+
+
+"""
+Worker.
+"""
+
+
+def _synchronize(torch, device: str):
+    if torch.device(device).type == "cuda":
+        torch.cuda.synchronize(device)
+
+
+def run_trial(runner_cls, env, agent_cfg: dict, rollouts: int, mini_batches: int, num_updates: int) -> dict:
+    """Train for ``num_updates + 1`` updates with the given rollout length and mini-batches and measure them."""
+    import torch
+
+    device = str(env.device)
+    cfg = copy.deepcopy(agent_cfg)
+    cfg["agent"]["rollouts"] = rollouts
+    cfg["agent"]["mini_batches"] = mini_batches
+    cfg["agent"]["experiment"]["write_interval"] = 0
+    cfg["agent"]["experiment"]["checkpoint_interval"] = 0
+    cfg["trainer"]["timesteps"] = rollouts * (num_updates + 1)
+    cfg["trainer"]["disable_progressbar"] = True
+    cfg["trainer"]["close_environment_at_exit"] = False
+
+    if torch.device(device).type == "cuda":
+        torch.cuda.empty_cache()
+        torch.cuda.reset_peak_memory_stats(device)
+    runner = runner_cls(env, cfg)
+
+    # time stamps at the end of every update
+    update_times = []
+    update = runner.agent._update
+
+    def timed_update(*args, **kwargs):
+        output = update(*args, **kwargs)
+        _synchronize(torch, device)
+        update_times.append(time.perf_counter())
+        return output
+
+    runner.agent._update = timed_update
+    runner.run()
+
+    result = {"rollouts": rollouts, "mini_batches": mini_batches}
+    if len(update_times) < num_updates + 1:
+        result["status"] = f"failed ({len(update_times)} updates)"
+        return result
+    elapsed = update_times[-1] - update_times[0]
+    result.update(
+        status="ok",
+        samples_per_s=num_updates * rollouts * env.num_envs / elapsed,
+        iteration_s=elapsed / num_updates,
+        # note: ru_maxrss is in KB on Linux
+        peak_host_mb=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10,
+    )
+    if torch.device(device).type == "cuda":
+        result["peak_device_mb"] = torch.cuda.max_memory_reserved(device) / 2**20
+        result["device_total_mb"] = torch.cuda.get_device_properties(device).total_memory / 2**20
+    del runner
+    gc.collect()
+    return result
+
+
+def run_worker(runner_cls, env, agent_cfg: dict, args_cli):
+    """Run the trials of all rollout lengths and mini-batches on the environment and write the results."""
+    results = []
+    for rollouts, mini_batches in itertools.product(args_cli.autotune_rollouts, args_cli.autotune_mini_batches):
+        print(f"[INFO] Autotune trial: num_envs: {env.num_envs} | rollouts: {rollouts} | mini_batches: {mini_batches}")
+        try:
+            result = run_trial(runner_cls, env, agent_cfg, rollouts, mini_batches, args_cli.autotune_updates)
+        except RuntimeError as e:
+            # e.g. out of memory: the remaining trials may still fit
+            result = {"rollouts": rollouts, "mini_batches": mini_batches, "status": f"error ({e})".splitlines()[0]}
+        result["num_envs"] = env.num_envs
+        results.append(result)
+        # write after every trial, so that the results survive a crash of the worker
+        with open(args_cli.autotune_worker, "w") as f:
+            json.dump(results, f)
+
+
+"""
+Sweep.
+"""
+
+
+def run_autotune(args_cli, argv: list[str]) -> int:
+    """Run a worker (``train.py`` process) for every number of envs, pick the best trial and write the overlay.
+
+    Args:
+        args_cli: Parsed arguments of ``train.py``.
+        argv: Command line arguments of ``train.py`` (without the script), passed on to the workers.
+    """
+    output_dir = args_cli.autotune_output
+    if output_dir is None:
+        run_name = datetime.now().strftime("%Y-%m-%d_%H-%M-%S") + f"_{args_cli.task}"
+        output_dir = os.path.join("logs", "skrl", "autotune", run_name)
+    output_dir = os.path.abspath(output_dir)
+    os.makedirs(os.path.join(output_dir, "workers"), exist_ok=True)
+    print(f"[INFO] Writing the autotune results to: {output_dir}")
+
+    rows = []
+    train_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "train.py")
+    for num_envs in args_cli.autotune_num_envs:
+        print(f"[INFO] Autotune worker: num_envs: {num_envs}")
+        result_file = os.path.join(output_dir, "workers", f"{num_envs}.json")
+        # note: the worker gets all arguments of this process (the later arguments take precedence)
+        command = [sys.executable, train_script, *argv, "--num_envs", str(num_envs), "--autotune_worker", result_file]
+        status = None
+        try:
+            process = subprocess.run(command, timeout=args_cli.autotune_timeout)
+            status = None if process.returncode == 0 else f"failed ({process.returncode})"
+        except subprocess.TimeoutExpired:
+            status = "timeout"
+        results = []
+        if os.path.isfile(result_file):
+            with open(result_file) as f:
+                results = json.load(f)
+        rows += results
+        # trials that did not run (the worker crashed or timed out)
+        done = {(row["rollouts"], row["mini_batches"]) for row in results}
+        for rollouts, mini_batches in itertools.product(args_cli.autotune_rollouts, args_cli.autotune_mini_batches):
+            if (rollouts, mini_batches) not in done:
+                row = {"num_envs": num_envs, "rollouts": rollouts, "mini_batches": mini_batches}
+                rows.append({**row, "status": status or "not run"})
+
+    # memory budget
+    for row in rows:
+        if row["status"] != "ok":
+            continue
+        if args_cli.autotune_memory_gb is not None:
+            budget_mb = args_cli.autotune_memory_gb * 2**10
+        else:
+            budget_mb = 0.9 * row.get("device_total_mb", float("inf"))
+        row["fits_budget"] = row.get("peak_device_mb", 0.0) <= budget_mb
+    candidates = [row for row in rows if row.get("fits_budget")]
+    best = max(candidates, key=lambda row: row["samples_per_s"]) if candidates else None
+
+    _write_report(rows, best, output_dir, args_cli)
+    if best is None:
+        print("[ERROR] No autotune trial succeeded within the memory budget.")
+        return 1
+    overlay_path = os.path.join(output_dir, "autotune.yaml")
+    _write_overlay(overlay_path, best, args_cli)
+    print(
+        f"[INFO] Best configuration: num_envs: {best['num_envs']} | rollouts: {best['rollouts']} | mini_batches:"
+        f" {best['mini_batches']} | {best['samples_per_s']:.0f} samples/sec"
+    )
+    print(f"[INFO] Overlay: {overlay_path} (use with: train.py --task {args_cli.task} --overlay {overlay_path})")
+    return 0
+
+
+def _write_report(rows: list[dict], best: dict | None, output_dir: str, args_cli):
+    """Write the results as CSV and markdown table."""
+    with open(os.path.join(output_dir, "results.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({key: row.get(key, "") for key in FIELDS})
+
+    def _format(value) -> str:
+        if isinstance(value, float):
+            return f"{value:.4g}"
+        return str(value)
+
+    lines = [
+        f"# Autotune: {args_cli.task}",
+        "",
+        f"{args_cli.autotune_updates} timed PPO updates (after one warm-up update) per trial.",
+        "",
+        "| " + " | ".join(FIELDS) + " |",
+        "|" + "---|" * len(FIELDS),
+    ]
+    for row in rows:
+        lines.append("| " + " | ".join(_format(row.get(key, "")) for key in FIELDS) + " |")
+    if best is not None:
+        lines += [
+            "",
+            f"Best: num_envs={best['num_envs']}, rollouts={best['rollouts']}, mini_batches={best['mini_batches']}"
+            f" ({best['samples_per_s']:.0f} samples/sec).",
+        ]
+    with open(os.path.join(output_dir, "results.md"), "w") as f:
+        f.write("\n".join(lines) + "\n")
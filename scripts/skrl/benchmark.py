@@ -0,0 +1,397 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to benchmark how the stepping throughput of a task scales with the number of environments, the decimation
+and the physics time-step.
+
+Every combination runs in a separate worker process (a process can only create one simulation). A worker creates
+the environment, steps it with random actions and records:
+
+* the env-steps/sec (and the simulated seconds per wall-clock second),
+* the split of the step time into physics stepping (``sim.step``) and everything else (MDP terms, Python),
+* the peak device memory (torch allocations and device usage) and the peak host memory,
+* the startup time (app launch and environment creation).
+
+The results are written as ``results.csv`` and ``results.md`` into the output directory, e.g.:
+
+    python scripts/skrl/benchmark.py --task Template-Arm-v0 --num_envs 1024 2048 4096 --decimation 2 4 --headless
+
+Several tasks are swept one after the other, e.g. to compare the manager-based and the direct workflow:
+
+    python scripts/skrl/benchmark.py --task Template-Arm-v0 Template-Arm-Direct-v0 --decimation 2 --headless
+
+With ``--stub``, the workers step a simulator-free surrogate of the arm task (joint dynamics, forward kinematics,
+fused reward kernel and observation) on the CPU instead, so that the sweep can run in CI without Isaac Sim:
+
+    python scripts/skrl/benchmark.py --stub --num_envs 256 1024 --steps 100
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the scaling of a task with num_envs, decimation and dt.")
+parser.add_argument("--task", type=str, nargs="+", default=["Template-Arm-v0"], help="Names of the tasks.")
+parser.add_argument(
+    "--num_envs", type=int, nargs="+", default=[256, 1024, 2048, 4096, 8192, 16384], help="Numbers of envs."
+)
+parser.add_argument("--decimation", type=int, nargs="+", default=[1, 2, 4], help="Decimations (physics steps/step).")
+parser.add_argument("--dt", type=float, nargs="+", default=[1 / 60, 1 / 120, 1 / 240], help="Physics time-steps (s).")
+parser.add_argument("--warmup_steps", type=int, default=50, help="Number of steps to run before timing.")
+parser.add_argument("--steps", type=int, default=500, help="Number of timed steps.")
+parser.add_argument("--device", type=str, default=None, help="Device to run on (default: cuda:0, cpu with --stub).")
+parser.add_argument("--stub", action="store_true", default=False, help="Benchmark the simulator-free stub env.")
+parser.add_argument("--output", type=str, default=None, help="Output directory (default: logs/benchmarks/...).")
+parser.add_argument("--timeout", type=float, default=1800.0, help="Timeout of a single worker (in s).")
+# internal: run a single combination and write the result to the given file
+parser.add_argument("--worker", type=str, default=None, help=argparse.SUPPRESS)
+# all other arguments (e.g. --headless) are passed to the app launcher of the workers
+args_cli, app_args = parser.parse_known_args()
+
+FIELDS = [
+    "task",
+    "num_envs",
+    "decimation",
+    "dt",
+    "control_dt",
+    "status",
+    "app_startup_s",
+    "env_startup_s",
+    "steps_per_s",
+    "env_steps_per_s",
+    "sim_seconds_per_s",
+    "step_ms",
+    "sim_ms",
+    "other_ms",
+    "sim_fraction",
+    "peak_torch_device_mb",
+    "peak_device_used_mb",
+    "peak_host_mb",
+]
+
+
+"""
+Workers.
+"""
+
+
+def _synchronize(torch, device: str):
+    if torch.device(device).type == "cuda":
+        torch.cuda.synchronize(device)
+
+
+def _device_memory(torch, device: str) -> tuple[float, float]:
+    """Peak torch allocations and current device usage (all processes) in MB."""
+    if torch.device(device).type != "cuda":
+        return 0.0, 0.0
+    free, total = torch.cuda.mem_get_info(device)
+    return torch.cuda.max_memory_allocated(device) / 2**20, (total - free) / 2**20
+
+
+def _measure(torch, device: str, step, sim_timer: dict, num_envs: int, control_dt: float) -> dict:
+    """Warm up, then time ``step()`` without and with the physics timer."""
+    for _ in range(args_cli.warmup_steps):
+        step()
+    # -- throughput (no instrumentation)
+    _synchronize(torch, device)
+    start_time = time.perf_counter()
+    for _ in range(args_cli.steps):
+        step()
+    _synchronize(torch, device)
+    elapsed = time.perf_counter() - start_time
+    # -- split of the step time (the physics steps are synchronized)
+    sim_timer["enabled"] = True
+    sim_timer["time"] = 0.0
+    start_time = time.perf_counter()
+    for _ in range(args_cli.steps):
+        step()
+    _synchronize(torch, device)
+    split_elapsed = time.perf_counter() - start_time
+    sim_timer["enabled"] = False
+
+    peak_torch, device_used = _device_memory(torch, device)
+    return {
+        "steps_per_s": args_cli.steps / elapsed,
+        "env_steps_per_s": args_cli.steps * num_envs / elapsed,
+        "sim_seconds_per_s": args_cli.steps * num_envs * control_dt / elapsed,
+        "step_ms": 1000.0 * elapsed / args_cli.steps,
+        "sim_ms": 1000.0 * sim_timer["time"] / args_cli.steps,
+        "other_ms": 1000.0 * (split_elapsed - sim_timer["time"]) / args_cli.steps,
+        "sim_fraction": sim_timer["time"] / split_elapsed,
+        "peak_torch_device_mb": peak_torch,
+        "peak_device_used_mb": device_used,
+        # note: ru_maxrss is in KB on Linux
+        "peak_host_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10,
+    }
+
+
+def _timed(torch, device: str, func, sim_timer: dict):
+    """Wrap ``func`` so that its (synchronized) time is accumulated while the timer is enabled."""
+
+    def timed_func(*args, **kwargs):
+        if not sim_timer["enabled"]:
+            return func(*args, **kwargs)
+        _synchronize(torch, device)
+        start_time = time.perf_counter()
+        output = func(*args, **kwargs)
+        _synchronize(torch, device)
+        sim_timer["time"] += time.perf_counter() - start_time
+        return output
+
+    return timed_func
+
+
+def run_env_worker(num_envs: int, decimation: int, dt: float) -> dict:
+    """Benchmark the task in the simulator."""
+    start_time = time.perf_counter()
+
+    from isaaclab.app import AppLauncher
+
+    app_parser = argparse.ArgumentParser()
+    AppLauncher.add_app_launcher_args(app_parser)
+    app_launcher_args = app_parser.parse_args(app_args + (["--device", args_cli.device] if args_cli.device else []))
+    app_launcher = AppLauncher(app_launcher_args)
+    simulation_app = app_launcher.app
+
+    import gymnasium as gym
+    import torch
+
+    import isaaclab_tasks  # noqa: F401
+    from isaaclab_tasks.utils import parse_env_cfg
+
+    import arm.tasks  # noqa: F401
+
+    app_startup_s = time.perf_counter() - start_time
+
+    # create the environment with the swept settings
+    start_time = time.perf_counter()
+    task = args_cli.task[0]
+    env_cfg = parse_env_cfg(task, device=app_launcher_args.device, num_envs=num_envs)
+    env_cfg.decimation = decimation
+    env_cfg.sim.dt = dt
+    env_cfg.sim.render_interval = decimation
+    env = gym.make(task, cfg=env_cfg)
+    env.reset()
+    device = env.unwrapped.device
+    _synchronize(torch, device)
+    env_startup_s = time.perf_counter() - start_time
+
+    # time the physics steps of the simulation context
+    sim_timer = {"enabled": False, "time": 0.0}
+    sim = env.unwrapped.sim
+    sim.step = _timed(torch, device, sim.step, sim_timer)
+
+    action_shape = env.action_space.shape
+
+    def step():
+        actions = 2 * torch.rand(action_shape, device=device) - 1
+        env.step(actions)
+
+    with torch.inference_mode():
+        result = _measure(torch, device, step, sim_timer, num_envs, decimation * dt)
+    result.update(app_startup_s=app_startup_s, env_startup_s=env_startup_s)
+    # write the result before closing (closing the app may terminate the process)
+    _write_worker_result(result)
+
+    env.close()
+    simulation_app.close()
+    return result
+
+
+def run_stub_worker(num_envs: int, decimation: int, dt: float) -> dict:
+    """Benchmark the simulator-free surrogate of the arm task."""
+    start_time = time.perf_counter()
+    import torch
+
+    from arm.utils.reward_kernels import REACH_REWARD_KINDS, fused_reach_rewards
+
+    app_startup_s = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    device = args_cli.device or "cpu"
+    num_joints = 8
+    # joint state and actuator model (PD gains of the robot config)
+    joint_pos = torch.zeros(num_envs, num_joints, device=device)
+    joint_vel = torch.zeros(num_envs, num_joints, device=device)
+    actions = torch.zeros(num_envs, num_joints, device=device)
+    efforts = torch.zeros(num_envs, num_joints, device=device)
+    link_lengths = torch.full((num_joints,), 0.1, device=device)
+    target_pos = torch.rand(num_envs, 3, device=device) * 0.6 - 0.3
+    prev_distance = torch.zeros(num_envs, device=device)
+    term_kinds = torch.tensor([REACH_REWARD_KINDS.index(kind) for kind in REACH_REWARD_KINDS], device=device)
+    weights = torch.tensor([-0.1, 2.0, 1.0, 0.1, -0.00005], device=device)
+    _synchronize(torch, device)
+    env_startup_s = time.perf_counter() - start_time
+
+    def physics_step():
+        # implicit PD actuator and explicit integration of the joint state
+        torch.clamp(actions - 80.0 * joint_pos - 15.0 * joint_vel, -15.0, 15.0, out=efforts)
+        joint_vel.add_(efforts, alpha=dt).clamp_(-2.0, 2.0)
+        joint_pos.add_(joint_vel, alpha=dt)
+
+    sim_timer = {"enabled": False, "time": 0.0}
+    physics_step = _timed(torch, device, physics_step, sim_timer)
+
+    def step():
+        # random actions (joint efforts, scaled as in the action config)
+        actions.uniform_(-100.0, 100.0)
+        for _ in range(decimation):
+            physics_step()
+        # forward kinematics of a chain with alternating joint axes
+        angles = torch.cumsum(joint_pos, dim=1)
+        ee_pos = torch.stack(
+            [
+                torch.sum(link_lengths * torch.cos(angles), dim=1),
+                torch.sum(link_lengths * torch.sin(angles), dim=1),
+                torch.sum(link_lengths[::2] * torch.sin(angles[:, ::2]).abs(), dim=1),
+            ],
+            dim=1,
+        )
+        # rewards and observations
+        distance = torch.norm(ee_pos - target_pos, dim=1)
+        fused_reach_rewards(distance, prev_distance, joint_vel, joint_vel, term_kinds, weights)
+        prev_distance.copy_(distance)
+        torch.cat([joint_pos, joint_vel, ee_pos, target_pos], dim=-1)
+
+    with torch.inference_mode():
+        result = _measure(torch, device, step, sim_timer, num_envs, decimation * dt)
+    result.update(app_startup_s=app_startup_s, env_startup_s=env_startup_s)
+    _write_worker_result(result)
+    return result
+
+
+def _write_worker_result(result: dict):
+    with open(args_cli.worker, "w") as f:
+        json.dump(result, f)
+
+
+"""
+Sweep.
+"""
+
+
+def run_sweep(output_dir: str) -> list[dict]:
+    """Run a worker for every combination and collect the results."""
+    rows = []
+    tasks = ["stub"] if args_cli.stub else args_cli.task
+    combinations = list(itertools.product(tasks, args_cli.num_envs, args_cli.decimation, args_cli.dt))
+    for index, (task, num_envs, decimation, dt) in enumerate(combinations):
+        row = {"task": task, "num_envs": num_envs, "decimation": decimation, "dt": dt, "control_dt": decimation * dt}
+        print(
+            f"[INFO] [{index + 1}/{len(combinations)}] task: {task} | num_envs: {num_envs} | decimation: {decimation}"
+            f" | dt: {dt:.5f}"
+        )
+        result_file = os.path.join(output_dir, "workers", f"{task}_{num_envs}_{decimation}_{dt:.6f}.json")
+        command = [
+            sys.executable,
+            os.path.abspath(__file__),
+            "--worker",
+            result_file,
+            "--task",
+            task,
+            "--num_envs",
+            str(num_envs),
+            "--decimation",
+            str(decimation),
+            "--dt",
+            repr(dt),
+            "--warmup_steps",
+            str(args_cli.warmup_steps),
+            "--steps",
+            str(args_cli.steps),
+        ]
+        if args_cli.device:
+            command += ["--device", args_cli.device]
+        if args_cli.stub:
+            command += ["--stub"]
+        try:
+            process = subprocess.run(command + app_args, timeout=args_cli.timeout)
+            if os.path.isfile(result_file):
+                with open(result_file) as f:
+                    row.update(json.load(f))
+                row["status"] = "ok"
+            else:
+                row["status"] = f"failed ({process.returncode})"
+        except subprocess.TimeoutExpired:
+            row["status"] = "timeout"
+        print(f"[INFO]   status: {row['status']}" + _format_throughput(row))
+        rows.append(row)
+    return rows
+
+
+def _format_throughput(row: dict) -> str:
+    if row["status"] != "ok":
+        return ""
+    return f" | env-steps/sec: {row['env_steps_per_s']:.0f} | sim fraction: {row['sim_fraction']:.2f}"
+
+
+def write_report(rows: list[dict], output_dir: str):
+    """Write the results as CSV and markdown table."""
+    with open(os.path.join(output_dir, "results.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({key: row.get(key, "") for key in FIELDS})
+
+    def _format(value) -> str:
+        if isinstance(value, float):
+            return f"{value:.4g}"
+        return str(value)
+
+    lines = [
+        f"# Scaling benchmark: {'stub' if args_cli.stub else ', '.join(args_cli.task)}",
+        "",
+        f"{args_cli.steps} timed steps after {args_cli.warmup_steps} warm-up steps, random actions.",
+        "",
+        "| " + " | ".join(FIELDS) + " |",
+        "|" + "---|" * len(FIELDS),
+    ]
+    for row in rows:
+        lines.append("| " + " | ".join(_format(row.get(key, "")) for key in FIELDS) + " |")
+    successful = [row for row in rows if row["status"] == "ok"]
+    if successful:
+        lines.append("")
+    for task in dict.fromkeys(row["task"] for row in successful):
+        best = max((row for row in successful if row["task"] == task), key=lambda row: row["env_steps_per_s"])
+        lines.append(
+            f"Highest throughput of {task}: {best['env_steps_per_s']:.0f} env-steps/sec with"
+            f" num_envs={best['num_envs']}, decimation={best['decimation']}, dt={best['dt']:.5f}."
+        )
+    with open(os.path.join(output_dir, "results.md"), "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def main():
+    """Run the sweep (or a single worker)."""
+    if args_cli.worker is not None:
+        worker = run_stub_worker if args_cli.stub else run_env_worker
+        worker(args_cli.num_envs[0], args_cli.decimation[0], args_cli.dt[0])
+        return
+
+    output_dir = args_cli.output
+    if output_dir is None:
+        run_name = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        run_name += "_stub" if args_cli.stub else "_" + "_".join(args_cli.task)
+        output_dir = os.path.join("logs", "benchmarks", "scaling", run_name)
+    output_dir = os.path.abspath(output_dir)
+    os.makedirs(os.path.join(output_dir, "workers"), exist_ok=True)
+    print(f"[INFO] Writing the results to: {output_dir}")
+
+    rows = run_sweep(output_dir)
+    write_report(rows, output_dir)
+    print(f"[INFO] Report: {os.path.join(output_dir, 'results.md')}")
+
+
+if __name__ == "__main__":
+    main()
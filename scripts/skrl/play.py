@@ -47,6 +47,21 @@ parser.add_argument(
 )
 parser.add_argument("--real-time", action="store_true", default=False, help="Run in real-time, if possible.")
 
+parser.add_argument(
+    "--compile",
+    action="store_true",
+    default=False,
+    help="Compile the policy/value networks with torch.compile (falls back to eager mode if unsupported).",
+)
+parser.add_argument(
+    "--compile_mode",
+    type=str,
+    default=None,
+    choices=["default", "reduce-overhead", "max-autotune"],
+    help="Compilation mode of torch.compile.",
+)
+parser.add_argument("--compile_backend", type=str, default="inductor", help="Backend of torch.compile.")
+
 # append AppLauncher cli args
 AppLauncher.add_app_launcher_args(parser)
 args_cli = parser.parse_args()
@@ -92,6 +107,8 @@ import isaaclab_tasks  # noqa: F401
 from isaaclab_tasks.utils import get_checkpoint_path, load_cfg_from_registry, parse_env_cfg
 
 import arm.tasks  # noqa: F401
+from arm.utils.checkpoint_format import load_agent_checkpoint
+from arm.utils.compile_models import compile_agent_models
 
 # config shortcuts
 algorithm = args_cli.algorithm.lower()
@@ -166,9 +183,15 @@ def main():
     runner = Runner(env, experiment_cfg)
 
     print(f"[INFO] Loading model checkpoint from: {resume_path}")
-    runner.agent.load(resume_path)
+    load_agent_checkpoint(runner.agent, resume_path)
     # set agent to evaluation mode
     runner.agent.set_running_mode("eval")
+    # compile the models (inference only)
+    if args_cli.compile:
+        compiled = compile_agent_models(
+            runner.agent, [env.num_envs], train=False, mode=args_cli.compile_mode, backend=args_cli.compile_backend
+        )
+        print(f"[INFO] Compiled models: {compiled}")
 
     # reset environment
     obs, _ = env.reset()
@@ -17,6 +17,8 @@ import sys
 
 from isaaclab.app import AppLauncher
 
+from autotune import add_autotune_args, apply_overlay, run_autotune, run_worker
+
 # add argparse arguments
 parser = argparse.ArgumentParser(description="Train an RL agent with skrl.")
 parser.add_argument("--video", action="store_true", default=False, help="Record videos during training.")
@@ -44,11 +46,115 @@ parser.add_argument(
     choices=["AMP", "PPO", "IPPO", "MAPPO"],
     help="The RL algorithm used for training the skrl agent.",
 )
+parser.add_argument(
+    "--profile_terms",
+    action="store_true",
+    default=False,
+    help="Time the reward/observation/termination terms and report their p50/p99 latencies.",
+)
+parser.add_argument(
+    "--async_checkpoint",
+    action="store_true",
+    default=False,
+    help="Write the checkpoints from a background thread (the training thread only snapshots the state).",
+)
+parser.add_argument(
+    "--checkpoint_queue_size",
+    type=int,
+    default=2,
+    help="Maximum number of pending asynchronous checkpoint writes before training blocks.",
+)
+parser.add_argument(
+    "--checkpoint_format",
+    type=str,
+    default="torch",
+    choices=["torch", "compact", "compact-inference"],
+    help="Format of the checkpoints: skrl's (torch.save) or the compact format (full-resume or inference-only).",
+)
+parser.add_argument(
+    "--checkpoint_dtype",
+    type=str,
+    default=None,
+    choices=["float32", "float16", "bfloat16"],
+    help="Storage dtype of the model weights in compact checkpoints (default: float16 for inference-only).",
+)
+parser.add_argument(
+    "--keep_top_k",
+    type=int,
+    default=None,
+    help="Keep only the k best checkpoints (by --checkpoint_metric) plus the latest one; maintains best.pt.",
+)
+parser.add_argument(
+    "--checkpoint_metric",
+    type=str,
+    default="Info / Episode_Reward/target_reached",
+    help="Tracked training quantity that scores the checkpoints (higher is better, rolling mean).",
+)
+parser.add_argument(
+    "--discard_checkpoints",
+    type=str,
+    default="delete",
+    choices=["delete", "compact"],
+    help="Delete the checkpoints that are not kept or re-save them as inference-only compact checkpoints.",
+)
+parser.add_argument(
+    "--compile",
+    action="store_true",
+    default=False,
+    help="Compile the policy/value networks with torch.compile (falls back to eager mode if unsupported).",
+)
+parser.add_argument(
+    "--compile_mode",
+    type=str,
+    default=None,
+    choices=["default", "reduce-overhead", "max-autotune"],
+    help="Compilation mode of torch.compile.",
+)
+parser.add_argument("--compile_backend", type=str, default="inductor", help="Backend of torch.compile.")
+parser.add_argument(
+    "--mixed_precision",
+    type=str,
+    default=None,
+    choices=["bfloat16", "float16"],
+    help="Run the rollouts and PPO updates under autocast with the given dtype (weights and statistics stay fp32).",
+)
+parser.add_argument(
+    "--rollout_dtype",
+    type=str,
+    default="float32",
+    choices=["float32", "bfloat16"],
+    help="Storage dtype of the observations in the rollout memory (bfloat16 saves ~30% of the PPO memory).",
+)
+parser.add_argument(
+    "--gae",
+    type=str,
+    default=None,
+    choices=["loop", "scan", "jit", "compile"],
+    help="Compute the advantages with the vectorized GAE (and truncation bootstrapping) instead of skrl's loop.",
+)
+parser.add_argument(
+    "--trainer",
+    type=str,
+    default="skrl",
+    choices=["skrl", "lean"],
+    help="Train with skrl's trainer and memory or with the lean PPO learner (contiguous rollouts, same checkpoints).",
+)
+parser.add_argument(
+    "--interleave_groups",
+    type=int,
+    default=1,
+    help="Lean trainer: step the envs in groups that overlap the inference of the other groups (needs step_group).",
+)
+add_autotune_args(parser)
 
 # append AppLauncher cli args
 AppLauncher.add_app_launcher_args(parser)
 # parse the arguments
 args_cli, hydra_args = parser.parse_known_args()
+
+# autotune: run the trials in worker processes (without launching the simulator in this process)
+if args_cli.autotune and args_cli.autotune_worker is None:
+    sys.exit(run_autotune(args_cli, sys.argv[1:]))
 # always enable cameras to record video
 if args_cli.video:
     args_cli.enable_cameras = True
@@ -63,6 +169,7 @@ simulation_app = app_launcher.app
 """Rest everything follows."""
 
 import gymnasium as gym
+import importlib
 import os
 import random
 from datetime import datetime
@@ -101,12 +208,123 @@ import isaaclab_tasks  # noqa: F401
 from isaaclab_tasks.utils.hydra import hydra_task_config
 
 import arm.tasks  # noqa: F401
+from arm.utils.checkpoint_format import checkpoint_timestep, compact_checkpoint_saver, load_agent_checkpoint
+from arm.utils.checkpoint_retention import CheckpointRetention
+from arm.utils.checkpoint_writer import AsyncCheckpointWriter, attach_async_checkpoint_writer
+from arm.utils.compile_models import compile_agent_models
+from arm.utils.lean_ppo import LeanPPO
+from arm.utils.mixed_precision import configure_mixed_precision, configure_rollout_dtype, memory_nbytes
+from arm.utils.runner import ArmRunner
+from arm.utils.term_profiler import TermProfiler
 
 # config shortcuts
 algorithm = args_cli.algorithm.lower()
 agent_cfg_entry_point = "skrl_cfg_entry_point" if algorithm in ["ppo"] else f"skrl_{algorithm}_cfg_entry_point"
 
 
+def steps_groups(task: str) -> bool:
+    """Whether the environment class of the task steps groups of its environments (``step_group``)."""
+    entry_point = gym.spec(task).entry_point
+    if isinstance(entry_point, str):
+        module_name, attr_name = entry_point.split(":")
+        entry_point = getattr(importlib.import_module(module_name), attr_name)
+    return hasattr(entry_point, "step_group")
+
+
+def check_trainer_args():
+    """Check the arguments of the lean trainer and of the interleaved rollouts.
+
+    Raises:
+        ValueError: If the trainer does not support the arguments or the environment cannot step groups.
+    """
+    # the lean learner has its own rollout buffer and GAE
+    if args_cli.trainer == "lean":
+        if not args_cli.ml_framework.startswith("torch") or algorithm != "ppo" or args_cli.distributed:
+            raise ValueError("The lean trainer only supports single-process PPO with the torch ML framework.")
+        if args_cli.rollout_dtype != "float32":
+            raise ValueError("The lean trainer stores the rollouts in float32 (use --rollout_dtype float32).")
+        if args_cli.checkpoint and checkpoint_timestep(args_cli.checkpoint) is None:
+            raise ValueError("The lean trainer resumes from the timestep of an 'agent_<timestep>.pt' checkpoint.")
+    if args_cli.interleave_groups > 1:
+        if args_cli.trainer != "lean":
+            raise ValueError("Interleaved rollouts are only supported by the lean trainer (--trainer lean).")
+        if not steps_groups(args_cli.task):
+            raise ValueError(f"The environment of '{args_cli.task}' cannot step groups of environments (step_group).")
+
+
+def configure_agent(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agent_cfg: dict):
+    """Configure the mixed precision, the vectorized advantages and the rollout dtype of the agent."""
+    # mixed-precision rollouts and updates
+    if args_cli.mixed_precision:
+        configure_mixed_precision(agent_cfg, env_cfg.sim.device, args_cli.mixed_precision)
+
+    # vectorized advantages (the time-outs bootstrap from the values): skrl's PPO with the GAE in its update
+    if args_cli.gae and args_cli.trainer == "skrl":
+        if not args_cli.ml_framework.startswith("torch") or algorithm != "ppo":
+            raise ValueError("The vectorized GAE is only supported for PPO with the torch ML framework.")
+        agent_cfg["agent"]["gae_backend"] = args_cli.gae
+        print(f"[INFO] Computing the advantages with the '{args_cli.gae}' GAE backend.")
+
+    # store the observations of the rollouts in reduced precision
+    if args_cli.rollout_dtype != "float32":
+        if not args_cli.ml_framework.startswith("torch"):
+            raise ValueError("Reduced-precision rollouts are only supported with the torch ML framework.")
+        configure_rollout_dtype(agent_cfg, args_cli.rollout_dtype)
+
+
+def compile_models(runner: Runner, env, agent_cfg: dict):
+    """Compile the models of the agent for the batch sizes of the rollouts and of the mini-batches."""
+    if not args_cli.ml_framework.startswith("torch"):
+        raise ValueError("Compiling the models is only supported with the torch ML framework.")
+    rollouts, mini_batches = agent_cfg["agent"]["rollouts"], agent_cfg["agent"]["mini_batches"]
+    batch_sizes = [env.num_envs, rollouts * env.num_envs // mini_batches]
+    compiled = compile_agent_models(
+        runner.agent, batch_sizes, mode=args_cli.compile_mode, backend=args_cli.compile_backend
+    )
+    print(f"[INFO] Compiled models: {compiled}")
+
+
+def create_checkpoint_writer(runner: Runner) -> AsyncCheckpointWriter | None:
+    """Attach the checkpoint writer (asynchronous, compact format or top-k retention) to the agent, if requested."""
+    if not (args_cli.async_checkpoint or args_cli.checkpoint_format != "torch" or args_cli.keep_top_k):
+        return None
+    if not args_cli.ml_framework.startswith("torch"):
+        raise ValueError("The checkpoint writer is only supported with the torch ML framework.")
+    save = None
+    if args_cli.checkpoint_format != "torch":
+        variant = "inference" if args_cli.checkpoint_format == "compact-inference" else "full"
+        save = compact_checkpoint_saver(variant, dtype=args_cli.checkpoint_dtype)
+    retention = None
+    if args_cli.keep_top_k:
+        retention = CheckpointRetention(
+            args_cli.keep_top_k, metric=args_cli.checkpoint_metric, discard=args_cli.discard_checkpoints
+        )
+        print(f"[INFO] Keeping the {args_cli.keep_top_k} best checkpoints by: {args_cli.checkpoint_metric}")
+    checkpoint_writer = AsyncCheckpointWriter(max_pending=args_cli.checkpoint_queue_size, save=save)
+    attach_async_checkpoint_writer(
+        runner.agent, checkpoint_writer, wait=not args_cli.async_checkpoint, retention=retention
+    )
+    return checkpoint_writer
+
+
+def train(runner: Runner, env, agent_cfg: dict, resume_path: str | None):
+    """Train with skrl's trainer or with the lean PPO learner (optionally with interleaved rollouts)."""
+    if args_cli.trainer == "skrl":
+        runner.run()
+        return
+    learner = LeanPPO.from_skrl_agent(runner.agent, env.num_envs, gae_backend=args_cli.gae or "scan")
+    # continue the timesteps of the checkpoint (checkpoint numbering and timestep budget)
+    initial_timestep = checkpoint_timestep(resume_path) if resume_path else 0
+    print(f"[INFO] Training with the lean PPO learner (from timestep {initial_timestep}).")
+    learner.train(
+        env,
+        agent_cfg["trainer"]["timesteps"],
+        initial_timestep=initial_timestep,
+        environment_info=agent_cfg["trainer"]["environment_info"],
+        num_groups=args_cli.interleave_groups,
+    )
+
+
 @hydra_task_config(args_cli.task, agent_cfg_entry_point)
 def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agent_cfg: dict):
     """Train with skrl agent."""
@@ -132,6 +350,13 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     if "VALUE_LOSS_SCALE" in os.environ:
         agent_cfg["agent"]["value_loss_scale"] = float(os.getenv("VALUE_LOSS_SCALE", "2.0"))
     
+    # apply the autotune overlay (command line arguments take precedence)
+    if args_cli.overlay:
+        apply_overlay(args_cli.overlay, env_cfg, agent_cfg)
+        print(f"[INFO] Applied the overlay: {args_cli.overlay}")
+        if args_cli.num_envs is not None:
+            env_cfg.scene.num_envs = args_cli.num_envs
+
     print(f"[INFO] Updated training configuration with environment variables:")
     print(f"  - NUM_ENVS: {env_cfg.scene.num_envs}")
     print(f"  - TIMESTEPS: {agent_cfg['trainer']['timesteps']}")
@@ -159,6 +384,16 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     agent_cfg["seed"] = args_cli.seed if args_cli.seed is not None else agent_cfg["seed"]
     env_cfg.seed = agent_cfg["seed"]
 
+    # autotune worker: run the trials of the rollout lengths and mini-batches and exit
+    if args_cli.autotune_worker:
+        env = SkrlVecEnvWrapper(gym.make(args_cli.task, cfg=env_cfg), ml_framework=args_cli.ml_framework)
+        run_worker(Runner, env, agent_cfg, args_cli)
+        env.close()
+        return
+
+    # check the trainer arguments before the environment is created
+    check_trainer_args()
+
     # specify directory for logging experiments
     log_root_path = os.path.join("logs", "skrl", agent_cfg["agent"]["experiment"]["directory"])
     log_root_path = os.path.abspath(log_root_path)
@@ -174,6 +409,11 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     # update log_dir
     log_dir = os.path.join(log_root_path, log_dir)
 
+    # write the samples of the training monitor (if any) into the log-directory
+    training_monitor = getattr(getattr(env_cfg, "events", None), "training_monitor", None)
+    if training_monitor is not None:
+        training_monitor.params["jsonl_path"] = os.path.join(log_dir, "monitor.jsonl")
+
     # dump the configuration into log-directory
     dump_yaml(os.path.join(log_dir, "params", "env.yaml"), env_cfg)
     dump_yaml(os.path.join(log_dir, "params", "agent.yaml"), agent_cfg)
@@ -183,6 +423,16 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     # get checkpoint path (to resume training)
     resume_path = retrieve_file_path(args_cli.checkpoint) if args_cli.checkpoint else None
 
+    # wrap the MDP terms with the latency profiler (after the config was dumped)
+    profiler = None
+    if args_cli.profile_terms:
+        if not isinstance(env_cfg, ManagerBasedRLEnvCfg):
+            raise ValueError("Term profiling is only supported for manager-based environments.")
+        from torch.utils.tensorboard import SummaryWriter
+
+        profiler = TermProfiler(env_cfg.sim.device, writer=SummaryWriter(os.path.join(log_dir, "term_profile")))
+        print(f"[INFO] Profiling {len(profiler.wrap_env_cfg(env_cfg))} MDP terms.")
+
     # create isaac environment
     env = gym.make(args_cli.task, cfg=env_cfg, render_mode="rgb_array" if args_cli.video else None)
 
@@ -205,17 +455,42 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     # wrap around environment for skrl
     env = SkrlVecEnvWrapper(env, ml_framework=args_cli.ml_framework)  # same as: `wrap_env(env, wrapper="auto")`
 
-    # configure and instantiate the skrl runner
+    # mixed precision, vectorized advantages and reduced-precision rollouts
+    configure_agent(env_cfg, agent_cfg)
+
+    # configure and instantiate the skrl runner (with the agents and memories of arm.utils for torch)
     # https://skrl.readthedocs.io/en/latest/api/utils/runner.html
-    runner = Runner(env, agent_cfg)
+    runner = (ArmRunner if args_cli.ml_framework.startswith("torch") else Runner)(env, agent_cfg)
+    if args_cli.rollout_dtype != "float32":
+        saved, total = runner.agent.memory.saved_nbytes, memory_nbytes(runner.agent.memory)
+        print(f"[INFO] Rollout memory: {total / 2**20:.1f} MB ({saved / 2**20:.1f} MB saved by the reduced precision)")
 
     # load checkpoint (if specified)
     if resume_path:
         print(f"[INFO] Loading model checkpoint from: {resume_path}")
-        runner.agent.load(resume_path)
+        load_agent_checkpoint(runner.agent, resume_path)
+
+    # compile the models (warm up with the batch sizes of the rollouts and of the mini-batches)
+    if args_cli.compile:
+        compile_models(runner, env, agent_cfg)
+
+    # write the checkpoints from a background thread (or in the compact format, or with top-k retention)
+    checkpoint_writer = create_checkpoint_writer(runner)
 
     # run training
-    runner.run()
+    train(runner, env, agent_cfg, resume_path)
+
+    # wait for the pending checkpoints
+    if checkpoint_writer is not None:
+        checkpoint_writer.close()
+        print("[INFO] Checkpoint write latencies:")
+        print(checkpoint_writer.summary())
+
+    # print the latency summary of the MDP terms
+    if profiler is not None:
+        print("[INFO] MDP term latencies:")
+        print(profiler.summary())
+        profiler.writer.close()
 
     # close the simulator
     env.close()
@@ -0,0 +1,110 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to train an RL agent with skrl on the kinematic surrogate of the reach task, without a simulator.
+
+The surrogate (``Template-Arm-Kinematic-v0``) has the observation and action spaces and the agent configuration of
+the simulated tasks, so its checkpoints warm-start their training, e.g.:
+
+    python scripts/skrl/train_kinematic.py --num_envs 4096 --max_iterations 500
+    python scripts/skrl/train.py --task Template-Arm-v0 --headless --checkpoint <log dir>/checkpoints/best_agent.pt
+"""
+
+import argparse
+import gymnasium as gym
+import importlib
+import os
+import random
+import yaml
+from datetime import datetime
+
+from skrl.envs.wrappers.torch import wrap_env
+from skrl.utils.runner.torch import Runner
+
+import arm.tasks  # noqa: F401
+from arm.tasks.kinematic.arm.kinematic_env_cfg import KinematicArmEnvCfg
+from arm.utils.lean_ppo import LeanPPO
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Train an RL agent with skrl on the kinematic surrogate.")
+parser.add_argument("--task", type=str, default="Template-Arm-Kinematic-v0", help="Name of the task.")
+parser.add_argument("--num_envs", type=int, default=None, help="Number of environments.")
+parser.add_argument("--device", type=str, default="cpu", help="Device of the environment and the agent.")
+parser.add_argument("--seed", type=int, default=None, help="Seed used for the environment (-1: random).")
+parser.add_argument("--max_iterations", type=int, default=None, help="RL Policy training iterations.")
+parser.add_argument("--chain", type=str, default=None, help="Kinematic chain (the asset or its JSON export).")
+parser.add_argument(
+    "--trainer",
+    type=str,
+    default="skrl",
+    choices=["skrl", "lean"],
+    help="Training loop: skrl's trainer or the lean PPO learner.",
+)
+parser.add_argument(
+    "--interleave_groups",
+    type=int,
+    default=1,
+    help="Number of groups of environments whose steps overlap the inference (lean trainer only).",
+)
+args_cli = parser.parse_args()
+
+
+def load_agent_cfg(task: str) -> dict:
+    """Load the skrl agent configuration of the task (``module:file.yaml`` entry point)."""
+    module_name, file_name = gym.spec(task).kwargs["skrl_cfg_entry_point"].split(":")
+    module_path = os.path.dirname(importlib.import_module(module_name).__file__)
+    with open(os.path.join(module_path, file_name)) as f:
+        return yaml.safe_load(f)
+
+
+def main():
+    """Train with skrl agent."""
+    env_cfg = KinematicArmEnvCfg(device=args_cli.device)
+    agent_cfg = load_agent_cfg(args_cli.task)
+    if args_cli.num_envs is not None:
+        env_cfg.num_envs = args_cli.num_envs
+    if args_cli.chain is not None:
+        env_cfg.chain_path = args_cli.chain
+    if args_cli.max_iterations:
+        agent_cfg["trainer"]["timesteps"] = args_cli.max_iterations * agent_cfg["agent"]["rollouts"]
+    if args_cli.interleave_groups > 1 and args_cli.trainer != "lean":
+        raise ValueError("Interleaved rollouts are only supported by the lean trainer (--trainer lean).")
+    # randomly sample a seed if seed = -1
+    if args_cli.seed == -1:
+        args_cli.seed = random.randint(0, 10000)
+    agent_cfg["seed"] = args_cli.seed if args_cli.seed is not None else agent_cfg["seed"]
+    env_cfg.seed = agent_cfg["seed"]
+
+    # specify directory for logging experiments: {time-stamp}_ppo_torch_kinematic
+    log_root_path = os.path.abspath(os.path.join("logs", "skrl", agent_cfg["agent"]["experiment"]["directory"]))
+    log_dir = datetime.now().strftime("%Y-%m-%d_%H-%M-%S") + "_ppo_torch_kinematic"
+    if agent_cfg["agent"]["experiment"]["experiment_name"]:
+        log_dir += f'_{agent_cfg["agent"]["experiment"]["experiment_name"]}'
+    agent_cfg["agent"]["experiment"]["directory"] = log_root_path
+    agent_cfg["agent"]["experiment"]["experiment_name"] = log_dir
+    print(f"[INFO] Logging experiment in directory: {os.path.join(log_root_path, log_dir)}")
+    print(f"[INFO] Kinematic chain: {env_cfg.chain_path or 'nominal'} | num_envs: {env_cfg.num_envs}")
+
+    # create the environment and wrap it for skrl (it has the interface of the Isaac Lab environments)
+    env = wrap_env(gym.make(args_cli.task, cfg=env_cfg), wrapper="isaaclab")
+    runner = Runner(env, agent_cfg)
+
+    # run training
+    if args_cli.trainer == "lean":
+        learner = LeanPPO.from_skrl_agent(runner.agent, env.num_envs)
+        learner.train(
+            env,
+            agent_cfg["trainer"]["timesteps"],
+            environment_info=agent_cfg["trainer"]["environment_info"],
+            num_groups=args_cli.interleave_groups,
+        )
+    else:
+        runner.run()
+    env.close()
+
+
+if __name__ == "__main__":
+    main()
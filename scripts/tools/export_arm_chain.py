@@ -0,0 +1,52 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to export the kinematic chain of the arm from its USD asset to JSON.
+
+Reading the asset requires ``pxr`` (the Python of Isaac Sim, or the ``usd-core`` package); the exported JSON is
+loaded without it (:meth:`arm.utils.kinematics.KinematicChain.from_json`), e.g. by the kinematic surrogate task
+(``--chain`` / ``ARM_CHAIN_JSON``):
+
+    python scripts/tools/export_arm_chain.py --usd source/arm.usd --output logs/arm_chain.json
+"""
+
+import argparse
+import os
+import torch
+
+from arm.utils.kinematics import ArmKinematics, KinematicChain
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Export the kinematic chain of the arm to JSON.")
+parser.add_argument("--usd", type=str, default="source/arm.usd", help="Path of the USD asset.")
+parser.add_argument("--output", type=str, required=True, help="Path of the JSON file.")
+parser.add_argument("--root_body", type=str, default="base_link", help="Name of the root body.")
+parser.add_argument("--ee_body", type=str, default="arm_end", help="Name of the end-effector body.")
+args_cli = parser.parse_args()
+
+
+def main():
+    """Read the chain from the asset, print it and write it to JSON."""
+    with open(args_cli.usd, "rb") as f:
+        if f.read(len("version https://git-lfs")) == b"version https://git-lfs":
+            raise ValueError(f"{args_cli.usd} is a git LFS pointer, fetch the asset first (git lfs pull).")
+    chain = KinematicChain.from_usd(args_cli.usd, root_body=args_cli.root_body, ee_body=args_cli.ee_body)
+    print(f"{'joint':<10} {'origin':>26} {'axis':>18} {'limits (rad)':>20}")
+    for joint in chain.joints:
+        origin = ", ".join(f"{v:.4f}" for v in joint.origin)
+        axis = ", ".join(f"{v:.2f}" for v in joint.axis)
+        limits = ", ".join(f"{v:.3f}" for v in joint.limits)
+        print(f"{joint.name:<10} {origin:>26} {axis:>18} {limits:>20}")
+    # end-effector position at the zero joint positions
+    ee_pos = ArmKinematics(chain).end_effector_positions(torch.zeros(1, chain.num_joints))[0].tolist()
+    print(f"End-effector '{chain.ee_name}' at zero joint positions: {[round(v, 4) for v in ee_pos]}")
+    os.makedirs(os.path.dirname(os.path.abspath(args_cli.output)), exist_ok=True)
+    chain.to_json(args_cli.output)
+    print(f"Exported {chain.num_joints} joints to: {args_cli.output}")
+
+
+if __name__ == "__main__":
+    main()
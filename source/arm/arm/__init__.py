@@ -7,8 +7,12 @@
 Python module serving as a project/extension template.
 """
 
+import importlib.util
+
 # Register Gym environments.
 from .tasks import *
 
-# Register UI extensions.
-from .ui_extension_example import *
+# Register UI extensions (only if the simulator is installed; without it, only the simulator-independent
+# utilities (:mod:`arm.utils`) and tasks can be used, e.g. by CPU-only tools).
+if importlib.util.find_spec("isaaclab") is not None:
+    from .ui_extension_example import *
@@ -9,9 +9,18 @@
 # Register Gym environments.
 ##
 
-from isaaclab_tasks.utils import import_packages
+import importlib
+import importlib.util
 
 # The blacklist is used to prevent importing configs from sub-packages
 _BLACKLIST_PKGS = ["utils", ".mdp"]
-# Import all configs in this package
-import_packages(__name__, _BLACKLIST_PKGS)
+
+if importlib.util.find_spec("isaaclab") is None:
+    # without the simulator, only the simulator-free tasks are registered (if gymnasium is available)
+    if importlib.util.find_spec("gymnasium") is not None:
+        importlib.import_module(f"{__name__}.kinematic.arm")
+else:
+    from isaaclab_tasks.utils import import_packages
+
+    # Import all configs in this package
+    import_packages(__name__, _BLACKLIST_PKGS)
@@ -0,0 +1,198 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+
+import isaaclab.sim as sim_utils
+from isaaclab.assets import Articulation
+from isaaclab.envs import DirectRLEnv
+from isaaclab.sim.spawners.from_files import GroundPlaneCfg, spawn_ground_plane
+
+from arm.tasks.manager_based.arm.mdp import TargetScheduler
+from arm.utils.reward_kernels import (
+    REACH_TASK_REWARD_TERMS,
+    reach_task_reward_terms,
+    reach_task_reward_weights,
+    success_threshold,
+)
+
+from .arm_env_cfg import ArmEnvCfg
+
+REWARD_TERM_NAMES = tuple(name for name, _ in REACH_TASK_REWARD_TERMS)
+"""Names of the reward terms (columns of :attr:`ArmEnv.reward_terms`), as in the manager-based task."""
+
+
+class ArmEnv(DirectRLEnv):
+    """Direct-workflow variant of the arm reach task.
+
+    The observations, rewards and terminations are each computed in one vectorized pass over buffers that are
+    allocated once: the end-effector/target kinematics are computed once per step (in :meth:`_get_dones`) and
+    shared by the rewards; all reward terms are written into the columns of :attr:`reward_terms`
+    (:func:`arm.utils.reward_kernels.reach_task_reward_terms`) and reduced with a single matrix-vector product.
+    The target is physics-free (see :class:`TargetScheduler`).
+
+    Differences to the manager-based task: all reward terms of a step see the target before it is respawned,
+    and the improvement of the anti-stagnation term is always measured w.r.t. the previous step.
+    """
+
+    cfg: ArmEnvCfg
+
+    def __init__(self, cfg: ArmEnvCfg, render_mode: str | None = None, **kwargs):
+        super().__init__(cfg, render_mode, **kwargs)
+
+        # resolve the joints and bodies once
+        self._action_joint_ids, _ = self.robot.find_joints(self.cfg.action_joint_names)
+        self._ee_body_idx = self.robot.find_bodies(self.cfg.ee_body_name)[0][0]
+        num_joints = self.robot.num_joints
+        # reset offsets and termination bounds per joint
+        self._reset_pos_lower = torch.zeros(num_joints, device=self.device)
+        self._reset_pos_upper = torch.zeros(num_joints, device=self.device)
+        self._reset_vel_lower = torch.zeros(num_joints, device=self.device)
+        self._reset_vel_upper = torch.zeros(num_joints, device=self.device)
+        self._joint_lower = torch.full((num_joints,), -torch.inf, device=self.device)
+        self._joint_upper = torch.full((num_joints,), torch.inf, device=self.device)
+        for joint_names, position_range, velocity_range, bounds in (
+            (
+                self.cfg.reset_arm_joint_names,
+                self.cfg.reset_arm_position_range,
+                self.cfg.reset_arm_velocity_range,
+                self.cfg.arm_joint_bounds,
+            ),
+            (
+                self.cfg.reset_end_effector_joint_names,
+                self.cfg.reset_end_effector_position_range,
+                self.cfg.reset_end_effector_velocity_range,
+                self.cfg.end_effector_joint_bounds,
+            ),
+        ):
+            joint_ids, _ = self.robot.find_joints(joint_names)
+            self._reset_pos_lower[joint_ids], self._reset_pos_upper[joint_ids] = position_range
+            self._reset_vel_lower[joint_ids], self._reset_vel_upper[joint_ids] = velocity_range
+            self._joint_lower[joint_ids], self._joint_upper[joint_ids] = bounds
+
+        # actions
+        self.actions = torch.zeros(self.num_envs, self.cfg.action_space, device=self.device)
+        # targets
+        self.target_scheduler = TargetScheduler(self, self.cfg.target_cfg)
+        self.target_scheduler.write_targets()
+
+        # shared per-step kinematics
+        self._ee_pos = torch.zeros(self.num_envs, 3, device=self.device)
+        self._delta = torch.zeros(self.num_envs, 3, device=self.device)
+        self._distance = torch.zeros(self.num_envs, device=self.device)
+        # reward state
+        self._prev_distance = torch.zeros(self.num_envs, device=self.device)
+        self._has_prev = torch.zeros(self.num_envs, dtype=torch.bool, device=self.device)
+        self._stagnation_counter = torch.zeros(self.num_envs, device=self.device)
+        self._visits = torch.zeros(
+            self.num_envs, self.cfg.exploration_num_buckets, dtype=torch.int32, device=self.device
+        )
+        self._curriculum_step = 0
+        # reward terms (unweighted), their weights (including the step dt) and episodic sums
+        self.reward_terms = torch.zeros(self.num_envs, len(REWARD_TERM_NAMES), device=self.device)
+        self._reward_weights = reach_task_reward_weights(self.cfg, self.step_dt, self.device)
+        self._episode_sums = torch.zeros_like(self.reward_terms)
+        # observation buffer: [joint_pos_rel, joint_vel_rel, end-effector position, target position]
+        self._obs_buf = torch.zeros(self.num_envs, self.cfg.observation_space, device=self.device)
+        self._obs_joint_pos = self._obs_buf[:, :num_joints]
+        self._obs_joint_vel = self._obs_buf[:, num_joints : 2 * num_joints]
+        self._obs_ee_pos = self._obs_buf[:, 2 * num_joints : 2 * num_joints + 3]
+        self._obs_target_pos = self._obs_buf[:, -3:]
+
+    def _setup_scene(self):
+        self.robot = Articulation(self.cfg.robot_cfg)
+        # add ground plane
+        spawn_ground_plane(prim_path="/World/ground", cfg=GroundPlaneCfg(size=(10000.0, 10000.0)))
+        # clone and replicate
+        self.scene.clone_environments(copy_from_source=False)
+        # add articulation to scene
+        self.scene.articulations["robot"] = self.robot
+        # add lights
+        light_cfg = sim_utils.DomeLightCfg(intensity=500.0, color=(0.9, 0.9, 0.9))
+        light_cfg.func("/World/DomeLight", light_cfg)
+
+    def _pre_physics_step(self, actions: torch.Tensor) -> None:
+        self.actions.copy_(actions)
+
+    def _apply_action(self) -> None:
+        self.robot.set_joint_effort_target(self.actions * self.cfg.action_scale, joint_ids=self._action_joint_ids)
+
+    def _get_observations(self) -> dict:
+        data = self.robot.data
+        torch.sub(data.joint_pos, data.default_joint_pos, out=self._obs_joint_pos)
+        torch.sub(data.joint_vel, data.default_joint_vel, out=self._obs_joint_vel)
+        self._obs_ee_pos.copy_(data.body_pos_w[:, self._ee_body_idx])
+        self._obs_target_pos.copy_(self.target_scheduler.positions)
+        # note: the buffer is overwritten on the next step
+        return {"policy": self._obs_buf}
+
+    def _get_rewards(self) -> torch.Tensor:
+        terms = self.reward_terms
+        joint_vel = self.robot.data.joint_vel
+        # all terms (the exploration voxels are hashed in the env frame), with curriculum of the success threshold
+        reached = reach_task_reward_terms(
+            terms,
+            self.reset_terminated,
+            self._distance,
+            self._ee_pos - self.scene.env_origins,
+            joint_vel,
+            joint_vel[:, self._action_joint_ids],
+            self._prev_distance,
+            self._has_prev,
+            self._stagnation_counter,
+            self._visits,
+            success_threshold(self.cfg, self._curriculum_step),
+            self.cfg.success_bonus,
+            self.cfg.exploration_voxel_size,
+        )
+        self._curriculum_step += 1
+        # respawn the targets of the successful envs (after all terms used the current targets)
+        self.target_scheduler.advance(reached)
+        # weighted sum
+        self._episode_sums.addcmul_(terms, self._reward_weights)
+        return torch.mv(terms, self._reward_weights)
+
+    def _get_dones(self) -> tuple[torch.Tensor, torch.Tensor]:
+        data = self.robot.data
+        # shared kinematics of the step
+        self._ee_pos.copy_(data.body_pos_w[:, self._ee_body_idx])
+        torch.sub(self._ee_pos, self.target_scheduler.positions, out=self._delta)
+        torch.linalg.vector_norm(self._delta, dim=1, out=self._distance)
+        # time out and manual joint limits
+        time_out = self.episode_length_buf >= self.max_episode_length
+        out_of_bounds = torch.any((data.joint_pos < self._joint_lower) | (data.joint_pos > self._joint_upper), dim=1)
+        return out_of_bounds, time_out
+
+    def _reset_idx(self, env_ids: Sequence[int] | None):
+        if env_ids is None:
+            env_ids = self.robot._ALL_INDICES
+        super()._reset_idx(env_ids)
+
+        # log the episodic sums of the reward terms (same convention as the reward manager)
+        episode_sums = torch.mean(self._episode_sums[env_ids], dim=0) / self.max_episode_length_s
+        self.extras["log"] = {
+            f"Episode_Reward/{name}": value for name, value in zip(REWARD_TERM_NAMES, episode_sums.unbind())
+        }
+        self._episode_sums[env_ids] = 0.0
+        # reward state
+        self._has_prev[env_ids] = False
+        self._stagnation_counter[env_ids] = 0.0
+        self._visits[env_ids] = 0
+
+        # joint state: default state plus uniform offsets, clamped to the soft joint limits
+        num_resets = len(env_ids)
+        default_joint_pos = self.robot.data.default_joint_pos[env_ids]
+        offsets = torch.rand(num_resets, self.robot.num_joints, device=self.device)
+        joint_pos = default_joint_pos + self._reset_pos_lower
+        joint_pos += offsets * (self._reset_pos_upper - self._reset_pos_lower)
+        joint_pos_limits = self.robot.data.soft_joint_pos_limits[env_ids]
+        joint_pos = joint_pos.clamp_(joint_pos_limits[..., 0], joint_pos_limits[..., 1])
+        offsets.uniform_()
+        joint_vel = self.robot.data.default_joint_vel[env_ids]
+        joint_vel = joint_vel + self._reset_vel_lower + offsets * (self._reset_vel_upper - self._reset_vel_lower)
+        self.robot.write_joint_state_to_sim(joint_pos, joint_vel, None, env_ids)
@@ -0,0 +1,84 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import math
+import os
+
+from isaaclab.assets import ArticulationCfg
+from isaaclab.envs import DirectRLEnvCfg
+from isaaclab.scene import InteractiveSceneCfg
+from isaaclab.sim import SimulationCfg
+from isaaclab.utils import configclass
+
+from arm.tasks.manager_based.arm.arm_env_cfg import CARTPOLE_CFG
+from arm.tasks.manager_based.arm.mdp import TargetCfg
+
+
+@configclass
+class ArmEnvCfg(DirectRLEnvCfg):
+    """Configuration of the direct-workflow arm reach task.
+
+    The observation and action spaces are the same as for the manager-based task (``Template-Arm-v0``), so that
+    policies transfer between both. The reward weights default to the ones of the manager-based task.
+    """
+
+    # env
+    decimation = 2
+    episode_length_s = float(os.getenv("EPISODE_LENGTH_S", "20"))
+    # - spaces definition: joint efforts of joint_[1-8] /
+    #   [joint_pos_rel (8), joint_vel_rel (8), end-effector position (3), target position (3)]
+    action_space = 8
+    observation_space = 22
+    state_space = 0
+
+    # simulation
+    sim: SimulationCfg = SimulationCfg(dt=1 / 120, render_interval=decimation)
+
+    # robot
+    robot_cfg: ArticulationCfg = CARTPOLE_CFG.replace(prim_path="/World/envs/env_.*/Robot")
+    action_joint_names = ["joint_[1-8]"]
+    action_scale = 100.0
+    ee_body_name = "arm_end"
+
+    # target (physics-free: a per-env position tensor, shown with markers when rendering)
+    target_cfg: TargetCfg = TargetCfg(name="target", init_pos=(0.0, 0.0, 0.2))
+
+    # scene
+    scene: InteractiveSceneCfg = InteractiveSceneCfg(
+        num_envs=int(os.getenv("NUM_ENVS", "2048")), env_spacing=2.0, replicate_physics=True
+    )
+
+    # reset: joint position offsets (and velocity ranges) w.r.t. the default joint state
+    reset_arm_joint_names = "joint_[2-7]"
+    reset_arm_position_range = (-math.pi / 4, math.pi / 4)
+    reset_arm_velocity_range = (-0.001, 0.001)
+    reset_end_effector_joint_names = "joint_(1|8)"
+    reset_end_effector_position_range = (math.pi / 2, math.pi)
+    reset_end_effector_velocity_range = (-0.0001, 0.0001)
+
+    # terminations: manual joint position limits
+    arm_joint_bounds = (-3.0 * math.pi, 3.0 * math.pi)
+    end_effector_joint_bounds = (-math.pi, 3.0 * math.pi)
+
+    # reward scales
+    rew_scale_alive = float(os.getenv("REWARD_ALIVE", "1.0"))
+    rew_scale_terminated = float(os.getenv("REWARD_TERMINATING", "-5.0"))
+    rew_scale_end_effector_position = float(os.getenv("REWARD_END_EFFECTOR_POSITION", "-0.1"))
+    rew_scale_target_reached = float(os.getenv("REWARD_TARGET_REACHED", "20.0"))
+    rew_scale_distance_guidance = float(os.getenv("REWARD_DISTANCE_GUIDANCE", "2.0"))
+    rew_scale_approach_progress = float(os.getenv("REWARD_APPROACH_PROGRESS", "1.0"))
+    rew_scale_joint_velocity = float(os.getenv("REWARD_JOINT_VELOCITY", "0.1"))
+    rew_scale_exploration = float(os.getenv("REWARD_EXPLORATION", "0.05"))
+    rew_scale_anti_stagnation = float(os.getenv("REWARD_ANTI_STAGNATION", "0.2"))
+    rew_scale_joint_vel = float(os.getenv("REWARD_JOINT_VEL", "-0.00005"))
+    rew_scale_joint_vel_smooth = float(os.getenv("REWARD_JOINT_VEL_SMOOTH", "-0.0001"))
+
+    # reward parameters
+    success_bonus = 300.0
+    success_thresholds = ((20000, 0.08), (40000, 0.05), (60000, 0.03))
+    """Curriculum of the success threshold: (until step, threshold) pairs."""
+    success_threshold_final = 0.02
+    exploration_voxel_size = 0.05
+    exploration_num_buckets = 4096
@@ -0,0 +1,24 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import gymnasium as gym
+
+from arm.tasks.manager_based.arm import agents
+
+##
+# Register Gym environments.
+##
+
+
+gym.register(
+    id="Template-Arm-Kinematic-v0",
+    entry_point=f"{__name__}.kinematic_env:KinematicArmEnv",
+    disable_env_checker=True,
+    kwargs={
+        "env_cfg_entry_point": f"{__name__}.kinematic_env_cfg:KinematicArmEnvCfg",
+        # same agent as the manager-based task (the observation and action spaces are identical)
+        "skrl_cfg_entry_point": f"{agents.__name__}:skrl_ppo_cfg.yaml",
+    },
+)
@@ -0,0 +1,304 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import gymnasium as gym
+import math
+import re
+import torch
+
+from arm.utils.kinematics import NOMINAL_ARM_CHAIN, ArmKinematics, KinematicChain
+from arm.utils.reward_kernels import (
+    REACH_TASK_REWARD_TERMS,
+    reach_task_reward_terms,
+    reach_task_reward_weights,
+    success_threshold,
+)
+
+from .kinematic_env_cfg import KinematicArmEnvCfg
+
+REWARD_TERM_NAMES = tuple(name for name, _ in REACH_TASK_REWARD_TERMS)
+"""Names of the reward terms (columns of :attr:`KinematicArmEnv.reward_terms`), as in the direct-workflow task."""
+
+
+class KinematicArmEnv(gym.Env):
+    """Kinematic surrogate of the arm reach task, in plain torch (no simulator).
+
+    The observations, actions, rewards, terminations and resets are the ones of the direct-workflow task
+    (``Template-Arm-Direct-v0``), so that policies and reward changes transfer. Only the physics is replaced: every
+    joint is an independent inertia driven by the effort actions and by the implicit PD drive of the actuators
+    (effort and velocity limits included, no gravity, no coupling, no collisions), and the end-effector position
+    comes from the forward kinematics of the arm (:class:`arm.utils.kinematics.ArmKinematics`). The env origins lie
+    on a grid, so that the positions (observed in world frame) have the statistics of the simulated scene.
+
+    The environment has the interface of the Isaac Lab environments (vectorized, auto-reset, ``{"policy": ...}``
+    observations, ``extras["log"]`` and ``extras["time_outs"]``) and can be wrapped with skrl's Isaac Lab wrapper.
+    Groups of environments can be stepped on their own (:meth:`step_group`, for interleaved rollouts).
+    """
+
+    is_vector_env = True
+    metadata = {"render_modes": [None]}
+
+    def __init__(self, cfg: KinematicArmEnvCfg | None = None, render_mode: str | None = None, **kwargs):
+        self.cfg = cfg = KinematicArmEnvCfg() if cfg is None else cfg
+        self.render_mode = render_mode
+        self.num_envs = cfg.num_envs
+        self.device = cfg.device
+        if cfg.seed is not None:
+            torch.manual_seed(cfg.seed)
+        self.physics_dt = cfg.sim_dt
+        self.step_dt = cfg.sim_dt * cfg.decimation
+        self.max_episode_length_s = cfg.episode_length_s
+        self.max_episode_length = math.ceil(cfg.episode_length_s / self.step_dt)
+
+        # spaces
+        self.single_observation_space = gym.spaces.Dict(
+            {"policy": gym.spaces.Box(low=-math.inf, high=math.inf, shape=(cfg.observation_space,))}
+        )
+        self.single_action_space = gym.spaces.Box(low=-math.inf, high=math.inf, shape=(cfg.action_space,))
+        self.observation_space = gym.vector.utils.batch_space(self.single_observation_space, self.num_envs)
+        self.action_space = gym.vector.utils.batch_space(self.single_action_space, self.num_envs)
+
+        # kinematics
+        chain = NOMINAL_ARM_CHAIN if cfg.chain_path is None else KinematicChain.load(cfg.chain_path)
+        self.kinematics = ArmKinematics(chain, self.device)
+        self.joint_names = chain.joint_names
+        num_joints = chain.num_joints
+        if num_joints != cfg.action_space:
+            raise ValueError(f"The chain has {num_joints} joints, the action space has {cfg.action_space}.")
+        self.env_origins = self._grid_origins(self.num_envs, cfg.env_spacing).to(self.device)
+
+        # reset offsets and termination bounds per joint
+        self._reset_pos_lower = torch.zeros(num_joints, device=self.device)
+        self._reset_pos_upper = torch.zeros(num_joints, device=self.device)
+        self._reset_vel_lower = torch.zeros(num_joints, device=self.device)
+        self._reset_vel_upper = torch.zeros(num_joints, device=self.device)
+        self._joint_lower = torch.full((num_joints,), -torch.inf, device=self.device)
+        self._joint_upper = torch.full((num_joints,), torch.inf, device=self.device)
+        for joint_names, position_range, velocity_range, bounds in (
+            (
+                cfg.reset_arm_joint_names,
+                cfg.reset_arm_position_range,
+                cfg.reset_arm_velocity_range,
+                cfg.arm_joint_bounds,
+            ),
+            (
+                cfg.reset_end_effector_joint_names,
+                cfg.reset_end_effector_position_range,
+                cfg.reset_end_effector_velocity_range,
+                cfg.end_effector_joint_bounds,
+            ),
+        ):
+            joint_ids = self.find_joints(joint_names)
+            self._reset_pos_lower[joint_ids], self._reset_pos_upper[joint_ids] = position_range
+            self._reset_vel_lower[joint_ids], self._reset_vel_upper[joint_ids] = velocity_range
+            self._joint_lower[joint_ids], self._joint_upper[joint_ids] = bounds
+        self._joint_vel_joint_ids = self.find_joints(cfg.joint_vel_joint_names)
+
+        # joint state (the default joint state is zero)
+        self.joint_pos = torch.zeros(self.num_envs, num_joints, device=self.device)
+        self.joint_vel = torch.zeros(self.num_envs, num_joints, device=self.device)
+        self.actions = torch.zeros(self.num_envs, cfg.action_space, device=self.device)
+        self.episode_length_buf = torch.zeros(self.num_envs, dtype=torch.long, device=self.device)
+        # targets (world frame)
+        self._target_base = self.env_origins + torch.tensor(cfg.target_init_pos, device=self.device)
+        self._target_lower = torch.tensor([low for low, _ in cfg.target_pos_range], device=self.device)
+        self._target_span = torch.tensor([high - low for low, high in cfg.target_pos_range], device=self.device)
+        self.target_pos = self._sample_targets(slice(None))
+
+        # shared per-step kinematics
+        self._ee_pos = torch.zeros(self.num_envs, 3, device=self.device)
+        self._distance = torch.zeros(self.num_envs, device=self.device)
+        # reward state
+        self._prev_distance = torch.zeros(self.num_envs, device=self.device)
+        self._has_prev = torch.zeros(self.num_envs, dtype=torch.bool, device=self.device)
+        self._stagnation_counter = torch.zeros(self.num_envs, device=self.device)
+        self._visits = torch.zeros(self.num_envs, cfg.exploration_num_buckets, dtype=torch.int32, device=self.device)
+        self._env_ids = torch.arange(self.num_envs, device=self.device)
+        self._curriculum_step = 0
+        # reward terms (unweighted), their weights (including the step dt) and episodic sums
+        self.reward_terms = torch.zeros(self.num_envs, len(REWARD_TERM_NAMES), device=self.device)
+        self._reward_weights = reach_task_reward_weights(cfg, self.step_dt, self.device)
+        self._episode_sums = torch.zeros_like(self.reward_terms)
+        # observation buffer: [joint_pos_rel, joint_vel_rel, end-effector position, target position]
+        self._obs_buf = torch.zeros(self.num_envs, cfg.observation_space, device=self.device)
+        self._obs_joint_pos = self._obs_buf[:, :num_joints]
+        self._obs_joint_vel = self._obs_buf[:, num_joints : 2 * num_joints]
+        self._obs_ee_pos = self._obs_buf[:, 2 * num_joints : 2 * num_joints + 3]
+        self._obs_target_pos = self._obs_buf[:, -3:]
+        self.extras = {}
+
+    def find_joints(self, name_keys: str) -> list[int]:
+        """Indices of the joints whose names match the regular expression."""
+        joint_ids = [i for i, name in enumerate(self.joint_names) if re.fullmatch(name_keys, name)]
+        if not joint_ids:
+            raise ValueError(f"No joint matches '{name_keys}' (joints: {self.joint_names}).")
+        return joint_ids
+
+    """
+    Operations.
+    """
+
+    def reset(self, seed: int | None = None, options: dict | None = None) -> tuple[dict, dict]:
+        """Reset all environments (the environments reset automatically at the end of their episodes)."""
+        if seed is not None:
+            torch.manual_seed(seed)
+        self._reset_idx(self._env_ids)
+        self._compute_observations(slice(None))
+        return {"policy": self._obs_buf}, self.extras
+
+    def step(self, action: torch.Tensor) -> tuple[dict, torch.Tensor, torch.Tensor, torch.Tensor, dict]:
+        """Step all environments (Isaac Lab's interface).
+
+        Returns:
+            The observations (``{"policy": ...}``, the buffer is overwritten on the next step), rewards,
+            terminations, time-outs (shape (num_envs,)) and extras.
+        """
+        rewards, terminated, time_outs = self._step(slice(None), action.to(self.device))
+        return {"policy": self._obs_buf}, rewards, terminated, time_outs, self.extras
+
+    def step_group(
+        self, env_ids: slice, actions: torch.Tensor
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, dict]:
+        """Step the environments ``env_ids`` (a contiguous slice) only.
+
+        The outputs follow the interface of skrl's environment wrappers
+        (:class:`arm.utils.interleaved.GroupedVecEnv`), which forward this method of the wrapped environment.
+
+        Returns:
+            The observations (shape (group_size, num_observations)), rewards, terminations and time-outs
+            (shape (group_size, 1)) of the group and its extras.
+        """
+        rewards, terminated, time_outs = self._step(env_ids, actions.to(self.device))
+        observations = self._obs_buf[env_ids]
+        return observations, rewards.unsqueeze(-1), terminated.unsqueeze(-1), time_outs.unsqueeze(-1), self.extras
+
+    def render(self):
+        return None
+
+    def close(self):
+        pass
+
+    """
+    Implementation.
+    """
+
+    def _step(self, env_ids: slice, actions: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        cfg = self.cfg
+        self.actions[env_ids] = actions
+        self._integrate(self.joint_pos[env_ids], self.joint_vel[env_ids], actions * cfg.action_scale)
+        episode_length = self.episode_length_buf[env_ids]
+        episode_length += 1
+        terminated, time_outs = self._get_dones(env_ids)
+        rewards = self._get_rewards(env_ids, terminated)
+        # the curriculum counts the steps of all environments (the last group completes a step)
+        if env_ids.stop in (None, self.num_envs):
+            self._curriculum_step += 1
+        # new episode extras (only logged if an episode ended)
+        self.extras = {"time_outs": time_outs}
+        reset_ids = (terminated | time_outs).nonzero(as_tuple=False).squeeze(-1)
+        if len(reset_ids) > 0:
+            self._reset_idx(reset_ids + (env_ids.start or 0))
+        self._compute_observations(env_ids)
+        return rewards, terminated, time_outs
+
+    def _integrate(self, joint_pos: torch.Tensor, joint_vel: torch.Tensor, efforts: torch.Tensor):
+        """Integrate the joint dynamics over the decimation (semi-implicit Euler, implicit damping), in place.
+
+        The drive efforts (PD towards the default joint positions plus the effort actions) are clipped to the effort
+        limit and the joint velocities to the velocity limit, as for the implicit actuators of the asset.
+        """
+        cfg = self.cfg
+        dt = self.physics_dt
+        damping = 1.0 + dt * cfg.damping / cfg.joint_inertia
+        for _ in range(cfg.decimation):
+            drive = torch.add(efforts, joint_pos, alpha=-cfg.stiffness).clamp_(-cfg.effort_limit, cfg.effort_limit)
+            joint_vel.add_(drive, alpha=dt / cfg.joint_inertia).div_(damping)
+            joint_vel.clamp_(-cfg.velocity_limit, cfg.velocity_limit)
+            joint_pos.add_(joint_vel, alpha=dt)
+            torch.clamp(joint_pos, self.kinematics.lower_limits, self.kinematics.upper_limits, out=joint_pos)
+
+    def _get_dones(self, env_ids: slice) -> tuple[torch.Tensor, torch.Tensor]:
+        joint_pos = self.joint_pos[env_ids]
+        # shared kinematics of the step
+        ee_pos = self._ee_pos[env_ids]
+        torch.add(self.kinematics.end_effector_positions(joint_pos), self.env_origins[env_ids], out=ee_pos)
+        torch.linalg.vector_norm(ee_pos - self.target_pos[env_ids], dim=1, out=self._distance[env_ids])
+        # time out and manual joint limits
+        time_out = self.episode_length_buf[env_ids] >= self.max_episode_length
+        out_of_bounds = torch.any((joint_pos < self._joint_lower) | (joint_pos > self._joint_upper), dim=1)
+        return out_of_bounds, time_out
+
+    def _get_rewards(self, env_ids: slice, terminated: torch.Tensor) -> torch.Tensor:
+        cfg = self.cfg
+        terms = self.reward_terms[env_ids]
+        joint_vel = self.joint_vel[env_ids]
+        # all terms (the exploration voxels are hashed in the env frame), with curriculum of the success threshold
+        reached = reach_task_reward_terms(
+            terms,
+            terminated,
+            self._distance[env_ids],
+            self._ee_pos[env_ids] - self.env_origins[env_ids],
+            joint_vel,
+            joint_vel[:, self._joint_vel_joint_ids],
+            self._prev_distance[env_ids],
+            self._has_prev[env_ids],
+            self._stagnation_counter[env_ids],
+            self._visits[env_ids],
+            success_threshold(cfg, self._curriculum_step),
+            cfg.success_bonus,
+            cfg.exploration_voxel_size,
+        )
+        # respawn the targets of the successful envs (after all terms used the current targets)
+        target_pos = self.target_pos[env_ids]
+        torch.where(reached.unsqueeze(-1), self._sample_targets(env_ids), target_pos, out=target_pos)
+        # weighted sum
+        self._episode_sums[env_ids].addcmul_(terms, self._reward_weights)
+        return torch.mv(terms, self._reward_weights)
+
+    def _reset_idx(self, env_ids: torch.Tensor):
+        self.episode_length_buf[env_ids] = 0
+        # log the episodic sums of the reward terms (same convention as the reward manager)
+        episode_sums = torch.mean(self._episode_sums[env_ids], dim=0) / self.max_episode_length_s
+        self.extras["log"] = {
+            f"Episode_Reward/{name}": value for name, value in zip(REWARD_TERM_NAMES, episode_sums.unbind())
+        }
+        self._episode_sums[env_ids] = 0.0
+        # reward state
+        self._has_prev[env_ids] = False
+        self._stagnation_counter[env_ids] = 0.0
+        self._visits[env_ids] = 0
+
+        # joint state: default state (zero) plus uniform offsets, clamped to the joint limits
+        offsets = torch.rand(len(env_ids), self.kinematics.num_joints, device=self.device)
+        joint_pos = self._reset_pos_lower + offsets * (self._reset_pos_upper - self._reset_pos_lower)
+        self.joint_pos[env_ids] = joint_pos.clamp_(self.kinematics.lower_limits, self.kinematics.upper_limits)
+        offsets.uniform_()
+        self.joint_vel[env_ids] = self._reset_vel_lower + offsets * (self._reset_vel_upper - self._reset_vel_lower)
+        self._ee_pos[env_ids] = self.env_origins[env_ids] + self.kinematics.end_effector_positions(joint_pos)
+
+    def _compute_observations(self, env_ids: slice):
+        # note: the default joint state is zero, the relative joint state is the joint state
+        self._obs_joint_pos[env_ids] = self.joint_pos[env_ids]
+        self._obs_joint_vel[env_ids] = self.joint_vel[env_ids]
+        self._obs_ee_pos[env_ids] = self._ee_pos[env_ids]
+        self._obs_target_pos[env_ids] = self.target_pos[env_ids]
+
+    def _sample_targets(self, env_ids: slice) -> torch.Tensor:
+        """Sample target positions (world frame) uniformly around the default target positions."""
+        base = self._target_base[env_ids]
+        return torch.rand_like(base).mul_(self._target_span).add_(self._target_lower).add_(base)
+
+    @staticmethod
+    def _grid_origins(num_envs: int, spacing: float) -> torch.Tensor:
+        """Env origins on a centered grid (as the default env origins of Isaac Lab's interactive scenes)."""
+        num_rows = math.ceil(num_envs / int(math.sqrt(num_envs)))
+        num_cols = math.ceil(num_envs / num_rows)
+        rows, cols = torch.meshgrid(torch.arange(num_rows), torch.arange(num_cols), indexing="ij")
+        origins = torch.zeros(num_envs, 3)
+        origins[:, 0] = -(rows.flatten()[:num_envs] - (num_rows - 1) / 2) * spacing
+        origins[:, 1] = (cols.flatten()[:num_envs] - (num_cols - 1) / 2) * spacing
+        return origins
@@ -0,0 +1,81 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import math
+import os
+from dataclasses import dataclass
+
+
+@dataclass
+class KinematicArmEnvCfg:
+    """Configuration of the kinematic surrogate of the arm reach task.
+
+    The spaces, timing, resets, terminations and reward weights default to the ones of the direct-workflow task
+    (:class:`arm.tasks.direct.arm.arm_env_cfg.ArmEnvCfg`, which requires Isaac Lab and is therefore mirrored here).
+    The joint dynamics parameters are the ones of the actuators of the asset, except for the joint inertia, which is
+    a parameter of the surrogate.
+    """
+
+    # env
+    num_envs: int = int(os.getenv("NUM_ENVS", "2048"))
+    device: str = "cpu"
+    seed: int | None = None
+    decimation: int = 2
+    sim_dt: float = 1 / 120
+    episode_length_s: float = float(os.getenv("EPISODE_LENGTH_S", "20"))
+    env_spacing: float = 2.0
+    # - spaces definition: joint efforts of joint_[1-8] /
+    #   [joint_pos_rel (8), joint_vel_rel (8), end-effector position (3), target position (3)]
+    action_space: int = 8
+    observation_space: int = 22
+
+    # robot: kinematic chain (the asset or its JSON export; None: nominal chain of arm.utils.kinematics)
+    chain_path: str | None = os.getenv("ARM_CHAIN_JSON") or None
+    action_scale: float = 100.0
+    # - joint dynamics: implicit PD drive towards the default joint positions plus the effort actions
+    effort_limit: float = 15.0
+    velocity_limit: float = 2.0
+    stiffness: float = 80.0
+    damping: float = 15.0
+    joint_inertia: float = 0.05
+
+    # target: default position w.r.t. the env origin and range of the offsets (as TARGET_POS_RANGE)
+    target_init_pos: tuple[float, float, float] = (0.0, 0.0, 0.2)
+    target_pos_range: tuple[tuple[float, float], ...] = ((-0.3, 0.3), (-0.3, 0.3), (0.1, 0.3))
+
+    # reset: joint position offsets (and velocity ranges) w.r.t. the default joint state
+    reset_arm_joint_names: str = "joint_[2-7]"
+    reset_arm_position_range: tuple[float, float] = (-math.pi / 4, math.pi / 4)
+    reset_arm_velocity_range: tuple[float, float] = (-0.001, 0.001)
+    reset_end_effector_joint_names: str = "joint_(1|8)"
+    reset_end_effector_position_range: tuple[float, float] = (math.pi / 2, math.pi)
+    reset_end_effector_velocity_range: tuple[float, float] = (-0.0001, 0.0001)
+
+    # terminations: manual joint position limits
+    arm_joint_bounds: tuple[float, float] = (-3.0 * math.pi, 3.0 * math.pi)
+    end_effector_joint_bounds: tuple[float, float] = (-math.pi, 3.0 * math.pi)
+
+    # reward scales
+    rew_scale_alive: float = float(os.getenv("REWARD_ALIVE", "1.0"))
+    rew_scale_terminated: float = float(os.getenv("REWARD_TERMINATING", "-5.0"))
+    rew_scale_end_effector_position: float = float(os.getenv("REWARD_END_EFFECTOR_POSITION", "-0.1"))
+    rew_scale_target_reached: float = float(os.getenv("REWARD_TARGET_REACHED", "20.0"))
+    rew_scale_distance_guidance: float = float(os.getenv("REWARD_DISTANCE_GUIDANCE", "2.0"))
+    rew_scale_approach_progress: float = float(os.getenv("REWARD_APPROACH_PROGRESS", "1.0"))
+    rew_scale_joint_velocity: float = float(os.getenv("REWARD_JOINT_VELOCITY", "0.1"))
+    rew_scale_exploration: float = float(os.getenv("REWARD_EXPLORATION", "0.05"))
+    rew_scale_anti_stagnation: float = float(os.getenv("REWARD_ANTI_STAGNATION", "0.2"))
+    rew_scale_joint_vel: float = float(os.getenv("REWARD_JOINT_VEL", "-0.00005"))
+    rew_scale_joint_vel_smooth: float = float(os.getenv("REWARD_JOINT_VEL_SMOOTH", "-0.0001"))
+
+    # reward parameters
+    joint_vel_joint_names: str = "joint_[1-8]"
+    """Joints of the ``joint_vel`` and ``joint_vel_smooth`` penalties (as in the manager-based task)."""
+    success_bonus: float = 300.0
+    success_thresholds: tuple[tuple[int, float], ...] = ((20000, 0.08), (40000, 0.05), (60000, 0.03))
+    """Curriculum of the success threshold: (until step, threshold) pairs."""
+    success_threshold_final: float = 0.02
+    exploration_voxel_size: float = 0.05
+    exploration_num_buckets: int = 4096
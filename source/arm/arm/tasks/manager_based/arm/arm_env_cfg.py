@@ -149,7 +149,7 @@ class EventCfg:
     # 训练启动时初始化目标位置（仅执行一次）
     initialize_target_position = EventTerm(
         func=mdp.initialize_target_position_on_startup,
-        mode="reset",  # 在环境重置时执行，但函数内部会确保只在第一次执行
+        mode="startup",  # 仅在环境创建时执行一次；之后目标只在到达时由目标队列更新
         params={
             "target_cfg": SceneEntityCfg("target_marker"),
         },
@@ -196,6 +196,26 @@ class EventCfg:
         },
     )
 
+    # 训练监控（不参与奖励计算）：每 MONITOR_SAMPLE_INTERVAL 步在设备上累计统计，
+    # 每 MONITOR_INTERVAL 步输出到 TensorBoard/JSONL
+    training_monitor = EventTerm(
+        func=mdp.training_monitor,
+        mode="interval",
+        interval_range_s=(0.0, 0.0),  # 每个环境步都调用（非采样步直接返回）
+        is_global_time=True,
+        params={
+            "asset_cfg": SceneEntityCfg("robot"),
+            "target_cfg": SceneEntityCfg("target_marker"),
+            "body_name": "arm_end",
+            "joint_bounds": {
+                "joint_[2-7]": (-3.0 * math.pi, 3.0 * math.pi),  # 主要关节
+                "joint_(1|8)": (-math.pi, 3.0 * math.pi),  # 末端执行器关节
+            },
+            "sample_interval": max(int(os.getenv("MONITOR_SAMPLE_INTERVAL", "10")), 1),
+            "emit_interval": max(int(os.getenv("MONITOR_INTERVAL", "1000")), 1),
+        },
+    )
+
     # 更新目标标记位置的事件
     # update_target_marker = EventTerm(
     #     func=mdp.update_target_on_reach,
@@ -265,24 +285,6 @@ class RewardsCfg:
             "body_name": "arm_end"
         },
     )
-    # (3.4) Convergence monitoring (weight=0, just for monitoring)
-    convergence_monitor = RewTerm(
-        func=mdp.convergence_monitor,
-        weight=0.0,
-        params={
-            "asset_cfg": SceneEntityCfg("robot"),
-            "target_cfg": SceneEntityCfg("target_marker"),
-            "body_name": "arm_end"
-        },
-    )
-    # (3.5) Termination monitoring (weight=0, just for debugging)
-    termination_debug = RewTerm(
-        func=mdp.termination_monitor,
-        weight=0.0,
-        params={
-            "asset_cfg": SceneEntityCfg("robot"),
-        },
-    )
     # (4) Collision detection and notification
     # collision_detection = RewTerm(
     #     func=mdp.end_effector_target_collision_detection,
@@ -360,6 +362,116 @@ class TerminationsCfg:
     )
 
 
+def fuse_reach_rewards(rewards: RewardsCfg):
+    """Replace the stateless reach/velocity reward terms by a single :class:`mdp.fused_reach_reward` term.
+
+    Only enabled terms (non-zero weight) are fused. The reach terms must share the robot, target and body,
+    and the ``joint_vel_l1`` terms must share the joints, otherwise they are kept as separate terms. The
+    ``joint_velocity_reward`` term always uses all joints of the robot, same as the separate term.
+
+    The fused term is evaluated after all other terms. Reach terms placed before a ``target_reached_bonus`` term
+    (which respawns the reached targets) are kept as separate terms, so that they still see the distance to the
+    target before the respawn.
+    """
+    fused_kinds = {
+        mdp.end_effector_position_to_marker_l2: "end_effector_distance",
+        mdp.distance_guidance_reward: "distance_guidance",
+        mdp.approach_progress_reward: "approach_progress",
+        mdp.joint_velocity_reward: "joint_velocity",
+        mdp.joint_vel_l1: "joint_vel_l1",
+    }
+    term_cfgs = [(name, term_cfg) for name, term_cfg in rewards.__dict__.items() if isinstance(term_cfg, RewTerm)]
+    # the reach terms before the last target respawn must keep their slot
+    first_reach_index = 0
+    for index, (_, term_cfg) in enumerate(term_cfgs):
+        if term_cfg.func is mdp.target_reached_bonus and term_cfg.weight != 0.0:
+            first_reach_index = index + 1
+    terms = {}
+    reach_params = None
+    joint_asset_cfg = None
+    for index, (name, term_cfg) in enumerate(term_cfgs):
+        if term_cfg.func not in fused_kinds or term_cfg.weight == 0.0:
+            continue
+        kind = fused_kinds[term_cfg.func]
+        if kind in ("end_effector_distance", "distance_guidance", "approach_progress"):
+            if index < first_reach_index:
+                continue
+            params = (term_cfg.params["asset_cfg"], term_cfg.params["target_cfg"], term_cfg.params["body_name"])
+            if reach_params is not None and params != reach_params:
+                continue
+            reach_params = params
+        elif kind == "joint_vel_l1":
+            if joint_asset_cfg is not None and term_cfg.params["asset_cfg"].joint_names != joint_asset_cfg.joint_names:
+                continue
+            joint_asset_cfg = term_cfg.params["asset_cfg"]
+        terms[name] = (kind, term_cfg.weight)
+        setattr(rewards, name, None)
+    if not terms:
+        return
+    # defaults for the parameters that no fused term provided
+    if reach_params is None:
+        reach_params = (SceneEntityCfg("robot"), SceneEntityCfg("target_marker"), "arm_end")
+    if joint_asset_cfg is None:
+        joint_asset_cfg = SceneEntityCfg("robot", joint_names=[".*"])
+    rewards.fused_reach = RewTerm(
+        func=mdp.fused_reach_reward,
+        weight=1.0,
+        params={
+            "asset_cfg": reach_params[0],
+            "target_cfg": reach_params[1],
+            "body_name": reach_params[2],
+            "joint_asset_cfg": joint_asset_cfg,
+            "terms": terms,
+        },
+    )
+
+
+def fuse_policy_observations(policy: ObsGroup):
+    """Replace the terms of the policy group by a single :class:`mdp.policy_observations` term.
+
+    The fused term keeps the layout of the separate terms (joint positions, joint velocities, end-effector
+    position, target position), so that policies trained with either variant can be loaded by the other.
+    """
+    # rigid object target (root_pos_w term) or physics-free target (target_position term)
+    target_params = policy.target_position.params
+    target_cfg = target_params["target_cfg"] if "target_cfg" in target_params else target_params["asset_cfg"]
+    policy.policy_obs = ObsTerm(
+        func=mdp.policy_observations,
+        params={
+            "asset_cfg": policy.end_effector_pos.params["asset_cfg"],
+            "target_cfg": target_cfg,
+        },
+    )
+    policy.joint_pos_rel = None
+    policy.joint_vel_rel = None
+    policy.end_effector_pos = None
+    policy.target_position = None
+
+
+def use_physics_free_target(env_cfg: ManagerBasedRLEnvCfg):
+    """Replace the ``target_marker`` rigid object by a physics-free target.
+
+    The target marker is removed from the scene and every term parameter that references it is replaced by a
+    :class:`mdp.TargetCfg` with the same name and default position. The target positions then only live in the
+    target scheduler of the task and are shown with visualization markers when rendering.
+    """
+    target_cfg = mdp.TargetCfg(name="target_marker", init_pos=env_cfg.scene.target_marker.init_state.pos)
+    env_cfg.scene.target_marker = None
+    # the target position observation reads the positions tensor
+    policy = env_cfg.observations.policy
+    if policy.target_position is not None:
+        policy.target_position = ObsTerm(func=mdp.target_position, params={"target_cfg": target_cfg})
+    # all other terms keep their function, only the target parameter changes
+    for group_cfg in (env_cfg.rewards, env_cfg.events, env_cfg.terminations, policy):
+        for term_cfg in group_cfg.__dict__.values():
+            params = getattr(term_cfg, "params", None)
+            if not params:
+                continue
+            for key, value in params.items():
+                if isinstance(value, SceneEntityCfg) and value.name == target_cfg.name:
+                    params[key] = target_cfg
+
+
 ##
 # Environment configuration
 ##
@@ -388,4 +500,16 @@ class ArmEnvCfg(ManagerBasedRLEnvCfg):
         self.viewer.eye = (8.0, 5.0, 5.0)
         # simulation settings
         self.sim.dt = 1 / 120
-        self.sim.render_interval = self.decimation
\ No newline at end of file
+        self.sim.render_interval = self.decimation
+        # disable the training monitor (MONITOR_INTERVAL=0)
+        if int(os.getenv("MONITOR_INTERVAL", "1000")) <= 0:
+            self.events.training_monitor = None
+        # keep the target as a per-env tensor instead of a rigid object in the scene (opt-in)
+        if os.getenv("TARGET_MODE", "rigid") == "tensor":
+            use_physics_free_target(self)
+        # write the policy observations into a single preallocated buffer (opt-in)
+        if os.getenv("FUSED_OBSERVATIONS", "0") == "1":
+            fuse_policy_observations(self.observations.policy)
+        # fuse the stateless reach/velocity reward terms into a single scripted kernel (opt-in)
+        if os.getenv("FUSED_REWARDS", "0") == "1":
+            fuse_reach_rewards(self.rewards)
\ No newline at end of file
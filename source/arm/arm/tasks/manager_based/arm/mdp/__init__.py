@@ -10,3 +10,5 @@ from isaaclab.envs.mdp import *  # noqa: F401, F403
 from .observations import *  # noqa: F401, F403
 from .rewards import *  # noqa: F401, F403
 from .events import *  # noqa: F401, F403
+from .monitoring import *  # noqa: F401, F403
+from .targets import *  # noqa: F401, F403
@@ -0,0 +1,89 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Per-step end-effector/target kinematics shared by the reach reward terms."""
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+from isaaclab.assets import Articulation
+from isaaclab.managers import SceneEntityCfg
+
+from .targets import TargetCfg, target_pos_w
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+
+class ReachKinematics:
+    """End-effector position, target position, their difference and distance for one env step.
+
+    The body index of the end-effector is resolved once on construction. The quantities are recomputed at most
+    once per env step (keyed by ``env.common_step_counter``), so that all reach terms of a step share a single
+    lookup and a single norm kernel.
+    """
+
+    def __init__(
+        self, env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg, target_cfg: SceneEntityCfg | TargetCfg, body_name: str
+    ):
+        self._env = env
+        self._asset: Articulation = env.scene[asset_cfg.name]
+        self._target_cfg = target_cfg
+        # resolve the end-effector body once (fall back to the root if the body does not exist)
+        try:
+            self._body_idx = self._asset.find_bodies(body_name)[0][0]
+        except (ValueError, IndexError):
+            print(f"Warning: Body '{body_name}' not found, using root position")
+            self._body_idx = None
+        # step at which the cached quantities were computed
+        self._step = None
+        # cached quantities - shape: (num_envs, 3) / (num_envs,)
+        # note: the difference and distance are written into preallocated buffers, consumers that keep them
+        #   across steps must copy them.
+        self.ee_pos: torch.Tensor
+        self.target_pos: torch.Tensor
+        self.delta = torch.zeros(env.num_envs, 3, device=env.device)
+        self.distance = torch.zeros(env.num_envs, device=env.device)
+
+    def update(self) -> ReachKinematics:
+        """Recompute the cached quantities if they are stale for the current env step."""
+        step = getattr(self._env, "common_step_counter", None)
+        if step is None or step != self._step:
+            if self._body_idx is None:
+                self.ee_pos = self._asset.data.root_pos_w[:, :3]
+            else:
+                self.ee_pos = self._asset.data.body_pos_w[:, self._body_idx, :3]
+            self.target_pos = target_pos_w(self._env, self._target_cfg)
+            torch.sub(self.ee_pos, self.target_pos, out=self.delta)
+            torch.linalg.vector_norm(self.delta, dim=1, out=self.distance)
+            self._step = step
+        return self
+
+    def invalidate(self):
+        """Mark the cached quantities as stale (e.g. after the target was moved)."""
+        self._step = None
+
+
+def reach_kinematics(
+    env: ManagerBasedRLEnv,
+    asset_cfg: SceneEntityCfg,
+    target_cfg: SceneEntityCfg | TargetCfg,
+    body_name: str = "arm_end",
+) -> ReachKinematics:
+    """Get the (up-to-date) reach kinematics of the given end-effector and target for the current env step."""
+    if not hasattr(env, "_reach_kinematics"):
+        env._reach_kinematics = {}
+    key = (asset_cfg.name, target_cfg.name, body_name)
+    if key not in env._reach_kinematics:
+        env._reach_kinematics[key] = ReachKinematics(env, asset_cfg, target_cfg, body_name)
+    return env._reach_kinematics[key].update()
+
+
+def invalidate_reach_kinematics(env: ManagerBasedRLEnv):
+    """Invalidate all cached reach kinematics of the environment."""
+    for kinematics in getattr(env, "_reach_kinematics", {}).values():
+        kinematics.invalidate()
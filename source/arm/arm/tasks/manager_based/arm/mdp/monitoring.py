@@ -0,0 +1,142 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Training monitor of the reach task.
+
+The monitor replaces the zero-weight monitoring reward terms. It is registered as an ``"interval"`` event that
+samples its statistics every ``sample_interval`` env steps, accumulates them on the device and only transfers them
+to the host every ``emit_interval`` env steps.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import torch
+from typing import TYPE_CHECKING
+
+from isaaclab.assets import Articulation
+from isaaclab.managers import EventTermCfg, ManagerTermBase, SceneEntityCfg
+
+from .kinematics import reach_kinematics
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+
+class training_monitor(ManagerTermBase):
+    """Sample convergence and joint-bound statistics of the training.
+
+    Every ``sample_interval`` env steps, the number of environments within 5cm/10cm of the target, the sum of the
+    distances and the number of environments violating the bounds of every monitored joint are added to device
+    accumulators (no host synchronization). Every ``emit_interval`` env steps, the accumulated statistics are
+    averaged over the sampled steps and environments and emitted as:
+
+    * scalar tensors ``Monitor/<name>`` in ``env.extras["log"]`` (written to TensorBoard by the agent), and
+    * one JSON line appended to ``jsonl_path`` (if given).
+
+    The term must be configured with ``mode="interval"``, ``is_global_time=True`` and
+    ``interval_range_s=(0.0, 0.0)`` so that it is called on every env step; the steps between two samples
+    return right away.
+    """
+
+    def __init__(self, cfg: EventTermCfg, env: ManagerBasedRLEnv):
+        super().__init__(cfg, env)
+        asset: Articulation = env.scene[cfg.params["asset_cfg"].name]
+        # resolve the monitored joints and their bounds once
+        joint_ids, joint_names, lower, upper = [], [], [], []
+        for name_expr, (low, high) in cfg.params["joint_bounds"].items():
+            ids, names = asset.find_joints(name_expr, preserve_order=True)
+            joint_ids += ids
+            joint_names += names
+            lower += [low] * len(ids)
+            upper += [high] * len(ids)
+        self._joint_ids = torch.tensor(joint_ids, device=env.device, dtype=torch.long)
+        self._joint_names = joint_names
+        self._joint_lower = torch.tensor(lower, device=env.device)
+        self._joint_upper = torch.tensor(upper, device=env.device)
+        # device accumulators: [success count, close count, violations of every monitored joint] and distance sum
+        self._counts = torch.zeros(2 + len(joint_ids), device=env.device, dtype=torch.long)
+        self._distance_sum = torch.zeros(1, device=env.device, dtype=torch.float64)
+        self._num_samples = 0
+        self._num_steps = 0
+
+    def __call__(
+        self,
+        env: ManagerBasedRLEnv,
+        env_ids: torch.Tensor | None,
+        asset_cfg: SceneEntityCfg,
+        target_cfg: SceneEntityCfg,
+        joint_bounds: dict[str, tuple[float, float]],
+        body_name: str = "arm_end",
+        success_threshold: float = 0.05,
+        close_threshold: float = 0.1,
+        sample_interval: int = 10,
+        emit_interval: int = 1000,
+        jsonl_path: str | None = None,
+    ):
+        # only sample every ``sample_interval`` steps
+        self._num_steps += 1
+        if self._num_steps % sample_interval != 0:
+            return
+        # accumulate the statistics of the current step on the device
+        distance = reach_kinematics(env, asset_cfg, target_cfg, body_name).distance
+        joint_pos = env.scene[asset_cfg.name].data.joint_pos[:, self._joint_ids]
+        self._counts[0].add_(torch.sum(distance < success_threshold))
+        self._counts[1].add_(torch.sum(distance < close_threshold))
+        self._counts[2:].add_(torch.sum((joint_pos < self._joint_lower) | (joint_pos > self._joint_upper), dim=0))
+        self._distance_sum.add_(torch.sum(distance, dtype=torch.float64))
+        self._num_samples += 1
+        # emit the averaged statistics
+        if self._num_samples * sample_interval >= emit_interval:
+            self._emit(env, jsonl_path)
+
+    def _emit(self, env: ManagerBasedRLEnv, jsonl_path: str | None):
+        """Average the accumulated statistics, write them out and reset the accumulators."""
+        # single host synchronization per emission
+        values = torch.cat([self._counts.double(), self._distance_sum]).tolist()
+        num_samples = self._num_samples * env.num_envs
+        success_rate = values[0] / num_samples
+        close_rate = values[1] / num_samples
+        violation_rates = {name: count / num_samples for name, count in zip(self._joint_names, values[2:-1])}
+        stats = {
+            "success_rate": success_rate,
+            "close_rate": close_rate,
+            "mean_distance": values[-1] / num_samples,
+            "joint_bound_violation_rate": sum(violation_rates.values()),
+        }
+        # -- tensorboard (through the agent's environment info logging)
+        log = env.extras.setdefault("log", dict())
+        for name, value in stats.items():
+            log[f"Monitor/{name}"] = torch.tensor(value)
+        for name, value in violation_rates.items():
+            log[f"Monitor/joint_bound_violation_rate/{name}"] = torch.tensor(value)
+        # -- jsonl
+        if jsonl_path:
+            record = {
+                "step": env.common_step_counter,
+                "num_samples": self._num_samples,
+                **stats,
+                "status": _convergence_status(success_rate, close_rate),
+                "joint_bound_violation_rates": violation_rates,
+            }
+            os.makedirs(os.path.dirname(os.path.abspath(jsonl_path)), exist_ok=True)
+            with open(jsonl_path, "a") as f:
+                f.write(json.dumps(record) + "\n")
+        # reset the accumulators
+        self._counts.zero_()
+        self._distance_sum.zero_()
+        self._num_samples = 0
+
+
+def _convergence_status(success_rate: float, close_rate: float) -> str:
+    """Coarse convergence status (the criteria of the former convergence monitor)."""
+    if success_rate >= 0.8:
+        return "converged"
+    if success_rate >= 0.5:
+        return "near_convergence"
+    if close_rate >= 0.3:
+        return "progressing"
+    return "training"
@@ -9,49 +9,34 @@ import torch
 from typing import TYPE_CHECKING
 
 from isaaclab.assets import Articulation
-from isaaclab.managers import SceneEntityCfg
+from isaaclab.managers import ManagerTermBase, ObservationTermCfg, SceneEntityCfg
+
+from .targets import TargetCfg, target_pos_w
 
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedRLEnv
 
 
-def body_pos_w(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg) -> torch.Tensor:
-    """Get the position of the specified body in world frame."""
-    # extract the used quantities (to enable type-hinting)
-    asset: Articulation = env.scene[asset_cfg.name]
-    
-    # Get body indices - find_bodies expects individual body names, not a list
-    # asset_cfg.body_names is a list, so we need to handle each body name
-    if len(asset_cfg.body_names) == 1:
-        # Single body case
-        body_name = asset_cfg.body_names[0]
-        body_indices = asset.find_bodies(body_name)
-        # Get body position and ensure shape is (num_envs, 3)
-        body_positions = asset.data.body_pos_w[:, body_indices[0], :3]
-        
-        # Remove extra dimensions if present: (num_envs, 1, 3) -> (num_envs, 3)
-        if body_positions.dim() == 3 and body_positions.shape[1] == 1:
-            body_positions = body_positions.squeeze(1)
-        # If somehow we get (3,) instead of (num_envs, 3), expand it
-        elif body_positions.dim() == 1 and body_positions.shape[0] == 3:
-            # Get the actual number of environments from the asset data
-            num_envs = asset.data.body_pos_w.shape[0]
-            body_positions = body_positions.unsqueeze(0).expand(num_envs, -1)
-            
-    else:
-        # Multiple bodies case
-        all_positions = []
-        for body_name in asset_cfg.body_names:
-            body_indices = asset.find_bodies(body_name)
-            body_pos = asset.data.body_pos_w[:, body_indices[0], :3]
-            # Remove extra dimensions if present: (num_envs, 1, 3) -> (num_envs, 3)
-            if body_pos.dim() == 3 and body_pos.shape[1] == 1:
-                body_pos = body_pos.squeeze(1)
-            all_positions.append(body_pos)
-        # Concatenate along the last dimension: (num_envs, num_bodies * 3)
-        body_positions = torch.cat(all_positions, dim=-1)
-    
-    return body_positions
+class body_pos_w(ManagerTermBase):
+    """Get the position of the specified bodies in world frame.
+
+    The indices of the bodies in ``asset_cfg.body_names`` are resolved once (in the given order) into a device
+    index tensor. The observation of shape (num_envs, num_bodies * 3) is then produced by a single gather and a
+    reshape, independent of the number of bodies.
+    """
+
+    def __init__(self, cfg: ObservationTermCfg, env: ManagerBasedRLEnv):
+        super().__init__(cfg, env)
+        asset_cfg: SceneEntityCfg = cfg.params["asset_cfg"]
+        asset: Articulation = env.scene[asset_cfg.name]
+        body_ids, _ = asset.find_bodies(asset_cfg.body_names, preserve_order=True)
+        self._body_ids = torch.tensor(body_ids, dtype=torch.long, device=self.device)
+
+    def __call__(self, env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg) -> torch.Tensor:
+        # extract the used quantities (to enable type-hinting)
+        asset: Articulation = env.scene[asset_cfg.name]
+        # gather the positions of all bodies: (num_envs, num_bodies, 3) -> (num_envs, num_bodies * 3)
+        return asset.data.body_pos_w[:, self._body_ids].reshape(self.num_envs, -1)
 
 
 def root_pos_w(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg) -> torch.Tensor:
@@ -62,4 +47,49 @@ def root_pos_w(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg) -> torch.Tenso
     # Get root position in world frame - shape: (num_envs, 3)
     root_position = asset.data.root_pos_w[:, :3]
     
-    return root_position 
\ No newline at end of file
+    return root_position 
+
+
+def target_position(env: ManagerBasedRLEnv, target_cfg: SceneEntityCfg | TargetCfg) -> torch.Tensor:
+    """Get the position of the target in world frame (rigid object or physics-free target)."""
+    # shape: (num_envs, 3)
+    return target_pos_w(env, target_cfg)
+
+
+class policy_observations(ManagerTermBase):
+    """Policy observation vector written into a persistent buffer.
+
+    The layout is the same as the separate ``joint_pos_rel``, ``joint_vel_rel``, ``body_pos_w`` and ``root_pos_w``
+    terms of the policy group: ``[joint_pos_rel (J), joint_vel_rel (J), body positions (3 * B), target position
+    (3)]``. Every quantity is written in place into its slice of a preallocated (num_envs, 2 * J + 3 * B + 3)
+    buffer, so that no intermediate tensors are allocated. The returned buffer is overwritten on the next call.
+    """
+
+    def __init__(self, cfg: ObservationTermCfg, env: ManagerBasedRLEnv):
+        super().__init__(cfg, env)
+        asset_cfg: SceneEntityCfg = cfg.params["asset_cfg"]
+        asset: Articulation = env.scene[asset_cfg.name]
+        body_ids, _ = asset.find_bodies(asset_cfg.body_names, preserve_order=True)
+        self._body_ids = torch.tensor(body_ids, dtype=torch.long, device=self.device)
+        # persistent buffer and its slices
+        num_joints = asset.num_joints
+        num_bodies = len(body_ids)
+        self._buffer = torch.zeros(self.num_envs, 2 * num_joints + 3 * num_bodies + 3, device=self.device)
+        self._joint_pos_rel = self._buffer[:, :num_joints]
+        self._joint_vel_rel = self._buffer[:, num_joints : 2 * num_joints]
+        self._body_pos = self._buffer[:, 2 * num_joints : 2 * num_joints + 3 * num_bodies].view(
+            self.num_envs, num_bodies, 3
+        )
+        self._target_pos = self._buffer[:, -3:]
+
+    def __call__(
+        self, env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg, target_cfg: SceneEntityCfg | TargetCfg
+    ) -> torch.Tensor:
+        # extract the used quantities (to enable type-hinting)
+        asset: Articulation = env.scene[asset_cfg.name]
+        # write all quantities into their slices
+        torch.sub(asset.data.joint_pos, asset.data.default_joint_pos, out=self._joint_pos_rel)
+        torch.sub(asset.data.joint_vel, asset.data.default_joint_vel, out=self._joint_vel_rel)
+        torch.index_select(asset.data.body_pos_w, 1, self._body_ids, out=self._body_pos)
+        self._target_pos.copy_(target_pos_w(env, target_cfg))
+        return self._buffer
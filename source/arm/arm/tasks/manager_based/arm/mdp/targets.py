@@ -0,0 +1,182 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Target positions of the reach task.
+
+The target is either a kinematic rigid object of the scene (referenced by a :class:`SceneEntityCfg`) or a
+physics-free per-env position tensor owned by the task (referenced by a :class:`TargetCfg`). In both cases, the
+positions are sampled and advanced by the :class:`TargetScheduler` of the environment.
+"""
+
+from __future__ import annotations
+
+import torch
+from dataclasses import MISSING
+from typing import TYPE_CHECKING
+
+import isaaclab.sim as sim_utils
+from isaaclab.assets import RigidObject
+from isaaclab.managers import SceneEntityCfg
+from isaaclab.markers import VisualizationMarkers, VisualizationMarkersCfg
+from isaaclab.utils import configclass
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+TARGET_POS_RANGE = ((-0.3, 0.3), (-0.3, 0.3), (0.1, 0.3))
+"""Default range of the target positions (x, y, z) w.r.t. the default target position of an env (in m)."""
+
+
+@configclass
+class TargetCfg:
+    """Configuration of a physics-free target.
+
+    The target only exists as a per-env position tensor of the :class:`TargetScheduler`. It is not part of the
+    scene (no physics body); when the simulation is rendered, it is shown with visualization markers.
+    """
+
+    name: str = MISSING
+    """Name of the target (key of the scheduler)."""
+
+    init_pos: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    """Default position of the target w.r.t. the env origin (in m)."""
+
+    visualizer_cfg: VisualizationMarkersCfg = VisualizationMarkersCfg(
+        prim_path="/Visuals/Target",
+        markers={
+            "sphere": sim_utils.SphereCfg(
+                radius=0.05,
+                visual_material=sim_utils.PreviewSurfaceCfg(diffuse_color=(1.0, 0.0, 0.0)),
+            ),
+        },
+    )
+    """Markers shown at the target positions when rendering."""
+
+
+class TargetScheduler:
+    """Queue of the current and future target positions of every env, kept on the device.
+
+    The queue has shape (num_envs, queue_size, 3) and holds world positions. The current target of an env is the
+    entry at its cursor. Advancing an env to its next target increments its cursor; all targets are then written
+    at once. The queue is refilled in one batch every ``queue_size - 1`` steps (a cursor advances at most once per
+    step): the current targets are moved to the front and the other entries are resampled. No step reads data back
+    from the device.
+
+    For a rigid object target (:class:`SceneEntityCfg`), writing the targets is one pose write to the simulation.
+    For a physics-free target (:class:`TargetCfg`), the positions tensor is the target and writing only updates
+    the visualization markers (if the simulation is rendered).
+    """
+
+    def __init__(
+        self,
+        env: ManagerBasedRLEnv,
+        target_cfg: SceneEntityCfg | TargetCfg,
+        pos_range: tuple[tuple[float, float], ...] = TARGET_POS_RANGE,
+        queue_size: int = 16,
+    ):
+        if queue_size < 2:
+            raise ValueError(f"The target queue needs at least two entries, got queue_size={queue_size}.")
+        self.num_envs = env.num_envs
+        self.device = env.device
+        self.queue_size = queue_size
+        self.physics_free = isinstance(target_cfg, TargetCfg)
+        if self.physics_free:
+            self._target = None
+            init_pos = torch.tensor(target_cfg.init_pos, device=self.device)
+            self._pos_base = init_pos.unsqueeze(0) + env.scene.env_origins
+            # markers are only created if the simulation is rendered
+            sim = getattr(env, "sim", None)
+            if sim is not None and (sim.has_gui() or sim.has_rtx_sensors()):
+                self._visualizer = VisualizationMarkers(target_cfg.visualizer_cfg)
+            else:
+                self._visualizer = None
+        else:
+            self._target: RigidObject = env.scene[target_cfg.name]
+            self._pos_base = self._target.data.default_root_state[:, :3] + env.scene.env_origins
+            # pose buffer of the coalesced write
+            self._pose = torch.zeros(self.num_envs, 7, device=self.device)
+        # sampling range in world frame: default target position of every env plus the offset range
+        self._pos_lower = torch.tensor([low for low, _ in pos_range], device=self.device)
+        self._pos_span = torch.tensor([high - low for low, high in pos_range], device=self.device)
+        # queue, cursors and current positions
+        self._queue = torch.zeros(self.num_envs, queue_size, 3, device=self.device)
+        self._cursor = torch.zeros(self.num_envs, dtype=torch.long, device=self.device)
+        self._positions = torch.zeros(self.num_envs, 3, device=self.device)
+        self._steps_since_refill = 0
+        # sample the first targets
+        self._sample(self._queue)
+        self._gather_positions()
+
+    @property
+    def positions(self) -> torch.Tensor:
+        """Current target positions in world frame. Shape is (num_envs, 3).
+
+        The tensor is updated in place when the targets advance.
+        """
+        return self._positions
+
+    def advance(self, mask: torch.Tensor):
+        """Advance the envs in ``mask`` (shape: (num_envs,), bool) to their next target and write all targets."""
+        if self._steps_since_refill >= self.queue_size - 1:
+            self._refill()
+        self._cursor.add_(mask)
+        self._steps_since_refill += 1
+        self._gather_positions()
+        self.write_targets()
+
+    def write_targets(self):
+        """Write the current targets of all envs: one pose write (rigid object) or a marker update (physics-free)."""
+        if self.physics_free:
+            if self._visualizer is not None:
+                self._visualizer.visualize(translations=self._positions)
+            return
+        self._pose[:, :3] = self._positions
+        self._pose[:, 3:].copy_(self._target.data.root_quat_w)
+        self._target.write_root_pose_to_sim(self._pose)
+
+    def _gather_positions(self):
+        """Gather the entries at the cursors into the positions buffer."""
+        index = self._cursor.view(-1, 1, 1).expand(-1, 1, 3)
+        torch.gather(self._queue, 1, index, out=self._positions.view(-1, 1, 3))
+
+    def _refill(self):
+        """Move the current targets to the front of the queue and resample all other entries."""
+        self._queue[:, 0] = self._positions
+        self._sample(self._queue[:, 1:])
+        self._cursor.zero_()
+        self._steps_since_refill = 0
+
+    def _sample(self, out: torch.Tensor):
+        """Sample target positions uniformly into ``out`` (shape: (num_envs, M, 3))."""
+        out.uniform_().mul_(self._pos_span).add_(self._pos_lower).add_(self._pos_base.unsqueeze(1))
+
+
+def target_scheduler(
+    env: ManagerBasedRLEnv,
+    target_cfg: SceneEntityCfg | TargetCfg,
+    pos_range: tuple[tuple[float, float], ...] = TARGET_POS_RANGE,
+    queue_size: int = 16,
+) -> TargetScheduler:
+    """Get the target scheduler of the given target of the environment (created on first use).
+
+    The scheduler is stored on the environment instance. ``pos_range`` and ``queue_size`` are only used when the
+    scheduler is created.
+    """
+    if not hasattr(env, "_target_schedulers"):
+        env._target_schedulers = {}
+    if target_cfg.name not in env._target_schedulers:
+        env._target_schedulers[target_cfg.name] = TargetScheduler(env, target_cfg, pos_range, queue_size)
+    return env._target_schedulers[target_cfg.name]
+
+
+def target_pos_w(env: ManagerBasedRLEnv, target_cfg: SceneEntityCfg | TargetCfg) -> torch.Tensor:
+    """World positions of the target. Shape is (num_envs, 3).
+
+    Reads the positions tensor of the scheduler for a physics-free target and the root positions of the rigid
+    object otherwise.
+    """
+    if isinstance(target_cfg, TargetCfg):
+        return target_scheduler(env, target_cfg).positions
+    return env.scene[target_cfg.name].data.root_pos_w[:, :3]
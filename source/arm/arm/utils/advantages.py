@@ -0,0 +1,145 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Generalized advantage estimation (GAE) over a whole rollout buffer.
+
+The advantages of a rollout of ``T`` steps of ``N`` environments follow the linear recurrence
+
+    A[t] = delta[t] + gamma * lambda * (1 - done[t]) * A[t + 1],    A[T] = 0,
+
+with the TD errors ``delta[t] = r[t] + gamma * (1 - terminated[t]) * V'[t] - V[t]``. All TD errors and coefficients
+are computed as ``(T, N)`` tensor operations and only the recurrence is scanned, with one of the backends:
+
+* ``"loop"``: reverse loop over the steps (two kernels per step),
+* ``"scan"``: recursive doubling over the whole ``(T, N)`` tensor (``log2(T)`` steps, exact, no division),
+* ``"jit"``: the reverse loop compiled with TorchScript (no Python overhead per step),
+* ``"compile"``: the reverse loop compiled with :func:`torch.compile` (falls back to ``"scan"`` if unsupported).
+
+Truncation (time-outs, ``extras["time_outs"]`` of the Isaac Lab environments, mapped to ``truncated`` by the skrl
+wrapper) ends the GAE trace like a termination, but the TD error of the truncated step bootstraps from the value
+of the state the episode was cut at. The environments reset before returning the observations, so the final
+observation is not available and the value of the last observed state of the episode is used (as in Isaac Lab's
+other learning libraries).
+"""
+
+from __future__ import annotations
+
+import torch
+import warnings
+
+GAE_BACKENDS = ("loop", "scan", "jit", "compile")
+"""Backends of the reverse scan."""
+
+
+def compute_gae(
+    rewards: torch.Tensor,
+    values: torch.Tensor,
+    last_values: torch.Tensor,
+    terminated: torch.Tensor,
+    truncated: torch.Tensor | None = None,
+    discount_factor: float = 0.99,
+    lambda_coefficient: float = 0.95,
+    bootstrap_truncated: bool = True,
+    truncation_values: torch.Tensor | None = None,
+    backend: str = "scan",
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Compute the returns and the (not normalized) advantages of a rollout.
+
+    Args:
+        rewards: Rewards. Shape is (T, N) or (T, N, 1).
+        values: Values of the observed states. Shape is like the rewards.
+        last_values: Values of the states after the last step. Shape is (N,) or (N, 1).
+        terminated: Terminations (bool). Shape is like the rewards.
+        truncated: Truncations (bool), e.g. the time-outs. Shape is like the rewards. Defaults to None.
+        discount_factor: Discount factor (gamma).
+        lambda_coefficient: GAE lambda.
+        bootstrap_truncated: Whether the truncated steps bootstrap from the truncation values. If False, truncations
+            are handled like terminations (as skrl's PPO without ``time_limit_bootstrap``).
+        truncation_values: Values the truncated steps bootstrap from. Defaults to the values of the steps.
+        backend: Backend of the reverse scan (see :data:`GAE_BACKENDS`).
+
+    Returns:
+        The returns and the advantages, with the shape of the rewards.
+    """
+    if backend not in GAE_BACKENDS:
+        raise ValueError(f"Unknown GAE backend '{backend}'. Available backends: {GAE_BACKENDS}.")
+    not_terminated = terminated.logical_not()
+    dones = terminated if truncated is None else terminated | truncated
+    next_values = torch.cat((values[1:], last_values.view(1, *values.shape[1:])))
+    if truncated is not None:
+        if bootstrap_truncated:
+            truncation_values = values if truncation_values is None else truncation_values
+            next_values = torch.where(truncated, truncation_values, next_values)
+        else:
+            not_terminated = dones.logical_not()
+    deltas = rewards + discount_factor * not_terminated * next_values - values
+    coefficients = (discount_factor * lambda_coefficient) * dones.logical_not()
+    advantages = _SCANS[backend](deltas, coefficients.to(deltas.dtype))
+    return advantages + values, advantages
+
+
+def normalize_advantages(advantages: torch.Tensor, epsilon: float = 1e-8) -> torch.Tensor:
+    """Normalize the advantages to zero mean and unit standard deviation (as skrl's PPO)."""
+    return (advantages - advantages.mean()) / (advantages.std() + epsilon)
+
+
+"""
+Scans.
+"""
+
+
+def reverse_loop(deltas: torch.Tensor, coefficients: torch.Tensor) -> torch.Tensor:
+    """Solve ``a[t] = deltas[t] + coefficients[t] * a[t + 1]`` (with ``a[T] = 0``) with a reverse loop."""
+    advantages = torch.empty_like(deltas)
+    advantage = torch.zeros_like(deltas[0])
+    for t in range(deltas.shape[0] - 1, -1, -1):
+        advantage = deltas[t] + coefficients[t] * advantage
+        advantages[t] = advantage
+    return advantages
+
+
+def reverse_scan(deltas: torch.Tensor, coefficients: torch.Tensor) -> torch.Tensor:
+    """Solve ``a[t] = deltas[t] + coefficients[t] * a[t + 1]`` (with ``a[T] = 0``) by recursive doubling.
+
+    After the step with the distance ``k``, ``a[t]`` holds the sum of the discounted TD errors of the steps
+    ``t, ..., t + 2k - 1`` and ``c[t]`` the product of their coefficients, so ``log2(T)`` steps solve the recurrence.
+    """
+    advantages = deltas.clone()
+    coefficients = coefficients.clone()
+    horizon = deltas.shape[0]
+    distance = 1
+    while distance < horizon:
+        # note: the right-hand sides are evaluated before the (overlapping) slices are written
+        advantages[:-distance] = advantages[:-distance] + coefficients[:-distance] * advantages[distance:]
+        if 2 * distance < horizon:
+            coefficients[:-distance] = coefficients[:-distance] * coefficients[distance:]
+        distance *= 2
+    return advantages
+
+
+_scripted_loop = None
+_compiled_loop = None
+
+
+def _jit_loop(deltas: torch.Tensor, coefficients: torch.Tensor) -> torch.Tensor:
+    global _scripted_loop
+    if _scripted_loop is None:
+        _scripted_loop = torch.jit.script(reverse_loop)
+    return _scripted_loop(deltas, coefficients)
+
+
+def _compile_loop(deltas: torch.Tensor, coefficients: torch.Tensor) -> torch.Tensor:
+    global _compiled_loop
+    if _compiled_loop is None:
+        try:
+            _compiled_loop = torch.compile(reverse_loop, dynamic=False)
+            _compiled_loop(deltas, coefficients)
+        except Exception as e:
+            warnings.warn(f"Compiling the GAE scan failed, using the 'scan' backend: {e}")
+            _compiled_loop = reverse_scan
+    return _compiled_loop(deltas, coefficients)
+
+
+_SCANS = {"loop": reverse_loop, "scan": reverse_scan, "jit": _jit_loop, "compile": _compile_loop}
@@ -0,0 +1,317 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Compact on-disk format of the agent checkpoints.
+
+A compact checkpoint is a single file:
+
+* the magic bytes :data:`MAGIC` and the length of the header (8 bytes, little endian),
+* the header: a JSON document with the variant, the structure of the state (nested dicts/lists with the
+  non-tensor values, e.g. the optimizer hyper-parameters) and an index of all tensors (name, original and stored
+  dtype, shape, offset and size of the stored bytes),
+* the data: the bytes of every tensor (optionally zlib-compressed), each aligned to :data:`ALIGNMENT` bytes.
+
+The file is memory-mapped when it is opened and only the header is parsed. A tensor is read (and decompressed)
+when it is accessed, so single tensors can be inspected without deserializing the whole file. Uncompressed tensors
+that are not cast are views into the mapped file.
+
+There are two variants:
+
+* ``"full"``: all modules of the agent (models, optimizer, preprocessors), to resume training. The weights are
+  kept in their dtype unless a dtype is given.
+* ``"inference"``: only the modules needed to run the policy (:data:`INFERENCE_MODULES`). The weights are stored
+  in float16 by default.
+
+In both variants, only the float32 tensors of the models (:data:`MODEL_MODULES`) are cast; the optimizer state
+and the preprocessor statistics are stored as is. On load, the tensors are cast back to their original dtype.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import torch
+import zlib
+
+MAGIC = b"ARMCKPT\x01"
+"""Magic bytes at the start of a compact checkpoint (the last byte is the format version)."""
+
+ALIGNMENT = 64
+"""Alignment of the tensor data in the file (in bytes)."""
+
+MODEL_MODULES = ("policy", "value")
+"""Modules of the agent whose float32 tensors are stored in the reduced dtype."""
+
+INFERENCE_MODULES = ("policy", "state_preprocessor")
+"""Modules of the agent kept in the inference-only variant."""
+
+VARIANTS = ("full", "inference")
+COMPRESSIONS = ("zlib", "none")
+
+
+"""
+Saving.
+"""
+
+
+def save_compact_checkpoint(
+    state: dict,
+    f,
+    variant: str = "full",
+    dtype: str | torch.dtype | None = None,
+    compression: str = "zlib",
+    compression_level: int = 6,
+):
+    """Save an agent checkpoint (dict of module name to state dict) in the compact format.
+
+    Args:
+        state: Checkpoint state, e.g. ``{"policy": ..., "value": ..., "optimizer": ..., "state_preprocessor": ...}``.
+        f: Path or binary file object to write to.
+        variant: ``"full"`` (all modules) or ``"inference"`` (only :data:`INFERENCE_MODULES`).
+        dtype: Storage dtype of the model weights (``"float16"``, ``"bfloat16"`` or ``"float32"``). Defaults to
+            float16 for the inference variant and to the dtype of the weights for the full variant.
+        compression: ``"zlib"`` or ``"none"``. Uncompressed tensors can be memory-mapped without a copy.
+        compression_level: zlib compression level (1: fastest, 9: smallest).
+    """
+    if variant not in VARIANTS:
+        raise ValueError(f"Unknown checkpoint variant '{variant}'. Supported: {VARIANTS}.")
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression '{compression}'. Supported: {COMPRESSIONS}.")
+    if dtype is None and variant == "inference":
+        dtype = torch.float16
+    if isinstance(dtype, str):
+        dtype = getattr(torch, dtype)
+    if variant == "inference":
+        state = {name: module for name, module in state.items() if name in INFERENCE_MODULES}
+
+    index = {}
+    payloads = []
+    offset = 0
+
+    def add_tensor(name: str, tensor: torch.Tensor, module: str) -> dict:
+        nonlocal offset
+        stored = tensor.detach().cpu().contiguous()
+        if dtype is not None and module in MODEL_MODULES and stored.dtype == torch.float32:
+            stored = stored.to(dtype)
+        data = stored.reshape(-1).view(torch.uint8).numpy().tobytes()
+        if compression == "zlib":
+            data = zlib.compress(data, compression_level)
+        offset += -offset % ALIGNMENT
+        index[name] = {
+            "dtype": str(tensor.dtype).removeprefix("torch."),
+            "stored_dtype": str(stored.dtype).removeprefix("torch."),
+            "shape": list(tensor.shape),
+            "offset": offset,
+            "nbytes": len(data),
+        }
+        payloads.append((offset, data))
+        offset += len(data)
+        return {"__tensor__": name}
+
+    structure = {}
+    for name, module in state.items():
+        structure[name] = _encode(module, name, functools.partial(add_tensor, module=name))
+    header = {"variant": variant, "compression": compression, "structure": structure, "tensors": index}
+    header = json.dumps(header).encode("utf-8")
+
+    def write(file):
+        file.write(MAGIC)
+        file.write(struct.pack("<Q", len(header)))
+        file.write(header)
+        # the data starts at the next aligned position
+        data_start = len(MAGIC) + 8 + len(header)
+        file.write(b"\0" * (-data_start % ALIGNMENT))
+        position = 0
+        for data_offset, data in payloads:
+            file.write(b"\0" * (data_offset - position))
+            file.write(data)
+            position = data_offset + len(data)
+
+    if isinstance(f, (str, os.PathLike)):
+        with open(f, "wb") as file:
+            write(file)
+    else:
+        write(f)
+
+
+def compact_checkpoint_saver(variant: str = "full", dtype: str | None = None, compression: str = "zlib"):
+    """Function ``save(state, f)`` that saves in the compact format (e.g. for the checkpoint writer)."""
+    return functools.partial(save_compact_checkpoint, variant=variant, dtype=dtype, compression=compression)
+
+
+def _encode(value, name: str, add_tensor):
+    """Encode a nested state as JSON-compatible structure, replacing the tensors with references."""
+    if isinstance(value, torch.Tensor):
+        return add_tensor(name, value)
+    if isinstance(value, dict):
+        # note: keys are kept as pairs, so that the integer keys of the optimizer state are restored
+        return {"__dict__": [[key, _encode(item, f"{name}/{key}", add_tensor)] for key, item in value.items()]}
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode(item, f"{name}/{i}", add_tensor) for i, item in enumerate(value)]}
+    if isinstance(value, list):
+        return [_encode(item, f"{name}/{i}", add_tensor) for i, item in enumerate(value)]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise TypeError(f"Cannot store value of type {type(value).__name__} at '{name}' in a compact checkpoint.")
+
+
+"""
+Loading.
+"""
+
+
+class CompactCheckpoint:
+    """Lazily loaded compact checkpoint.
+
+    Usage:
+
+    .. code-block:: python
+
+        with CompactCheckpoint("checkpoints/agent_500.pt") as checkpoint:
+            print(checkpoint.variant, checkpoint.names())
+            weight = checkpoint.tensor("policy/net_container.0.weight")
+            policy_state = checkpoint.load(modules=["policy"])["policy"]
+
+    Args:
+        path: Path of the checkpoint file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a compact checkpoint: {path}")
+            (header_length,) = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(header_length).decode("utf-8"))
+            # copy-on-write mapping: the tensors are writable views, the file is never modified
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        data_start = len(MAGIC) + 8 + header_length
+        self._data_start = data_start + (-data_start % ALIGNMENT)
+        self.variant: str = header["variant"]
+        self.compression: str = header["compression"]
+        self._structure: dict = header["structure"]
+        self._tensors: dict[str, dict] = header["tensors"]
+
+    def __enter__(self) -> CompactCheckpoint:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def modules(self) -> list[str]:
+        """Names of the modules in the checkpoint."""
+        return list(self._structure)
+
+    def names(self, module: str | None = None) -> list[str]:
+        """Names of the tensors (of a module) in the checkpoint."""
+        if module is None:
+            return list(self._tensors)
+        return [name for name in self._tensors if name.startswith(f"{module}/")]
+
+    def info(self, name: str) -> dict:
+        """Index entry of a tensor: dtype, stored dtype, shape, offset and number of stored bytes."""
+        return dict(self._tensors[name])
+
+    def stored_nbytes(self) -> int:
+        """Total number of stored tensor bytes."""
+        return sum(entry["nbytes"] for entry in self._tensors.values())
+
+    def tensor(self, name: str, device: str = "cpu", cast: bool = True) -> torch.Tensor:
+        """Read a single tensor.
+
+        Args:
+            name: Name of the tensor (``<module>/<key>...``).
+            device: Device to move the tensor to.
+            cast: Whether to cast the tensor back to its original dtype (otherwise it keeps the stored dtype).
+        """
+        entry = self._tensors[name]
+        stored_dtype = getattr(torch, entry["stored_dtype"])
+        start = self._data_start + entry["offset"]
+        numel = math.prod(entry["shape"])
+        if numel == 0:
+            tensor = torch.empty(entry["shape"], dtype=stored_dtype)
+        elif self.compression == "zlib":
+            data = bytearray(zlib.decompress(self._mmap[start : start + entry["nbytes"]]))
+            tensor = torch.frombuffer(data, dtype=stored_dtype).reshape(entry["shape"])
+        else:
+            tensor = torch.frombuffer(self._mmap, dtype=stored_dtype, count=numel, offset=start)
+            tensor = tensor.reshape(entry["shape"])
+        if cast:
+            tensor = tensor.to(getattr(torch, entry["dtype"]))
+        return tensor.to(device)
+
+    def load(self, modules: list[str] | None = None, device: str = "cpu") -> dict:
+        """Load the state of the given modules (all if None) as nested dicts, as saved."""
+        modules = self.modules if modules is None else modules
+        return {name: self._decode(self._structure[name], device) for name in modules if name in self._structure}
+
+    def close(self):
+        """Unmap the file (deferred to garbage collection while views into the file are alive)."""
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def _decode(self, value, device: str):
+        if isinstance(value, dict):
+            if "__tensor__" in value:
+                return self.tensor(value["__tensor__"], device=device)
+            if "__tuple__" in value:
+                return tuple(self._decode(item, device) for item in value["__tuple__"])
+            return {key: self._decode(item, device) for key, item in value["__dict__"]}
+        if isinstance(value, list):
+            return [self._decode(item, device) for item in value]
+        return value
+
+
+def is_compact_checkpoint(path: str) -> bool:
+    """Whether the file is a compact checkpoint."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def load_checkpoint(path: str, device: str = "cpu") -> dict:
+    """Load a checkpoint in the compact or in skrl's (``torch.save``) format."""
+    if is_compact_checkpoint(path):
+        with CompactCheckpoint(path) as checkpoint:
+            return checkpoint.load(device=device)
+    return torch.load(path, map_location=device, weights_only=False)
+
+
+def load_agent_checkpoint(agent, path: str):
+    """Load a checkpoint in the compact or in skrl's format into the modules of a skrl agent.
+
+    skrl checkpoints are loaded with the agent's own :meth:`load`. For compact checkpoints, the modules are
+    loaded the same way; modules that are not in the checkpoint (e.g. the optimizer of an inference-only
+    checkpoint) are left unchanged.
+    """
+    if not is_compact_checkpoint(path):
+        agent.load(path)
+        return
+    with CompactCheckpoint(path) as checkpoint:
+        missing = [name for name in agent.checkpoint_modules if name not in checkpoint.modules]
+        if missing:
+            print(f"[INFO] The {checkpoint.variant} checkpoint has no state for: {', '.join(missing)}")
+        state = checkpoint.load(device=agent.device)
+    for name, data in state.items():
+        module = agent.checkpoint_modules.get(name)
+        if module is None:
+            print(f"[WARN] Cannot load the '{name}' module. The agent doesn't have such an instance")
+            continue
+        module.load_state_dict(data)
+        if hasattr(module, "eval"):
+            module.eval()
+
+
+def checkpoint_timestep(path: str) -> int | None:
+    """Timestep of an ``agent_<timestep>.pt`` checkpoint (written by the agents), or None for other names."""
+    match = re.fullmatch(r"agent_(\d+)\.pt", os.path.basename(path))
+    return int(match.group(1)) if match else None
@@ -0,0 +1,140 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Top-k retention of the checkpoints of a training run.
+
+Every checkpoint is scored with an online metric when it is taken: the mean of the last ``window`` values of a
+tracked training quantity (e.g. the episodic ``target_reached`` reward or the success rate of the training
+monitor). Once a checkpoint is written, the retention keeps the ``keep_top_k`` best-scored checkpoints and the
+latest one; the others are deleted or compacted (re-saved as inference-only compact checkpoints). ``best.pt``
+always holds the best-scored checkpoint and ``retention.json`` the scores of the kept checkpoints.
+
+The retention runs on the thread that writes the checkpoints (see :mod:`arm.utils.checkpoint_writer`), i.e. in
+the background with asynchronous checkpoints.
+"""
+
+from __future__ import annotations
+
+import collections
+import json
+import math
+import os
+import shutil
+import threading
+
+from .checkpoint_format import is_compact_checkpoint, load_checkpoint, save_compact_checkpoint
+
+DEFAULT_METRIC = "Info / Episode_Reward/target_reached"
+"""Tag of the tracked agent data that scores the checkpoints by default (episodic target-reached reward)."""
+
+
+class CheckpointRetention:
+    """Keep the top-k checkpoints by an online metric plus the latest one.
+
+    Args:
+        keep_top_k: Number of best-scored checkpoints to keep (in addition to the latest).
+        metric: Tag of the tracked agent data the checkpoints are scored by, e.g.
+            ``"Info / Episode_Reward/target_reached"``, ``"Info / Monitor/success_rate"`` or
+            ``"Reward / Total reward (mean)"``.
+        window: Number of most recent values of the metric the score is averaged over.
+        mode: ``"max"`` if higher scores are better, ``"min"`` otherwise.
+        discard: What to do with checkpoints that are not kept: ``"delete"`` or ``"compact"`` (re-save as
+            float16 inference-only compact checkpoint).
+    """
+
+    def __init__(
+        self,
+        keep_top_k: int = 3,
+        metric: str = DEFAULT_METRIC,
+        window: int = 100,
+        mode: str = "max",
+        discard: str = "delete",
+    ):
+        if keep_top_k < 1:
+            raise ValueError(f"At least one checkpoint must be kept, got keep_top_k={keep_top_k}.")
+        if mode not in ("max", "min"):
+            raise ValueError(f"Unknown mode '{mode}'. Supported: 'max', 'min'.")
+        if discard not in ("delete", "compact"):
+            raise ValueError(f"Unknown discard action '{discard}'. Supported: 'delete', 'compact'.")
+        self.keep_top_k = keep_top_k
+        self.metric = metric
+        self.mode = mode
+        self.discard = discard
+        self._values = collections.deque(maxlen=window)
+        # written checkpoints: path -> score (in order of writing)
+        self._scores: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, tag: str, value):
+        """Record a tracked value (all tags are passed; only the metric is kept)."""
+        if tag == self.metric:
+            self._values.append(float(value))
+
+    def score(self) -> float:
+        """Current score: mean of the recent metric values (worst possible score if there are none)."""
+        if not self._values:
+            return -math.inf if self.mode == "max" else math.inf
+        return sum(self._values) / len(self._values)
+
+    def add(self, path: str, score: float):
+        """Register a written checkpoint with its score and discard the checkpoints that are no longer kept."""
+        with self._lock:
+            self._scores[path] = score
+            latest = path
+            ranked = sorted(self._scores, key=self._scores.get, reverse=self.mode == "max")
+            kept = set(ranked[: self.keep_top_k]) | {latest}
+            for discarded in [p for p in self._scores if p not in kept]:
+                del self._scores[discarded]
+                self._discard(discarded)
+            self._update_best(ranked[0])
+            self._write_index(os.path.dirname(path), ranked[0], latest)
+
+    def _discard(self, path: str):
+        if not os.path.isfile(path):
+            return
+        if self.discard == "delete":
+            os.remove(path)
+        elif not is_compact_checkpoint(path):
+            tmp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.tmp")
+            save_compact_checkpoint(load_checkpoint(path), tmp_path, variant="inference")
+            os.replace(tmp_path, path)
+
+    def _update_best(self, path: str):
+        """Point ``best.pt`` to the best checkpoint (hard link if possible, copy otherwise)."""
+        best_path = os.path.join(os.path.dirname(path), "best.pt")
+        if os.path.isfile(best_path) and os.path.samefile(best_path, path):
+            return
+        tmp_path = os.path.join(os.path.dirname(path), ".best.pt.tmp")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        try:
+            os.link(path, tmp_path)
+        except OSError:
+            shutil.copyfile(path, tmp_path)
+        os.replace(tmp_path, best_path)
+
+    def _write_index(self, directory: str, best: str, latest: str):
+        index = {
+            "metric": self.metric,
+            "mode": self.mode,
+            "best": os.path.basename(best),
+            "latest": os.path.basename(latest),
+            "scores": {os.path.basename(path): score for path, score in self._scores.items()},
+        }
+        tmp_path = os.path.join(directory, ".retention.json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, os.path.join(directory, "retention.json"))
+
+
+def attach_metric_tracking(agent, retention: CheckpointRetention):
+    """Pass the data tracked by a skrl agent (:meth:`track_data`) to the retention."""
+    track_data = agent.track_data
+
+    def tracked(tag: str, value):
+        retention.observe(tag, value)
+        track_data(tag, value)
+
+    agent.track_data = tracked
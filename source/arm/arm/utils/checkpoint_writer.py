@@ -0,0 +1,289 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Asynchronous checkpoint writer.
+
+Writing a checkpoint is split into two parts:
+
+* a snapshot on the training thread: the tensors of the state (e.g. the state dicts of the models, the optimizer
+  and the preprocessors) are copied into host buffers. On CUDA, the buffers are pinned and the copies are
+  asynchronous; the training thread does not wait for them.
+* the serialization on a background thread: it waits for the copies, saves the snapshot into a temporary file
+  next to the checkpoint and renames it atomically, so that a checkpoint file is either complete or absent.
+
+The host buffers of a snapshot are reused once its write finished. There are ``max_pending`` sets of buffers, so
+the training thread only blocks when ``max_pending`` snapshots are still being written (i.e. the disk falls
+behind).
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import os
+import queue
+import threading
+import time
+import torch
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .checkpoint_retention import CheckpointRetention, attach_metric_tracking
+
+
+@dataclass
+class CheckpointWriteStats:
+    """Latencies of one checkpoint write (in ms)."""
+
+    path: str
+    """Path of the checkpoint."""
+    blocked_ms: float
+    """Time the training thread waited for a free snapshot buffer."""
+    snapshot_ms: float
+    """Time the training thread spent on the snapshot (including ``blocked_ms``)."""
+    write_ms: float
+    """Time the background thread spent on the serialization, the flush and the rename."""
+    queued_ms: float
+    """Time between the end of the snapshot and the start of the serialization."""
+    size_mb: float
+    """Size of the checkpoint file."""
+
+
+class _Snapshot:
+    """Host buffers of one snapshot, reused across writes of states with the same structure."""
+
+    def __init__(self, pin_memory: bool):
+        self.pin_memory = pin_memory
+        self._buffers: dict[tuple, torch.Tensor] = {}
+        self.event = None
+
+    def copy(self, value, key: tuple = ()):
+        """Copy the tensors of a nested dict/list/tuple into the host buffers (other values are deep-copied)."""
+        if isinstance(value, torch.Tensor):
+            buffer = self._buffers.get(key)
+            if buffer is None or buffer.shape != value.shape or buffer.dtype != value.dtype:
+                buffer = torch.empty(
+                    value.shape, dtype=value.dtype, device="cpu", pin_memory=self.pin_memory and value.is_cuda
+                )
+                self._buffers[key] = buffer
+            buffer.copy_(value.detach(), non_blocking=buffer.is_pinned())
+            return buffer
+        if isinstance(value, dict):
+            return type(value)((k, self.copy(v, key + (k,))) for k, v in value.items())
+        if isinstance(value, (list, tuple)):
+            return type(value)(self.copy(v, key + (i,)) for i, v in enumerate(value))
+        return copy.deepcopy(value)
+
+
+class AsyncCheckpointWriter:
+    """Write checkpoints from a background thread.
+
+    Usage:
+
+    .. code-block:: python
+
+        writer = AsyncCheckpointWriter()
+        writer.submit("checkpoints/agent_500.pt", {"policy": policy.state_dict(), "optimizer": optimizer.state_dict()})
+        ...
+        writer.close()  # waits for the pending writes
+
+    Args:
+        max_pending: Maximum number of snapshots that are queued or being written. :meth:`submit` blocks when it
+            is reached.
+        save: Function that serializes a state into a (binary) file object. Defaults to :func:`torch.save`.
+        pin_memory: Whether to copy CUDA tensors into pinned host buffers (asynchronous copies). Defaults to True
+            if CUDA is available.
+    """
+
+    def __init__(self, max_pending: int = 2, save: Callable | None = None, pin_memory: bool | None = None):
+        if max_pending < 1:
+            raise ValueError(f"At least one pending checkpoint is required, got max_pending={max_pending}.")
+        if pin_memory is None:
+            pin_memory = torch.cuda.is_available()
+        self.save = save if save is not None else torch.save
+        # free snapshot buffers: bounds the number of pending writes
+        self._free = queue.Queue()
+        for _ in range(max_pending):
+            self._free.put(_Snapshot(pin_memory))
+        self._jobs = queue.Queue()
+        self._stats: list[CheckpointWriteStats] = []
+        self.history: list[CheckpointWriteStats] = []
+        """Latencies of all finished writes."""
+        self._stats_lock = threading.Lock()
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="checkpoint-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, path: str, state, on_written: Callable[[str], None] | None = None):
+        """Snapshot the state and queue it to be written to ``path``.
+
+        Blocks only while all snapshot buffers are in use. The state may be modified (e.g. by an optimizer step)
+        as soon as the call returns.
+
+        Args:
+            path: Path of the checkpoint file.
+            state: Nested dict/list/tuple of tensors and other (picklable) values.
+            on_written: Function called with ``path`` on the background thread once the file was written.
+        """
+        self._raise_error()
+        start = time.perf_counter()
+        snapshot = self._free.get()
+        blocked_ms = (time.perf_counter() - start) * 1e3
+        state = snapshot.copy(state)
+        # the writer waits for the asynchronous copies of the current stream
+        if snapshot.pin_memory:
+            snapshot.event = torch.cuda.Event()
+            snapshot.event.record()
+        snapshot_end = time.perf_counter()
+        self._jobs.put((path, state, snapshot, on_written, blocked_ms, (snapshot_end - start) * 1e3, snapshot_end))
+
+    def flush(self):
+        """Wait until all submitted checkpoints are written."""
+        self._jobs.join()
+        self._raise_error()
+
+    def close(self):
+        """Write the pending checkpoints and stop the background thread."""
+        self._jobs.join()
+        self._jobs.put(None)
+        self._thread.join()
+        self._raise_error()
+
+    def pop_stats(self) -> list[CheckpointWriteStats]:
+        """Latencies of the writes that finished since the last call."""
+        with self._stats_lock:
+            stats, self._stats = self._stats, []
+        return stats
+
+    def summary(self) -> str:
+        """Table of the mean and maximum latencies of all finished writes."""
+        with self._stats_lock:
+            history = list(self.history)
+        if not history:
+            return "No checkpoints were written."
+        lines = [f"{'':<12} {'mean (ms)':>10} {'max (ms)':>10}"]
+        for field in ("blocked_ms", "snapshot_ms", "queued_ms", "write_ms"):
+            values = [getattr(stats, field) for stats in history]
+            lines.append(f"{field[:-3]:<12} {sum(values) / len(values):>10.2f} {max(values):>10.2f}")
+        lines.append(f"{len(history)} checkpoints, {sum(stats.size_mb for stats in history):.1f} MB in total")
+        return "\n".join(lines)
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                self._jobs.task_done()
+                return
+            path, state, snapshot, on_written, blocked_ms, snapshot_ms, snapshot_end = job
+            start = time.perf_counter()
+            try:
+                if snapshot.event is not None:
+                    snapshot.event.synchronize()
+                size = self._write(path, state)
+                if on_written is not None:
+                    on_written(path)
+            except BaseException as e:
+                self._error = e
+            else:
+                stats = CheckpointWriteStats(
+                    path=path,
+                    blocked_ms=blocked_ms,
+                    snapshot_ms=snapshot_ms,
+                    write_ms=(time.perf_counter() - start) * 1e3,
+                    queued_ms=(start - snapshot_end) * 1e3,
+                    size_mb=size / 2**20,
+                )
+                with self._stats_lock:
+                    self._stats.append(stats)
+                    self.history.append(stats)
+            finally:
+                # release the buffers (the state referencing them is dropped)
+                del state
+                self._free.put(snapshot)
+                self._jobs.task_done()
+
+    def _write(self, path: str, state) -> int:
+        """Save the state into a temporary file, flush it to disk and rename it to ``path``. Returns the size."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = os.path.join(directory, f".{os.path.basename(path)}.tmp")
+        with open(tmp_path, "wb") as f:
+            self.save(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+            size = f.tell()
+        os.replace(tmp_path, path)
+        return size
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("Writing a checkpoint failed.") from error
+
+
+def attach_async_checkpoint_writer(
+    agent, writer: AsyncCheckpointWriter, wait: bool = False, retention: CheckpointRetention | None = None
+) -> AsyncCheckpointWriter:
+    """Make a skrl agent write its checkpoints with the given asynchronous writer.
+
+    Replaces :meth:`write_checkpoint` of the agent instance. The files (``agent_<timestep>.pt`` and
+    ``best_agent.pt`` in the checkpoints directory of the experiment) and their content are the same as with
+    skrl's synchronous writer (unless the writer saves in another format). The latencies of the finished writes
+    are tracked as agent data (``Checkpoint / ...``), i.e. they are written to TensorBoard with the other training
+    data.
+
+    Args:
+        agent: skrl agent.
+        writer: Checkpoint writer.
+        wait: Whether to wait until the checkpoints are written (i.e. write synchronously, in the writer's format).
+        retention: Retention of the ``agent_<timestep>.pt`` checkpoints. The metric is taken from the data tracked
+            by the agent; a checkpoint is scored when it is submitted and registered once it is written.
+    """
+    if retention is not None:
+        if getattr(agent, "checkpoint_store_separately", False):
+            raise ValueError("Checkpoint retention requires checkpoints of the whole agent (store_separately=False).")
+        attach_metric_tracking(agent, retention)
+
+    def write_checkpoint(timestep: int, timesteps: int):
+        for stats in writer.pop_stats():
+            agent.track_data("Checkpoint / Snapshot time (ms)", stats.snapshot_ms)
+            agent.track_data("Checkpoint / Blocked time (ms)", stats.blocked_ms)
+            agent.track_data("Checkpoint / Write time (ms)", stats.write_ms)
+            agent.track_data("Checkpoint / Size (MB)", stats.size_mb)
+        directory = os.path.join(agent.experiment_dir, "checkpoints")
+        tag = str(timestep if timestep is not None else time.strftime("%y-%m-%d_%H-%M-%S"))
+        modules = {name: _state_of(module) for name, module in agent.checkpoint_modules.items()}
+        on_written = None
+        if retention is not None:
+            on_written = functools.partial(_register_checkpoint, retention, score=retention.score())
+        for filename, state in _checkpoint_files(agent, f"agent_{tag}", modules, lambda name: f"{name}_{tag}"):
+            writer.submit(os.path.join(directory, filename), state, on_written=on_written)
+        # best modules (already copies)
+        best = agent.checkpoint_best_modules
+        if best["modules"] and not best["saved"]:
+            modules = {name: best["modules"][name] for name in agent.checkpoint_modules}
+            for filename, state in _checkpoint_files(agent, "best_agent", modules, lambda name: f"best_{name}"):
+                writer.submit(os.path.join(directory, filename), state)
+            best["saved"] = True
+        if wait:
+            writer.flush()
+
+    agent.write_checkpoint = write_checkpoint
+    return writer
+
+
+def _register_checkpoint(retention: CheckpointRetention, path: str, score: float):
+    retention.add(path, score)
+
+
+def _state_of(module):
+    return module.state_dict() if hasattr(module, "state_dict") else module
+
+
+def _checkpoint_files(agent, name: str, modules: dict, module_name: Callable[[str], str]) -> list[tuple[str, dict]]:
+    """Files of a checkpoint: the whole agent or, if the agent stores its modules separately, one per module."""
+    if getattr(agent, "checkpoint_store_separately", False):
+        return [(f"{module_name(key)}.pt", state) for key, state in modules.items()]
+    return [(f"{name}.pt", modules)]
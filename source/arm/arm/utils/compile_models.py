@@ -0,0 +1,100 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Compilation of the agent models with :func:`torch.compile`.
+
+The ``compute`` method of every model instance is replaced by its compiled version, so that the mixins of the
+models (distribution sampling, log-probabilities, clipping) stay in eager mode and only the network runs as
+compiled graph. The models are warmed up right after compiling, with the batch sizes of the rollouts and of the
+mini-batches and with and without gradients, so that the compilation does not happen (or fail) during training.
+
+If compiling or warming up fails (e.g. no compiler for the backend on the platform, or an unsupported Python
+version), the original methods are restored and the models run in eager mode.
+"""
+
+from __future__ import annotations
+
+import torch
+import warnings
+from collections.abc import Callable, Iterable
+
+
+def compile_method(obj, name: str, warmup: Callable[[], None] | None = None, **compile_kwargs) -> bool:
+    """Replace a method of an object by its compiled version (in place).
+
+    Args:
+        obj: Object (e.g. a model instance) whose method is compiled.
+        name: Name of the method, e.g. ``"compute"`` or ``"forward"``.
+        warmup: Function called after compiling. It should call the method with representative inputs, so that the
+            graphs are compiled before they are needed.
+        compile_kwargs: Keyword arguments of :func:`torch.compile` (e.g. ``mode`` and ``backend``).
+
+    Returns:
+        Whether the method was compiled. If False, the original method is kept.
+    """
+    method = getattr(obj, name)
+    has_instance_attribute = name in vars(obj)
+    if not hasattr(torch, "compile"):
+        warnings.warn(f"torch.compile is not available (torch {torch.__version__}). Running {name} in eager mode.")
+        return False
+    try:
+        setattr(obj, name, torch.compile(method, **compile_kwargs))
+        if warmup is not None:
+            warmup()
+    except Exception as e:
+        # restore the eager method
+        if has_instance_attribute:
+            setattr(obj, name, method)
+        else:
+            delattr(obj, name)
+        warnings.warn(f"Compiling {type(obj).__name__}.{name} failed, running in eager mode: {e}")
+        return False
+    return True
+
+
+def compile_agent_models(
+    agent,
+    batch_sizes: Iterable[int],
+    train: bool = True,
+    mode: str | None = None,
+    backend: str = "inductor",
+) -> dict[str, bool]:
+    """Compile the ``compute`` method of the models of a skrl agent and warm them up.
+
+    Args:
+        agent: skrl agent (its :attr:`models` are compiled; shared models only once).
+        batch_sizes: Batch sizes the models are warmed up with, e.g. the number of environments (rollouts) and the
+            mini-batch size (updates).
+        train: Whether to also warm up the backward pass (for training).
+        mode: Compilation mode of :func:`torch.compile` (e.g. ``"reduce-overhead"``). Defaults to the default mode.
+        backend: Backend of :func:`torch.compile`.
+
+    Returns:
+        Whether the model of every role was compiled.
+    """
+    batch_sizes = sorted(set(batch_sizes))
+    compiled = {}
+    models = {}
+    for role, model in agent.models.items():
+        if model is not None:
+            models.setdefault(id(model), (model, []))[1].append(role)
+    for model, roles in models.values():
+
+        def warmup(model=model, roles=roles):
+            for batch_size in batch_sizes:
+                states = torch.zeros(batch_size, model.num_observations, device=model.device)
+                for role in roles:
+                    # note: rollouts run without gradients, inference (play) in inference mode
+                    with torch.no_grad() if train else torch.inference_mode():
+                        model.compute({"states": states}, role)
+                    if train:
+                        output = model.compute({"states": states}, role)[0]
+                        output.sum().backward()
+            model.zero_grad(set_to_none=True)
+
+        success = compile_method(model, "compute", warmup, mode=mode, backend=backend)
+        for role in roles:
+            compiled[role] = success
+    return compiled
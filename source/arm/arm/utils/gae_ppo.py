@@ -0,0 +1,75 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""skrl's PPO with the returns computed by :func:`~arm.utils.advantages.compute_gae`.
+
+skrl's PPO computes the advantages with a Python loop nested inside its update (``PPO._update``). :class:`GAEPPO`
+computes the returns of the stored rollout with :func:`~arm.utils.advantages.compute_gae` (vectorized, truncations
+bootstrap) before skrl's update runs. The returns replace the rewards in the memory and all steps are marked as
+terminated, so skrl's loop reduces to ``advantages = returns - values`` (no bootstrap, no trace) and the rest of
+the update (normalization, value preprocessor, mini-batches, losses, learning rate scheduler and tracking) is
+skrl's own. The rewards and terminations of the memory are not sampled by the update and are overwritten by the
+next rollout.
+
+The agent is instantiated by :class:`~arm.utils.runner.ArmRunner` for the PPO agent configs with a ``gae_backend``
+entry. It takes two more entries in the agent config:
+
+* ``gae_backend``: backend of the reverse scan (see :data:`~arm.utils.advantages.GAE_BACKENDS`, default ``"scan"``),
+* ``gae_bootstrap_truncated``: whether the truncated steps bootstrap from their values (default True).
+"""
+
+from __future__ import annotations
+
+import torch
+
+from skrl.agents.torch.ppo import PPO
+
+from .advantages import compute_gae
+
+
+class GAEPPO(PPO):
+    """skrl's PPO (torch) with the returns computed by :func:`~arm.utils.advantages.compute_gae`."""
+
+    def __init__(self, *args, **kwargs):
+        """Create the agent (same arguments as skrl's PPO).
+
+        Raises:
+            ValueError: If the agent bootstraps the truncations itself (``time_limit_bootstrap``), which would be
+                counted twice.
+        """
+        super().__init__(*args, **kwargs)
+        self._gae_backend = self.cfg.get("gae_backend", "scan")
+        self._gae_bootstrap_truncated = self.cfg.get("gae_bootstrap_truncated", True)
+        if self._gae_bootstrap_truncated and self._time_limit_bootstrap:
+            raise ValueError("Disable the 'time_limit_bootstrap' of the agent, the GAE bootstraps the truncations.")
+
+    def _update(self, timestep: int, timesteps: int) -> None:
+        """Compute the returns of the stored rollout and run skrl's update on them."""
+        with torch.no_grad(), torch.autocast(device_type=self._device_type, enabled=self._mixed_precision):
+            self.value.train(False)
+            last_values, _, _ = self.value.act(
+                {"states": self._state_preprocessor(self._current_next_states.float())}, role="value"
+            )
+            self.value.train(True)
+            last_values = self._value_preprocessor(last_values, inverse=True)
+
+        terminated = self.memory.get_tensor_by_name("terminated")
+        with torch.no_grad():
+            returns, _ = compute_gae(
+                rewards=self.memory.get_tensor_by_name("rewards"),
+                values=self.memory.get_tensor_by_name("values"),
+                last_values=last_values.float(),
+                terminated=terminated,
+                truncated=self.memory.get_tensor_by_name("truncated"),
+                discount_factor=self._discount_factor,
+                lambda_coefficient=self._lambda,
+                bootstrap_truncated=self._gae_bootstrap_truncated,
+                backend=self._gae_backend,
+            )
+
+        # skrl's loop: advantages = rewards - values on terminated steps
+        self.memory.set_tensor_by_name("rewards", returns)
+        self.memory.set_tensor_by_name("terminated", torch.ones_like(terminated))
+        super()._update(timestep, timesteps)
@@ -0,0 +1,124 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Stepping groups of environments asynchronously, to overlap the policy inference with the environment steps.
+
+The environments are split into groups (contiguous slices). While a group steps in a worker thread, the policy
+runs on the next group in the calling thread (see :meth:`arm.utils.lean_ppo.LeanPPO.train`). On CUDA devices the
+steps are launched on a separate stream, so that their kernels overlap with the ones of the inference; on CPU the
+overlap comes from the thread (torch releases the GIL in its kernels).
+
+The environment must be able to step a group of environments on its own (:class:`GroupedVecEnv`). Environments
+that advance one simulation for all environments (e.g. the Isaac Lab environments, whose physics steps the whole
+scene) cannot be interleaved.
+"""
+
+from __future__ import annotations
+
+import torch
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Protocol, runtime_checkable
+
+
+@runtime_checkable
+class GroupedVecEnv(Protocol):
+    """Vectorized environment (skrl wrapper interface) that can step a group of its environments."""
+
+    num_envs: int
+
+    def step_group(
+        self, env_ids: slice, actions: torch.Tensor
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, dict]:
+        """Step the environments ``env_ids`` with their actions.
+
+        Returns:
+            The next observations, rewards, terminations, truncations (shapes as :meth:`step`, for the group only)
+            and the infos.
+        """
+        ...
+
+
+def split_groups(num_envs: int, num_groups: int) -> list[slice]:
+    """Split the environments into contiguous groups of (almost) equal size."""
+    if not 1 <= num_groups <= num_envs:
+        raise ValueError(f"Invalid number of groups ({num_groups}) for {num_envs} environments.")
+    bounds = [round(i * num_envs / num_groups) for i in range(num_groups + 1)]
+    return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def merge_group_infos(infos: list[dict], sizes: list[int]) -> dict:
+    """Merge the infos of the groups of a timestep into the infos of all environments.
+
+    Nested dictionaries are merged key by key. Scalar tensors (e.g. the means of the ``log`` infos) are averaged,
+    weighted by the sizes of the groups, and tensors with one row per environment of the group are concatenated.
+    Other values are taken from the last group that has them.
+
+    Args:
+        infos: Infos of the groups, in the order of the environments.
+        sizes: Number of environments of the groups.
+    """
+    merged = {}
+    for key in dict.fromkeys(key for info in infos for key in info):
+        entries = [(info[key], size) for info, size in zip(infos, sizes) if key in info]
+        values = [value for value, _ in entries]
+        if all(isinstance(value, dict) for value in values):
+            merged[key] = merge_group_infos(values, [size for _, size in entries])
+        elif all(isinstance(value, torch.Tensor) and value.numel() == 1 for value in values):
+            weights = torch.tensor([size for _, size in entries], dtype=torch.float32, device=values[0].device)
+            merged[key] = (torch.stack([value.reshape(()).float() for value in values]) * weights).sum() / weights.sum()
+        elif all(isinstance(value, torch.Tensor) and value.ndim and len(value) == size for value, size in entries):
+            merged[key] = torch.cat(values)
+        else:
+            merged[key] = values[-1]
+    return merged
+
+
+class GroupStepper:
+    """Steps groups of environments in a worker thread (and on a separate stream on CUDA devices).
+
+    Args:
+        env: Environment that steps groups of environments.
+        device: Device of the environment.
+    """
+
+    def __init__(self, env: GroupedVecEnv, device: str):
+        if not isinstance(env, GroupedVecEnv):
+            raise ValueError(f"The environment ({type(env).__name__}) cannot step groups of environments.")
+        self.env = env
+        self._stream = torch.cuda.Stream(device) if torch.device(device).type == "cuda" else None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="group-stepper")
+
+    def submit(self, env_ids: slice, actions: torch.Tensor) -> Future:
+        """Start stepping a group of environments. The outputs are returned by :meth:`result`."""
+        ready = None
+        if self._stream is not None:
+            # the actions are computed on the current stream
+            ready = torch.cuda.Event()
+            ready.record()
+            actions.record_stream(self._stream)
+        return self._executor.submit(self._step, env_ids, actions, ready)
+
+    def result(self, future: Future) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, dict]:
+        """Wait for a step (and make its outputs available to the current stream)."""
+        outputs, done = future.result()
+        if done is not None:
+            stream = torch.cuda.current_stream()
+            stream.wait_event(done)
+            for tensor in outputs[:4]:
+                tensor.record_stream(stream)
+        return outputs
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def _step(self, env_ids: slice, actions: torch.Tensor, ready):
+        if self._stream is None:
+            return self.env.step_group(env_ids, actions), None
+        with torch.cuda.stream(self._stream):
+            self._stream.wait_event(ready)
+            outputs = self.env.step_group(env_ids, actions)
+            done = torch.cuda.Event()
+            done.record(self._stream)
+        return outputs, done
@@ -0,0 +1,430 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Kinematic model of the arm: a serial chain of revolute joints, its batched forward kinematics, Jacobians and
+inverse kinematics.
+
+The chain is described by a :class:`KinematicChain` (stored as JSON): for every joint, the pose of its frame in the
+frame of the previous joint (the robot root for the first joint), its axis in its own frame and its position limits;
+and the offset of the end-effector body (``arm_end``) in the frame of the last joint. All positions are w.r.t. the
+robot root, i.e. the env origin of the tasks.
+
+The chain is read from the physics joints of the asset (``source/arm.usd``, requires ``pxr``, e.g. from Isaac Sim or
+the ``usd-core`` package) with :meth:`KinematicChain.from_usd`, and exported to JSON to be used without USD (see
+``scripts/tools/export_arm_chain.py``). :data:`NOMINAL_ARM_CHAIN` is a nominal geometry of the 8-joint arm
+(alternating yaw/pitch joints whose reach covers the target range of the reach task), for checkouts without the
+asset (it is stored with git LFS).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import torch
+from dataclasses import dataclass, field
+
+USD_EXTENSIONS = (".usd", ".usda", ".usdc")
+"""File extensions of USD assets."""
+
+
+@dataclass
+class JointSpec:
+    """Revolute joint of a :class:`KinematicChain`."""
+
+    name: str
+    """Name of the joint."""
+    origin: tuple[float, float, float]
+    """Position of the joint frame in the frame of the previous joint (in m)."""
+    axis: tuple[float, float, float]
+    """Rotation axis in the joint frame."""
+    rotation: tuple[float, float, float, float] = (1.0, 0.0, 0.0, 0.0)
+    """Orientation (w, x, y, z) of the joint frame in the frame of the previous joint (at zero joint position)."""
+    limits: tuple[float, float] = (-math.inf, math.inf)
+    """Lower and upper position limits (in rad)."""
+
+
+@dataclass
+class KinematicChain:
+    """Serial chain of revolute joints ending at the end-effector body."""
+
+    joints: list[JointSpec]
+    """Joints from the root to the end-effector."""
+    ee_offset: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    """Position of the end-effector body in the frame of the last joint (in m)."""
+    ee_name: str = "arm_end"
+    """Name of the end-effector body."""
+    source: str = field(default="", compare=False)
+    """Where the chain was loaded from (informative)."""
+
+    @property
+    def num_joints(self) -> int:
+        return len(self.joints)
+
+    @property
+    def joint_names(self) -> list[str]:
+        return [joint.name for joint in self.joints]
+
+    @classmethod
+    def from_dict(cls, data: dict, source: str = "") -> KinematicChain:
+        """Create the chain from its JSON representation (see :meth:`to_dict`)."""
+        joints = []
+        for joint in data["joints"]:
+            limits = joint.get("limits") or (None, None)
+            joints.append(
+                JointSpec(
+                    name=joint["name"],
+                    origin=tuple(joint["origin"]),
+                    axis=tuple(joint["axis"]),
+                    rotation=tuple(joint.get("rotation", (1.0, 0.0, 0.0, 0.0))),
+                    # note: JSON has no infinity, unlimited joints are stored with null limits
+                    limits=(
+                        -math.inf if limits[0] is None else limits[0],
+                        math.inf if limits[1] is None else limits[1],
+                    ),
+                )
+            )
+        end_effector = data.get("end_effector", {})
+        return cls(
+            joints=joints,
+            ee_offset=tuple(end_effector.get("origin", (0.0, 0.0, 0.0))),
+            ee_name=end_effector.get("name", "arm_end"),
+            source=source,
+        )
+
+    def to_dict(self) -> dict:
+        """JSON representation of the chain."""
+        return {
+            "joints": [
+                {
+                    "name": joint.name,
+                    "origin": list(joint.origin),
+                    "rotation": list(joint.rotation),
+                    "axis": list(joint.axis),
+                    "limits": [None if math.isinf(limit) else limit for limit in joint.limits],
+                }
+                for joint in self.joints
+            ],
+            "end_effector": {"name": self.ee_name, "origin": list(self.ee_offset)},
+        }
+
+    @classmethod
+    def from_json(cls, path: str) -> KinematicChain:
+        with open(path) as f:
+            return cls.from_dict(json.load(f), source=path)
+
+    def to_json(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> KinematicChain:
+        """Load the chain from a JSON file or from a USD asset (by the file extension)."""
+        if path.endswith(USD_EXTENSIONS):
+            return cls.from_usd(path)
+        return cls.from_json(path)
+
+    @classmethod
+    def from_usd(cls, path: str, root_body: str = "base_link", ee_body: str = "arm_end") -> KinematicChain:
+        """Read the chain from the physics joints of a USD asset.
+
+        The joints (``UsdPhysics``) are followed from the root body to the end-effector body. The frames of the
+        revolute joints become the joints of the chain; fixed joints are folded into the pose of the next joint (or
+        of the end-effector). The root body frame is the robot root. The limits are converted from degrees; limits
+        beyond ``1e6`` degrees are unlimited. The bodies are assumed to be unscaled.
+
+        Args:
+            path: Path of the USD file.
+            root_body: Name of the root body.
+            ee_body: Name of the end-effector body.
+
+        Raises:
+            ValueError: If the joints do not connect the root body to the end-effector body.
+        """
+        from pxr import Usd, UsdPhysics
+
+        stage = Usd.Stage.Open(path)
+        # joints by the name of their parent body (body0)
+        children: dict[str, list] = {}
+        for prim in stage.Traverse():
+            if not prim.IsA(UsdPhysics.Joint):
+                continue
+            joint = UsdPhysics.Joint(prim)
+            body0, body1 = joint.GetBody0Rel().GetTargets(), joint.GetBody1Rel().GetTargets()
+            if body0 and body1 and (prim.IsA(UsdPhysics.RevoluteJoint) or prim.IsA(UsdPhysics.FixedJoint)):
+                children.setdefault(body0[0].name, []).append((prim, body1[0].name))
+
+        # path of joints from the root body to the end-effector body (depth-first)
+        def find_path(body: str, visited: set) -> list | None:
+            if body == ee_body:
+                return []
+            for prim, child in children.get(body, []):
+                if child not in visited:
+                    rest = find_path(child, visited | {child})
+                    if rest is not None:
+                        return [prim] + rest
+            return None
+
+        joint_path = find_path(root_body, {root_body})
+        if joint_path is None:
+            raise ValueError(f"No joints connect '{root_body}' to '{ee_body}' in {path}.")
+
+        joints = []
+        # pose of the current body in the frame of the previous joint (the root body is the robot root)
+        pose = ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0, 0.0))
+        for prim in joint_path:
+            joint = UsdPhysics.Joint(prim)
+            # joint frame in the parent body and in the child body
+            frame0 = (_vec(joint.GetLocalPos0Attr().Get()), _quat(joint.GetLocalRot0Attr().Get()))
+            frame1 = (_vec(joint.GetLocalPos1Attr().Get()), _quat(joint.GetLocalRot1Attr().Get()))
+            frame = _compose(pose, frame0)
+            if prim.IsA(UsdPhysics.FixedJoint):
+                pose = _compose(frame, _invert(frame1))
+                continue
+            revolute = UsdPhysics.RevoluteJoint(prim)
+            axis = {"X": (1.0, 0.0, 0.0), "Y": (0.0, 1.0, 0.0), "Z": (0.0, 0.0, 1.0)}[revolute.GetAxisAttr().Get()]
+            limits = []
+            for value, unlimited in (
+                (revolute.GetLowerLimitAttr().Get(), -math.inf),
+                (revolute.GetUpperLimitAttr().Get(), math.inf),
+            ):
+                limits.append(unlimited if value is None or abs(value) > 1e6 else math.radians(value))
+            joints.append(
+                JointSpec(prim.GetName(), origin=frame[0], axis=axis, rotation=frame[1], limits=tuple(limits))
+            )
+            # the child body in the joint frame (the joint rotation is applied by the kinematics)
+            pose = _invert(frame1)
+        return cls(joints=joints, ee_offset=pose[0], ee_name=ee_body, source=path)
+
+
+NOMINAL_ARM_CHAIN = KinematicChain(
+    joints=[
+        JointSpec(
+            f"joint_{i}",
+            origin=(0.0, 0.0, 0.05 if i == 1 else 0.08),
+            axis=(0.0, 0.0, 1.0) if i % 2 else (0.0, 1.0, 0.0),
+        )
+        for i in range(1, 9)
+    ],
+    ee_offset=(0.0, 0.0, 0.05),
+    source="nominal",
+)
+"""Nominal geometry of the arm: 8 revolute joints (yaw about z for the odd joints, pitch about y for the even ones),
+0.08 m apart and 0.05 m above the root, with the end-effector 0.05 m past the last joint (straight up at zero
+joint positions, 0.66 m above the root). The joints are unlimited (the tasks bound them with terminations)."""
+
+
+"""
+Poses (plain floats, for reading the assets).
+"""
+
+
+def _vec(value) -> tuple[float, float, float]:
+    return (0.0, 0.0, 0.0) if value is None else tuple(float(v) for v in value)
+
+
+def _quat(value) -> tuple[float, float, float, float]:
+    if value is None:
+        return (1.0, 0.0, 0.0, 0.0)
+    return (float(value.GetReal()), *(float(v) for v in value.GetImaginary()))
+
+
+def _quat_mul(q: tuple, r: tuple) -> tuple[float, float, float, float]:
+    w1, x1, y1, z1 = q
+    w2, x2, y2, z2 = r
+    return (
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+    )
+
+
+def _quat_apply(q: tuple, v: tuple) -> tuple[float, float, float]:
+    conjugate = (q[0], -q[1], -q[2], -q[3])
+    return _quat_mul(_quat_mul(q, (0.0, *v)), conjugate)[1:]
+
+
+def _compose(a: tuple, b: tuple) -> tuple:
+    """Pose ``b`` (position, quaternion) given in the frame of pose ``a``, in the frame ``a`` is given in."""
+    position = tuple(p + t for p, t in zip(a[0], _quat_apply(a[1], b[0])))
+    return position, _quat_mul(a[1], b[1])
+
+
+def _invert(pose: tuple) -> tuple:
+    conjugate = (pose[1][0], -pose[1][1], -pose[1][2], -pose[1][3])
+    return tuple(-v for v in _quat_apply(conjugate, pose[0])), conjugate
+
+
+"""
+Kinematics.
+"""
+
+
+def _skew(vectors: torch.Tensor) -> torch.Tensor:
+    """Cross-product matrices of vectors. Shape is (..., 3) -> (..., 3, 3)."""
+    x, y, z = vectors.unbind(-1)
+    zero = torch.zeros_like(x)
+    return torch.stack((zero, -z, y, z, zero, -x, -y, x, zero), dim=-1).view(*vectors.shape, 3)
+
+
+def _quat_to_matrix(quats: torch.Tensor) -> torch.Tensor:
+    """Rotation matrices of (w, x, y, z) quaternions. Shape is (..., 4) -> (..., 3, 3)."""
+    w, x, y, z = torch.nn.functional.normalize(quats, dim=-1).unbind(-1)
+    return torch.stack(
+        (
+            1 - 2 * (y * y + z * z),
+            2 * (x * y - w * z),
+            2 * (x * z + w * y),
+            2 * (x * y + w * z),
+            1 - 2 * (x * x + z * z),
+            2 * (y * z - w * x),
+            2 * (x * z - w * y),
+            2 * (y * z + w * x),
+            1 - 2 * (x * x + y * y),
+        ),
+        dim=-1,
+    ).view(*quats.shape[:-1], 3, 3)
+
+
+class ArmKinematics:
+    """Batched forward kinematics of a :class:`KinematicChain`.
+
+    The rotation of a joint frame w.r.t. its parent is ``R0 @ R(axis, q)``. With Rodrigues' formula
+    ``R(axis, q) = I + sin(q) K + (1 - cos(q)) K^2`` (``K`` the cross-product matrix of the axis), the constant
+    products ``R0``, ``R0 K`` and ``R0 K^2`` are precomputed, so the local rotations of all joints are computed in one
+    pass and only their chaining loops over the joints.
+
+    Args:
+        chain: Kinematic chain.
+        device: Device of the tensors.
+    """
+
+    def __init__(self, chain: KinematicChain, device: str = "cpu"):
+        self.chain = chain
+        self.device = device
+        self.num_joints = chain.num_joints
+        axes = torch.nn.functional.normalize(
+            torch.tensor([joint.axis for joint in chain.joints], dtype=torch.float32), dim=-1
+        )
+        rotations = _quat_to_matrix(torch.tensor([joint.rotation for joint in chain.joints], dtype=torch.float32))
+        skew = _skew(axes)
+        # constant terms of the local rotations - shape: (num_joints, 3, 3)
+        self._rot_const = rotations.to(device)
+        self._rot_sin = (rotations @ skew).to(device)
+        self._rot_versine = (rotations @ skew @ skew).to(device)
+        self.origins = torch.tensor([joint.origin for joint in chain.joints], device=device)
+        self.axes = axes.to(device)
+        self.ee_offset = torch.tensor(chain.ee_offset, device=device)
+        self.lower_limits = torch.tensor([joint.limits[0] for joint in chain.joints], device=device)
+        self.upper_limits = torch.tensor([joint.limits[1] for joint in chain.joints], device=device)
+
+    def forward_kinematics(self, joint_pos: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Compute the poses of the joint frames and of the end-effector.
+
+        Args:
+            joint_pos: Joint positions. Shape is (N, num_joints).
+
+        Returns:
+            The positions, shape (N, num_joints + 1, 3), and the rotation matrices, shape (N, num_joints + 1, 3, 3),
+            of the joint frames followed by the end-effector (w.r.t. the robot root).
+        """
+        local = self._local_rotations(joint_pos)
+        num_envs = joint_pos.shape[0]
+        positions = torch.empty(num_envs, self.num_joints + 1, 3, device=joint_pos.device)
+        rotations = torch.empty(num_envs, self.num_joints + 1, 3, 3, device=joint_pos.device)
+        position = self.origins[0].expand(num_envs, 3)
+        rotation = local[:, 0]
+        positions[:, 0], rotations[:, 0] = position, rotation
+        for j in range(1, self.num_joints):
+            position = position + rotation @ self.origins[j]
+            rotation = rotation @ local[:, j]
+            positions[:, j], rotations[:, j] = position, rotation
+        positions[:, -1] = position + rotation @ self.ee_offset
+        rotations[:, -1] = rotation
+        return positions, rotations
+
+    def end_effector_positions(self, joint_pos: torch.Tensor) -> torch.Tensor:
+        """Compute the end-effector positions (w.r.t. the robot root) only. Shape is (N, num_joints) -> (N, 3)."""
+        local = self._local_rotations(joint_pos)
+        position = self.origins[0].expand(joint_pos.shape[0], 3)
+        rotation = local[:, 0]
+        for j in range(1, self.num_joints):
+            position = position + rotation @ self.origins[j]
+            rotation = rotation @ local[:, j]
+        return position + rotation @ self.ee_offset
+
+    def jacobian(self, joint_pos: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Compute the geometric Jacobian of the end-effector.
+
+        The column of a revolute joint is ``[z x (p_ee - p), z]``, with ``z`` its axis and ``p`` its position
+        (w.r.t. the robot root).
+
+        Args:
+            joint_pos: Joint positions. Shape is (N, num_joints).
+
+        Returns:
+            The Jacobian, shape (N, 6, num_joints) (linear rows first), and the end-effector positions, shape (N, 3).
+        """
+        positions, rotations = self.forward_kinematics(joint_pos)
+        # world axes of the joints (a joint rotation does not move its own axis)
+        axes = (rotations[:, :-1] @ self.axes.unsqueeze(-1)).squeeze(-1)
+        ee_pos = positions[:, -1]
+        linear = torch.linalg.cross(axes, ee_pos.unsqueeze(1) - positions[:, :-1], dim=-1)
+        return torch.cat((linear, axes), dim=-1).transpose(1, 2), ee_pos
+
+    def inverse_kinematics(
+        self,
+        target_pos: torch.Tensor,
+        joint_pos: torch.Tensor | None = None,
+        damping: float = 0.05,
+        max_iterations: int = 100,
+        tolerance: float = 1e-3,
+        max_step: float = 0.2,
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Solve the end-effector position IK by damped least squares, for all targets at once.
+
+        Every iteration updates the joint positions by ``J^T (J J^T + damping^2 I)^-1 e`` (``J`` the linear rows of the
+        Jacobian, ``e`` the position error), with the update clipped to ``max_step`` per joint and the joint positions
+        to their limits. Solved targets are not updated anymore and the iterations stop once all are solved. The
+        orientation of the end-effector is free (the reach task only constrains its position).
+
+        Args:
+            target_pos: End-effector targets (w.r.t. the robot root). Shape is (N, 3).
+            joint_pos: Initial joint positions. Shape is (N, num_joints). Defaults to zero.
+            damping: Damping of the least squares (regularizes the steps near singularities).
+            max_iterations: Maximum number of iterations.
+            tolerance: Position error under which a target is solved (in m).
+            max_step: Maximum update of a joint position per iteration (in rad).
+
+        Returns:
+            The joint positions, shape (N, num_joints), and the remaining position errors, shape (N,). The targets
+            with an error above the tolerance were not reached (e.g. out of reach, or a local minimum).
+        """
+        num_targets = target_pos.shape[0]
+        if joint_pos is None:
+            joint_pos = torch.zeros(num_targets, self.num_joints, device=target_pos.device)
+        joint_pos = joint_pos.clone()
+        regularization = damping**2 * torch.eye(3, device=target_pos.device)
+        for _ in range(max_iterations):
+            jacobian, ee_pos = self.jacobian(joint_pos)
+            error = target_pos - ee_pos
+            distance = torch.linalg.vector_norm(error, dim=-1)
+            active = distance > tolerance
+            if not active.any():
+                break
+            linear = jacobian[:, :3]
+            step = torch.linalg.solve(linear @ linear.transpose(1, 2) + regularization, error.unsqueeze(-1))
+            step = (linear.transpose(1, 2) @ step).squeeze(-1).clamp_(-max_step, max_step)
+            joint_pos.add_(step.mul_(active.unsqueeze(-1)))
+            torch.clamp(joint_pos, self.lower_limits, self.upper_limits, out=joint_pos)
+        else:
+            distance = torch.linalg.vector_norm(target_pos - self.end_effector_positions(joint_pos), dim=-1)
+        return joint_pos, distance
+
+    def _local_rotations(self, joint_pos: torch.Tensor) -> torch.Tensor:
+        """Rotations of the joint frames w.r.t. their parents. Shape is (N, num_joints) -> (N, num_joints, 3, 3)."""
+        sin = joint_pos.sin()[..., None, None]
+        versine = (1.0 - joint_pos.cos())[..., None, None]
+        return torch.addcmul(torch.addcmul(self._rot_const, sin, self._rot_sin), versine, self._rot_versine)
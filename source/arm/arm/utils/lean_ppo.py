@@ -0,0 +1,520 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Lean PPO learner: rollouts, advantages and updates without skrl's trainer, memory and agent layers.
+
+The learner runs the same algorithm as skrl's PPO (same losses, clipping, preprocessors, learning rate scheduler
+and mixed precision) on the models and optimizer of a skrl agent, but:
+
+* the rollouts are stored in one contiguous ``(T, N, F)`` tensor (:class:`RolloutBuffer`) with named column views,
+  written with one copy per tensor and step,
+* the advantages are computed with :func:`~arm.utils.advantages.compute_gae` (truncations bootstrap),
+* every epoch draws one permutation of the samples and gathers the whole buffer once into a preallocated tensor,
+  the mini-batches are slices (views) of it,
+* optionally, the environments step in groups whose steps overlap the inference of the other groups
+  (:mod:`arm.utils.interleaved`).
+
+The checkpoints and the tracking data are written by the skrl agent (see :meth:`LeanPPO.from_skrl_agent`), so the
+checkpoints keep skrl's format (and the checkpoint writers of :mod:`arm.utils`). The learner only needs models with
+skrl's ``act`` interface, so it also runs (on CPU) with plain models and a stub environment.
+"""
+
+from __future__ import annotations
+
+import collections
+import itertools
+import torch
+from collections.abc import Callable
+
+from .advantages import compute_gae, normalize_advantages
+from .interleaved import GroupStepper, merge_group_infos, split_groups
+
+
+class RolloutBuffer:
+    """Rollout storage as one contiguous ``(T, N, F)`` tensor with named column views."""
+
+    def __init__(self, rollouts: int, num_envs: int, num_observations: int, num_actions: int, device: str):
+        sizes = {
+            "states": num_observations,
+            "actions": num_actions,
+            "rewards": 1,
+            "log_prob": 1,
+            "values": 1,
+            "returns": 1,
+            "advantages": 1,
+        }
+        self.columns = {}
+        start = 0
+        for name, size in sizes.items():
+            self.columns[name] = slice(start, start + size)
+            start += size
+        self.rollouts = rollouts
+        self.num_envs = num_envs
+        self.storage = torch.zeros(rollouts, num_envs, start, device=device)
+        self.terminated = torch.zeros(rollouts, num_envs, 1, dtype=torch.bool, device=device)
+        self.truncated = torch.zeros(rollouts, num_envs, 1, dtype=torch.bool, device=device)
+        # shuffled copy of the samples (the mini-batches are views of it)
+        self._shuffled = torch.empty(rollouts * num_envs, start, device=device)
+        self.step = 0
+
+    def __getitem__(self, name: str) -> torch.Tensor:
+        """View of a column over all steps and environments, shape is (T, N, size)."""
+        return self.storage[..., self.columns[name]]
+
+    @property
+    def full(self) -> bool:
+        """Whether all steps of the rollout are stored."""
+        return self.step == self.rollouts
+
+    def add(self, terminated: torch.Tensor, truncated: torch.Tensor, **tensors: torch.Tensor):
+        """Store the tensors of one step (by column name) and the episode ends."""
+        self.write(self.step, slice(None), terminated, truncated, **tensors)
+        self.step += 1
+
+    def write(
+        self,
+        step: int,
+        env_ids: slice,
+        terminated: torch.Tensor | None = None,
+        truncated: torch.Tensor | None = None,
+        **tensors: torch.Tensor,
+    ):
+        """Store tensors (by column name) and/or the episode ends of a group of environments at a step."""
+        row = self.storage[step, env_ids]
+        for name, tensor in tensors.items():
+            row[:, self.columns[name]] = tensor
+        if terminated is not None:
+            self.terminated[step, env_ids] = terminated
+        if truncated is not None:
+            self.truncated[step, env_ids] = truncated
+
+    def mini_batches(self, num_mini_batches: int, shuffle: bool = True) -> list[dict[str, torch.Tensor]]:
+        """Split the samples into mini-batches of column views.
+
+        Args:
+            num_mini_batches: Number of mini-batches (the remaining samples are dropped, as skrl's memory does).
+            shuffle: Whether to gather the samples in the order of a random permutation (one copy into a
+                preallocated tensor). If False, the mini-batches are views of the storage (consecutive steps).
+        """
+        samples = self.storage.view(-1, self.storage.shape[-1])
+        if shuffle:
+            permutation = torch.randperm(samples.shape[0], device=samples.device)
+            samples = torch.index_select(samples, 0, permutation, out=self._shuffled)
+        batch_size = samples.shape[0] // num_mini_batches
+        batches = []
+        for i in range(num_mini_batches):
+            batch = samples[i * batch_size : (i + 1) * batch_size]
+            batches.append({name: batch[:, column] for name, column in self.columns.items()})
+        return batches
+
+
+def _identity(x: torch.Tensor, train: bool = False, inverse: bool = False) -> torch.Tensor:
+    return x
+
+
+class LeanPPO:
+    """PPO learner on a contiguous rollout buffer.
+
+    Args:
+        policy: Policy model (skrl ``act`` interface: ``act(inputs, role) -> (actions, log_prob, outputs)``).
+        value: Value model (same interface). May be the policy (shared model).
+        optimizer: Optimizer of the parameters of the models.
+        num_envs: Number of environments.
+        num_observations: Size of the observations.
+        num_actions: Size of the actions.
+        device: Device of the rollout buffer.
+        rollouts: Number of steps per rollout (and update).
+        learning_epochs: Number of epochs per update.
+        mini_batches: Number of mini-batches per epoch.
+        discount_factor: Discount factor (gamma).
+        lambda_coefficient: GAE lambda.
+        ratio_clip: Clipping of the probability ratio.
+        value_clip: Clipping of the predicted values.
+        clip_predicted_values: Whether to clip the predicted values.
+        entropy_loss_scale: Scale of the entropy loss.
+        value_loss_scale: Scale of the value loss.
+        grad_norm_clip: Clipping of the gradient norm (disabled if 0).
+        kl_threshold: KL divergence that stops the epoch early (disabled if 0).
+        state_preprocessor: Preprocessor of the observations (skrl interface). Defaults to the identity.
+        value_preprocessor: Preprocessor of the values (skrl interface). Defaults to the identity.
+        scheduler: Learning rate scheduler. Defaults to None.
+        scheduler_uses_kl: Whether the scheduler steps with the KL divergence (skrl's ``KLAdaptiveLR``).
+        rewards_shaper: Function ``(rewards, timestep, timesteps) -> rewards``. Defaults to None.
+        mixed_precision: Whether to run the models under :func:`torch.autocast` (with a gradient scaler).
+        gae_backend: Backend of :func:`~arm.utils.advantages.compute_gae`.
+        bootstrap_truncated: Whether the truncated steps bootstrap from their values.
+        shuffle: Whether to shuffle the samples every epoch (see :meth:`RolloutBuffer.mini_batches`).
+    """
+
+    def __init__(
+        self,
+        policy,
+        value,
+        optimizer: torch.optim.Optimizer,
+        num_envs: int,
+        num_observations: int,
+        num_actions: int,
+        device: str,
+        rollouts: int = 64,
+        learning_epochs: int = 5,
+        mini_batches: int = 16,
+        discount_factor: float = 0.99,
+        lambda_coefficient: float = 0.95,
+        ratio_clip: float = 0.2,
+        value_clip: float = 0.2,
+        clip_predicted_values: bool = False,
+        entropy_loss_scale: float = 0.0,
+        value_loss_scale: float = 1.0,
+        grad_norm_clip: float = 0.5,
+        kl_threshold: float = 0.0,
+        state_preprocessor: Callable | None = None,
+        value_preprocessor: Callable | None = None,
+        scheduler=None,
+        scheduler_uses_kl: bool = False,
+        rewards_shaper: Callable | None = None,
+        mixed_precision: bool = False,
+        gae_backend: str = "scan",
+        bootstrap_truncated: bool = True,
+        shuffle: bool = True,
+    ):
+        self.policy = policy
+        self.value = value
+        self.optimizer = optimizer
+        self.device = device
+        self.rollouts = rollouts
+        self.learning_epochs = learning_epochs
+        self.mini_batches = mini_batches
+        self.discount_factor = discount_factor
+        self.lambda_coefficient = lambda_coefficient
+        self.ratio_clip = ratio_clip
+        self.value_clip = value_clip
+        self.clip_predicted_values = clip_predicted_values
+        self.entropy_loss_scale = entropy_loss_scale
+        self.value_loss_scale = value_loss_scale
+        self.grad_norm_clip = grad_norm_clip
+        self.kl_threshold = kl_threshold
+        self.state_preprocessor = state_preprocessor or _identity
+        self.value_preprocessor = value_preprocessor or _identity
+        self.scheduler = scheduler
+        self.scheduler_uses_kl = scheduler_uses_kl
+        self.rewards_shaper = rewards_shaper
+        self.gae_backend = gae_backend
+        self.bootstrap_truncated = bootstrap_truncated
+        self.shuffle = shuffle
+
+        self._device_type = torch.device(device).type
+        self.mixed_precision = mixed_precision
+        self.scaler = torch.amp.GradScaler(self._device_type, enabled=mixed_precision)
+        if policy is value:
+            self._parameters = list(policy.parameters())
+        else:
+            self._parameters = list(itertools.chain(policy.parameters(), value.parameters()))
+        self.buffer = RolloutBuffer(rollouts, num_envs, num_observations, num_actions, device)
+
+        # hooks (see :meth:`from_skrl_agent`): tracking of the transitions and of the data, checkpoints
+        self.tracking_data = collections.defaultdict(list)
+        self.track_data = lambda tag, value: self.tracking_data[tag].append(value)
+        self.record_transition = None
+        self.post_interaction = None
+
+    @classmethod
+    def from_skrl_agent(cls, agent, num_envs: int, **kwargs) -> LeanPPO:
+        """Create the learner from the models, optimizer, preprocessors and config of a skrl PPO agent.
+
+        The agent must be initialized (e.g. created by skrl's runner). It tracks the data and writes the tracking
+        data and the checkpoints; its memory is released.
+
+        Args:
+            agent: skrl PPO agent (torch).
+            num_envs: Number of environments.
+            kwargs: Arguments of the learner that are not part of the agent config (e.g. ``gae_backend``).
+        """
+        from skrl.agents.torch import Agent
+        from skrl.resources.schedulers.torch import KLAdaptiveLR
+
+        if agent._time_limit_bootstrap and kwargs.get("bootstrap_truncated", True):
+            raise ValueError("Disable the 'time_limit_bootstrap' of the agent, the GAE bootstraps the truncations.")
+        scheduler = getattr(agent, "scheduler", None) if agent._learning_rate_scheduler else None
+        learner = cls(
+            agent.policy,
+            agent.value,
+            agent.optimizer,
+            num_envs=num_envs,
+            num_observations=agent.observation_space.shape[0],
+            num_actions=agent.action_space.shape[0],
+            device=agent.device,
+            rollouts=agent._rollouts,
+            learning_epochs=agent._learning_epochs,
+            mini_batches=agent._mini_batches,
+            discount_factor=agent._discount_factor,
+            lambda_coefficient=agent._lambda,
+            ratio_clip=agent._ratio_clip,
+            value_clip=agent._value_clip,
+            clip_predicted_values=agent._clip_predicted_values,
+            entropy_loss_scale=agent._entropy_loss_scale,
+            value_loss_scale=agent._value_loss_scale,
+            grad_norm_clip=agent._grad_norm_clip,
+            kl_threshold=agent._kl_threshold,
+            state_preprocessor=agent._state_preprocessor,
+            value_preprocessor=agent._value_preprocessor,
+            scheduler=scheduler,
+            scheduler_uses_kl=isinstance(scheduler, KLAdaptiveLR),
+            rewards_shaper=agent._rewards_shaper,
+            mixed_precision=agent._mixed_precision,
+            **kwargs,
+        )
+        learner.scaler = agent.scaler
+        learner.track_data = agent.track_data
+        # note: the base class methods track the rewards/episode lengths and write the tracking data/checkpoints
+        learner.record_transition = lambda *args, **kwargs: Agent.record_transition(agent, *args, **kwargs)
+        learner.post_interaction = lambda *args, **kwargs: Agent.post_interaction(agent, *args, **kwargs)
+        agent.memory = None
+        return learner
+
+    def train(
+        self,
+        env,
+        timesteps: int,
+        initial_timestep: int = 0,
+        environment_info: str = "log",
+        num_groups: int = 1,
+    ):
+        """Collect rollouts and update the models.
+
+        Args:
+            env: Vectorized environment (skrl wrapper interface: ``reset() -> (states, infos)`` and
+                ``step(actions) -> (next_states, rewards, terminated, truncated, infos)``).
+            timesteps: Number of timesteps (environment steps) to train.
+            initial_timestep: First timestep (e.g. when resuming).
+            environment_info: Key of the environment infos whose scalars are tracked (as ``Info / <name>``).
+            num_groups: Number of groups of environments whose steps are interleaved with the inference of the
+                other groups (see :mod:`arm.utils.interleaved`). The environment must step groups if greater than 1.
+        """
+        if num_groups > 1:
+            self._train_interleaved(env, timesteps, initial_timestep, environment_info, num_groups)
+            return
+        states, infos = env.reset()
+        for timestep in range(initial_timestep, timesteps):
+            actions, log_prob, values = self._act(states)
+            with torch.no_grad():
+                next_states, rewards, terminated, truncated, infos = env.step(actions)
+
+                if self.record_transition is not None:
+                    self.record_transition(
+                        states, actions, rewards, next_states, terminated, truncated, infos, timestep, timesteps
+                    )
+                self._track_infos(infos, environment_info)
+                if self.rewards_shaper is not None:
+                    rewards = self.rewards_shaper(rewards, timestep, timesteps)
+                self.buffer.add(
+                    terminated,
+                    truncated,
+                    states=states,
+                    actions=actions,
+                    rewards=rewards,
+                    log_prob=log_prob,
+                    values=values,
+                )
+            states = next_states
+
+            if self.buffer.full:
+                self.update(next_states)
+            if self.post_interaction is not None:
+                self.post_interaction(timestep, timesteps)
+
+    def _act(self, states: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Sample the actions and compute their log-probabilities and the values of the states."""
+        with torch.no_grad(), torch.autocast(device_type=self._device_type, enabled=self.mixed_precision):
+            actions, log_prob, _ = self.policy.act({"states": self.state_preprocessor(states)}, role="policy")
+            values, _, _ = self.value.act({"states": self.state_preprocessor(states)}, role="value")
+            values = self.value_preprocessor(values, inverse=True)
+        return actions, log_prob, values
+
+    def _track_infos(self, infos: dict, environment_info: str):
+        """Track the scalars of the environment infos."""
+        for key, value in infos.get(environment_info, {}).items():
+            if isinstance(value, torch.Tensor) and value.numel() == 1:
+                self.track_data(f"Info / {key}", value.item())
+
+    def _train_interleaved(self, env, timesteps: int, initial_timestep: int, environment_info: str, num_groups: int):
+        """Collect rollouts with the steps of every group overlapping the inference of the next group.
+
+        The inference of a group for a timestep runs while the previous group steps (the last group of the previous
+        timestep for the first group), except for the first timestep of a rollout: the update runs after all groups
+        finished the last step of the rollout, so all samples of a rollout are taken with the same policy.
+        """
+        groups = split_groups(env.num_envs, num_groups)
+        group_sizes = [group.stop - group.start for group in groups]
+        stepper = GroupStepper(env, self.device)
+        buffer = self.buffer
+        states, infos = env.reset()
+        states = states.clone()
+        # full-size (raw) rewards and episode ends of the current timestep (for the tracking)
+        rewards = torch.zeros(env.num_envs, 1, device=self.device)
+        terminated = torch.zeros(env.num_envs, 1, dtype=torch.bool, device=self.device)
+        truncated = torch.zeros_like(terminated)
+        step_infos = []
+        pending = None
+
+        def finish(timestep: int, row: int, env_ids: slice, future):
+            next_states, group_rewards, group_terminated, group_truncated, group_infos = stepper.result(future)
+            rewards[env_ids] = group_rewards
+            terminated[env_ids] = group_terminated
+            truncated[env_ids] = group_truncated
+            if self.rewards_shaper is not None:
+                group_rewards = self.rewards_shaper(group_rewards, timestep, timesteps)
+            buffer.write(row, env_ids, group_terminated, group_truncated, rewards=group_rewards)
+            states[env_ids] = next_states
+            step_infos.append(group_infos)
+            # the timestep ends with the step of its last group
+            if env_ids.stop == env.num_envs:
+                infos = merge_group_infos(step_infos, group_sizes)
+                if self.record_transition is not None:
+                    self.record_transition(
+                        buffer["states"][row],
+                        buffer["actions"][row],
+                        rewards,
+                        states,
+                        terminated,
+                        truncated,
+                        infos,
+                        timestep,
+                        timesteps,
+                    )
+                self._track_infos(infos, environment_info)
+                step_infos.clear()
+                buffer.step = row + 1
+                if buffer.full:
+                    self.update(states)
+                if self.post_interaction is not None:
+                    self.post_interaction(timestep, timesteps)
+
+        try:
+            for timestep in range(initial_timestep, timesteps):
+                row = (timestep - initial_timestep) % buffer.rollouts
+                for env_ids in groups:
+                    actions, log_prob, values = self._act(states[env_ids])
+                    buffer.write(
+                        row, env_ids, states=states[env_ids], actions=actions, log_prob=log_prob, values=values
+                    )
+                    if pending is not None:
+                        finish(*pending)
+                    pending = (timestep, row, env_ids, stepper.submit(env_ids, actions))
+                # last step of the rollout (or of the training): wait before the update
+                if row == buffer.rollouts - 1 or timestep == timesteps - 1:
+                    finish(*pending)
+                    pending = None
+        finally:
+            stepper.close()
+
+    def update(self, next_states: torch.Tensor):
+        """Compute the advantages of the stored rollout and update the models."""
+        buffer = self.buffer
+        with torch.no_grad():
+            with torch.autocast(device_type=self._device_type, enabled=self.mixed_precision):
+                self.value.train(False)
+                last_values, _, _ = self.value.act({"states": self.state_preprocessor(next_states)}, role="value")
+                self.value.train(True)
+                last_values = self.value_preprocessor(last_values, inverse=True)
+            returns, advantages = compute_gae(
+                rewards=buffer["rewards"],
+                values=buffer["values"],
+                last_values=last_values.float(),
+                terminated=buffer.terminated,
+                truncated=buffer.truncated,
+                discount_factor=self.discount_factor,
+                lambda_coefficient=self.lambda_coefficient,
+                bootstrap_truncated=self.bootstrap_truncated,
+                backend=self.gae_backend,
+            )
+            # note: the values are preprocessed (and the preprocessor trained) before the returns, as skrl does
+            buffer["values"].copy_(self.value_preprocessor(buffer["values"], train=True))
+            buffer["returns"].copy_(self.value_preprocessor(returns, train=True))
+            buffer["advantages"].copy_(normalize_advantages(advantages))
+        buffer.step = 0
+
+        cumulative_policy_loss = 0.0
+        cumulative_entropy_loss = 0.0
+        cumulative_value_loss = 0.0
+        for epoch in range(self.learning_epochs):
+            kl_divergences = []
+            for batch in buffer.mini_batches(self.mini_batches, shuffle=self.shuffle):
+                with torch.autocast(device_type=self._device_type, enabled=self.mixed_precision):
+                    states = self.state_preprocessor(batch["states"], train=not epoch)
+                    _, log_prob, _ = self.policy.act(
+                        {"states": states, "taken_actions": batch["actions"]}, role="policy"
+                    )
+
+                    # approximate KL divergence (and early stopping)
+                    with torch.no_grad():
+                        ratio = log_prob - batch["log_prob"]
+                        kl_divergence = ((torch.exp(ratio) - 1) - ratio).mean()
+                        kl_divergences.append(kl_divergence)
+                    if self.kl_threshold and kl_divergence > self.kl_threshold:
+                        break
+
+                    # entropy loss
+                    if self.entropy_loss_scale:
+                        entropy_loss = -self.entropy_loss_scale * self.policy.get_entropy(role="policy").mean()
+                    else:
+                        entropy_loss = 0
+
+                    # policy loss
+                    advantages = batch["advantages"]
+                    ratio = torch.exp(log_prob - batch["log_prob"])
+                    surrogate = advantages * ratio
+                    surrogate_clipped = advantages * torch.clip(ratio, 1.0 - self.ratio_clip, 1.0 + self.ratio_clip)
+                    policy_loss = -torch.min(surrogate, surrogate_clipped).mean()
+
+                    # value loss
+                    predicted_values, _, _ = self.value.act({"states": states}, role="value")
+                    if self.clip_predicted_values:
+                        predicted_values = batch["values"] + torch.clip(
+                            predicted_values - batch["values"], min=-self.value_clip, max=self.value_clip
+                        )
+                    value_loss = self.value_loss_scale * torch.nn.functional.mse_loss(
+                        batch["returns"], predicted_values
+                    )
+
+                # optimization step
+                self.optimizer.zero_grad()
+                self.scaler.scale(policy_loss + entropy_loss + value_loss).backward()
+                if self.grad_norm_clip > 0:
+                    self.scaler.unscale_(self.optimizer)
+                    torch.nn.utils.clip_grad_norm_(self._parameters, self.grad_norm_clip)
+                self.scaler.step(self.optimizer)
+                self.scaler.update()
+
+                cumulative_policy_loss += policy_loss.item()
+                cumulative_value_loss += value_loss.item()
+                if self.entropy_loss_scale:
+                    cumulative_entropy_loss += entropy_loss.item()
+
+            # learning rate
+            if self.scheduler is not None:
+                if self.scheduler_uses_kl:
+                    self.scheduler.step(torch.tensor(kl_divergences, device=self.device).mean().item())
+                else:
+                    self.scheduler.step()
+
+        # tracking (same tags as skrl's PPO)
+        num_batches = self.learning_epochs * self.mini_batches
+        self.track_data("Loss / Policy loss", cumulative_policy_loss / num_batches)
+        self.track_data("Loss / Value loss", cumulative_value_loss / num_batches)
+        if self.entropy_loss_scale:
+            self.track_data("Loss / Entropy loss", cumulative_entropy_loss / num_batches)
+        if hasattr(self.policy, "distribution"):
+            self.track_data("Policy / Standard deviation", self.policy.distribution(role="policy").stddev.mean().item())
+        if self.scheduler is not None:
+            self.track_data("Learning / Learning rate", self.scheduler.get_last_lr()[0])
+
+    def state_dict(self) -> dict:
+        """Checkpoint of the learner in skrl's format (modules by name)."""
+        modules = {"policy": self.policy, "value": self.value, "optimizer": self.optimizer}
+        for name in ("state_preprocessor", "value_preprocessor"):
+            preprocessor = getattr(self, name)
+            if isinstance(preprocessor, torch.nn.Module):
+                modules[name] = preprocessor
+        return {name: module.state_dict() for name, module in modules.items()}
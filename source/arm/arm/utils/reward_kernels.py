@@ -0,0 +1,209 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Scripted kernels of the reach reward terms.
+
+The kernels of the stateless reach/velocity terms mirror the term functions in
+:mod:`arm.tasks.manager_based.arm.mdp.rewards` one-to-one and allow evaluating all of them in a single fused call.
+The rewards of the tasks that compute all their terms in one pass (the direct-workflow task and its kinematic
+surrogate) are shared through :func:`reach_task_reward_terms`.
+"""
+
+from __future__ import annotations
+
+import torch
+
+REACH_REWARD_KINDS = (
+    "end_effector_distance",
+    "distance_guidance",
+    "approach_progress",
+    "joint_velocity",
+    "joint_vel_l1",
+)
+"""Kinds of reward terms computed by :func:`reach_reward_terms` (column order of its output)."""
+
+REACH_TASK_REWARD_TERMS = (
+    ("alive", "rew_scale_alive"),
+    ("terminating", "rew_scale_terminated"),
+    ("end_effector_position", "rew_scale_end_effector_position"),
+    ("distance_guidance", "rew_scale_distance_guidance"),
+    ("approach_progress", "rew_scale_approach_progress"),
+    ("joint_velocity_reward", "rew_scale_joint_velocity"),
+    ("joint_vel", "rew_scale_joint_vel"),
+    ("joint_vel_smooth", "rew_scale_joint_vel_smooth"),
+    ("target_reached", "rew_scale_target_reached"),
+    ("exploration_bonus", "rew_scale_exploration"),
+    ("anti_stagnation", "rew_scale_anti_stagnation"),
+)
+"""Names of the reward terms computed by :func:`reach_task_reward_terms` (column order of its output), as in the
+manager-based task, and the names of their weights in the task configurations."""
+
+
+@torch.jit.script
+def reach_reward_terms(
+    distance: torch.Tensor, prev_distance: torch.Tensor, joint_vel: torch.Tensor, l1_joint_vel: torch.Tensor
+) -> torch.Tensor:
+    """Compute the unweighted reach/velocity reward terms.
+
+    Args:
+        distance: End-effector to target distance. Shape is (num_envs,).
+        prev_distance: Distance of the previous step (pass ``distance`` if there is none). Shape is (num_envs,).
+        joint_vel: Velocities of all joints. Shape is (num_envs, num_joints).
+        l1_joint_vel: Velocities of the joints penalized by the L1 term. Shape is (num_envs, num_l1_joints).
+
+    Returns:
+        The reward terms in the order of :data:`REACH_REWARD_KINDS`. Shape is (num_envs, 5).
+    """
+    # distance_guidance_reward: exp(-3 d) plus the (clamped) improvement w.r.t. the previous step
+    guidance = torch.exp(-distance * 3.0) + torch.clamp((prev_distance - distance) * 100.0, -5.0, 10.0)
+    # approach_progress_reward: 10 (<10cm) + 20 (<5cm) + 50 (<2cm)
+    approach = (distance < 0.1).float() * 10.0 + (distance < 0.05).float() * 20.0 + (distance < 0.02).float() * 50.0
+    # joint_velocity_reward: reward moderate joint motion around 2 rad/s plus a movement bonus
+    velocity_magnitude = torch.norm(joint_vel, dim=1)
+    joint_velocity = torch.exp(-torch.abs(velocity_magnitude - 2.0) / 2.0)
+    joint_velocity = joint_velocity + torch.clamp(velocity_magnitude * 0.5, 0.0, 2.0)
+    # joint_vel_l1
+    l1 = torch.sum(torch.abs(l1_joint_vel), dim=1)
+    return torch.stack([distance, guidance, approach, joint_velocity, l1], dim=1)
+
+
+@torch.jit.script
+def fused_reach_rewards(
+    distance: torch.Tensor,
+    prev_distance: torch.Tensor,
+    joint_vel: torch.Tensor,
+    l1_joint_vel: torch.Tensor,
+    term_kinds: torch.Tensor,
+    weights: torch.Tensor,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Compute the weighted sum of a set of reach/velocity reward terms.
+
+    Args:
+        distance: End-effector to target distance. Shape is (num_envs,).
+        prev_distance: Distance of the previous step (pass ``distance`` if there is none). Shape is (num_envs,).
+        joint_vel: Velocities of all joints. Shape is (num_envs, num_joints).
+        l1_joint_vel: Velocities of the joints penalized by the L1 term. Shape is (num_envs, num_l1_joints).
+        term_kinds: Index into :data:`REACH_REWARD_KINDS` of every term. Shape is (num_terms,).
+        weights: Weight of every term. Shape is (num_terms,).
+
+    Returns:
+        A tuple containing the weighted sum, shape (num_envs,), and the weighted per-term breakdown,
+        shape (num_envs, num_terms).
+    """
+    terms = reach_reward_terms(distance, prev_distance, joint_vel, l1_joint_vel)
+    breakdown = terms[:, term_kinds] * weights
+    return torch.sum(breakdown, dim=1), breakdown
+
+
+@torch.jit.script
+def voxel_hash(positions: torch.Tensor, voxel_size: float, num_buckets: int) -> torch.Tensor:
+    """Hash positions into buckets of a fixed-size table by the voxel they lie in.
+
+    Uses the spatial hash of Teschner et al. (2003): the XOR of the integer voxel coordinates multiplied by
+    large primes, modulo the table size.
+
+    Args:
+        positions: Positions to hash. Shape is (N, 3).
+        voxel_size: Edge length of the (cubic) voxels.
+        num_buckets: Size of the hash table.
+
+    Returns:
+        Bucket index in ``[0, num_buckets)`` of every position. Shape is (N,).
+    """
+    voxels = torch.floor(positions / voxel_size).long()
+    hashed = torch.bitwise_xor(voxels[:, 0] * 73856093, voxels[:, 1] * 19349663)
+    hashed = torch.bitwise_xor(hashed, voxels[:, 2] * 83492791)
+    return torch.remainder(hashed, num_buckets)
+
+
+"""
+Single-pass rewards of the reach task.
+"""
+
+
+def reach_task_reward_weights(cfg, step_dt: float, device: str) -> torch.Tensor:
+    """Weights (including the step dt) of the terms of :data:`REACH_TASK_REWARD_TERMS`, read from a task config."""
+    weights = [getattr(cfg, scale_name) for _, scale_name in REACH_TASK_REWARD_TERMS]
+    return step_dt * torch.tensor(weights, device=device)
+
+
+def success_threshold(cfg, curriculum_step: int) -> float:
+    """Success threshold of the curriculum step (``cfg.success_thresholds``, then ``cfg.success_threshold_final``)."""
+    for until_step, threshold in cfg.success_thresholds:
+        if curriculum_step < until_step:
+            return threshold
+    return cfg.success_threshold_final
+
+
+def reach_task_reward_terms(
+    terms: torch.Tensor,
+    terminated: torch.Tensor,
+    distance: torch.Tensor,
+    ee_pos: torch.Tensor,
+    joint_vel: torch.Tensor,
+    l1_joint_vel: torch.Tensor,
+    prev_distance: torch.Tensor,
+    has_prev: torch.Tensor,
+    stagnation_counter: torch.Tensor,
+    visits: torch.Tensor,
+    threshold: float,
+    success_bonus: float,
+    voxel_size: float,
+) -> torch.Tensor:
+    """Compute the unweighted reward terms of the reach task in place and advance the reward state.
+
+    Next to the reach/velocity terms (:func:`reach_reward_terms`, the guidance improvement is only given to envs
+    with a previous distance), the terms are: the success bonus, the count-based exploration bonus of the visited
+    voxels (:func:`voxel_hash`) and the anti-stagnation term (the improvement w.r.t. the previous step plus a
+    penalty of long stagnation). All terms see the current targets; the caller respawns the targets of the
+    returned successful envs afterwards.
+
+    The tensors can be views of a group of environments; the reward state (``prev_distance``, ``has_prev``,
+    ``stagnation_counter`` and ``visits``) is updated in place.
+
+    Args:
+        terms: Output buffer of the terms in the order of :data:`REACH_TASK_REWARD_TERMS`. Shape is (N, 11).
+        terminated: Terminated envs of the step. Shape is (N,).
+        distance: End-effector to target distance. Shape is (N,).
+        ee_pos: End-effector position in the env frame. Shape is (N, 3).
+        joint_vel: Velocities of all joints. Shape is (N, num_joints).
+        l1_joint_vel: Velocities of the joints penalized by the L1 term. Shape is (N, num_l1_joints).
+        prev_distance: Distance of the previous step. Shape is (N,).
+        has_prev: Whether the env has a previous distance since its reset. Shape is (N,).
+        stagnation_counter: Number of steps without improvement. Shape is (N,).
+        visits: Visit counts of the hashed voxels. Shape is (N, num_buckets).
+        threshold: Success threshold (see :func:`success_threshold`).
+        success_bonus: Unweighted bonus of a success.
+        voxel_size: Edge length of the exploration voxels.
+
+    Returns:
+        The envs that reached their target. Shape is (N,).
+    """
+    # alive / terminating
+    torch.logical_not(terminated, out=terms[:, 0])
+    terms[:, 1].copy_(terminated)
+    # reach/velocity terms
+    prev_input = torch.where(has_prev, prev_distance, distance)
+    terms[:, 2:7] = reach_reward_terms(distance, prev_input, joint_vel, l1_joint_vel)
+    # joint_vel_smooth: the same L1 term as joint_vel, with its own weight
+    terms[:, 7].copy_(terms[:, 6])
+    # success bonus
+    reached = distance < threshold
+    torch.mul(reached, success_bonus, out=terms[:, 8])
+    # exploration: count-based bonus of the visited voxels
+    buckets = voxel_hash(ee_pos, voxel_size, visits.shape[1])
+    rows = torch.arange(len(buckets), device=buckets.device)
+    counts = visits[rows, buckets] + 1
+    visits[rows, buckets] = counts
+    torch.rsqrt(counts.float(), out=terms[:, 9])
+    # anti-stagnation: improvement w.r.t. the previous step and penalty of long stagnation
+    improvement = prev_distance - distance
+    stagnation_counter.add_(1.0).mul_((improvement < 0.001) & has_prev)
+    penalty = torch.div(stagnation_counter, 500.0).clamp_(min=1.0).log_().neg_()
+    torch.mul(improvement, 50.0, out=terms[:, 10]).clamp_(-2.0, 5.0).add_(penalty).mul_(has_prev)
+    # update the state
+    prev_distance.copy_(distance)
+    has_prev.fill_(True)
+    return reached
@@ -0,0 +1,32 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""skrl's runner with the agents and memories of :mod:`arm.utils`."""
+
+from __future__ import annotations
+
+from skrl.utils.runner.torch import Runner
+
+from .gae_ppo import GAEPPO
+from .mixed_precision import ReducedPrecisionMemory
+
+
+class ArmRunner(Runner):
+    """skrl's runner (torch) that also instantiates the components of :mod:`arm.utils`.
+
+    * PPO agents whose config has a ``gae_backend`` entry are :class:`~arm.utils.gae_ppo.GAEPPO` agents.
+    * The memory class ``ReducedPrecisionMemory`` is :class:`~arm.utils.mixed_precision.ReducedPrecisionMemory`.
+    """
+
+    def _generate_agent(self, env, cfg, models):
+        self._gae = cfg.get("agent", {}).get("gae_backend") is not None
+        return super()._generate_agent(env, cfg, models)
+
+    def _component(self, name: str) -> type:
+        if name.lower() == "ppo" and getattr(self, "_gae", False):
+            return GAEPPO
+        if name.lower() == "reducedprecisionmemory":
+            return ReducedPrecisionMemory
+        return super()._component(name)
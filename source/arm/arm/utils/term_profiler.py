@@ -0,0 +1,201 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Latency profiler of the MDP terms of a manager-based environment.
+
+The profiler wraps the term functions of an environment config before the environment is created. Each call of
+a wrapped term is timed with a pair of CUDA events (GPU) or :func:`time.perf_counter_ns` (CPU). The timings of
+the last ``window`` calls of every term are kept in a ring buffer. The CUDA events are only read back when the
+percentiles are reported, so timing a call does not synchronize the device.
+
+Nothing is wrapped unless :meth:`TermProfiler.wrap_env_cfg` is called, so the profiler has no cost when it is
+not used.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import math
+import time
+import torch
+from collections.abc import Callable
+
+
+class _TermTimer:
+    """Ring buffer of the latencies of the last ``window`` calls of one term."""
+
+    def __init__(self, window: int, use_cuda: bool):
+        self.window = window
+        self.use_cuda = use_cuda
+        self.num_calls = 0
+        if use_cuda:
+            self._start = [torch.cuda.Event(enable_timing=True) for _ in range(window)]
+            self._end = [torch.cuda.Event(enable_timing=True) for _ in range(window)]
+        else:
+            self._elapsed_ns = [0] * window
+
+    def time(self, func: Callable, args: tuple, kwargs: dict):
+        """Call ``func(*args, **kwargs)`` and record its latency."""
+        slot = self.num_calls % self.window
+        self.num_calls += 1
+        if self.use_cuda:
+            self._start[slot].record()
+            output = func(*args, **kwargs)
+            self._end[slot].record()
+        else:
+            start = time.perf_counter_ns()
+            output = func(*args, **kwargs)
+            self._elapsed_ns[slot] = time.perf_counter_ns() - start
+        return output
+
+    def latencies_ms(self) -> list[float]:
+        """Latencies of the recorded calls in the window (in ms). Synchronizes the device on CUDA."""
+        num_filled = min(self.num_calls, self.window)
+        if self.use_cuda:
+            if num_filled > 0:
+                self._end[(self.num_calls - 1) % self.window].synchronize()
+            return [self._start[i].elapsed_time(self._end[i]) for i in range(num_filled)]
+        return [self._elapsed_ns[i] * 1e-6 for i in range(num_filled)]
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of a sorted list."""
+    rank = math.ceil(q / 100.0 * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+class TermProfiler:
+    """Time the reward, observation and termination terms of a manager-based environment.
+
+    Usage (before the environment is created):
+
+    .. code-block:: python
+
+        profiler = TermProfiler(env_cfg.sim.device, writer=SummaryWriter(log_dir))
+        profiler.wrap_env_cfg(env_cfg)
+        env = gym.make(task, cfg=env_cfg)
+        ...
+        print(profiler.summary())
+
+    Args:
+        device: Device the environment runs on. CUDA events are used on CUDA devices.
+        window: Number of most recent calls of every term the percentiles are computed from.
+        report_interval: Number of env steps between two reports to ``writer``.
+        writer: TensorBoard writer (anything with ``add_scalar(tag, value, step)``). The p50/p99 latencies are
+            written as ``Profile/<term>/p50_ms`` and ``Profile/<term>/p99_ms``. Nothing is reported if None.
+    """
+
+    def __init__(self, device: str, window: int = 200, report_interval: int = 1000, writer=None):
+        self.use_cuda = torch.device(device).type == "cuda"
+        self.window = window
+        self.report_interval = report_interval
+        self.writer = writer
+        self._timers: dict[str, _TermTimer] = {}
+        self._last_report_step = 0
+
+    """
+    Wrapping.
+    """
+
+    def wrap_env_cfg(self, env_cfg) -> list[str]:
+        """Wrap the reward, observation and termination terms of an environment config in place.
+
+        The terms are named ``reward/<term>``, ``observation/<group>/<term>`` and ``termination/<term>``.
+        Must be called after the config is final (e.g. after it was dumped) and before the environment is created.
+
+        Returns:
+            The names of the wrapped terms.
+        """
+        groups = {"reward": getattr(env_cfg, "rewards", None), "termination": getattr(env_cfg, "terminations", None)}
+        observations = getattr(env_cfg, "observations", None)
+        if observations is not None:
+            for group_name, group_cfg in observations.__dict__.items():
+                if group_cfg is not None and not hasattr(group_cfg, "func"):
+                    groups[f"observation/{group_name}"] = group_cfg
+        names = []
+        for prefix, group_cfg in groups.items():
+            if group_cfg is None:
+                continue
+            for term_name, term_cfg in group_cfg.__dict__.items():
+                if term_cfg is None or not callable(getattr(term_cfg, "func", None)):
+                    continue
+                name = f"{prefix}/{term_name}"
+                term_cfg.func = self.wrap(name, term_cfg.func)
+                names.append(name)
+        return names
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """Wrap a term function or term class so that its calls are timed under ``name``.
+
+        The wrapper keeps the signature (and, for term classes, the base class) of the term, so that the
+        managers resolve and check its parameters as before.
+        """
+        profiler = self
+        timer = self._timers.setdefault(name, _TermTimer(self.window, self.use_cuda))
+
+        if inspect.isclass(func):
+
+            class ProfiledTerm(func):
+                @functools.wraps(func.__call__)
+                def __call__(self, *args, **kwargs):
+                    output = timer.time(super().__call__, args, kwargs)
+                    profiler._maybe_report(args)
+                    return output
+
+            ProfiledTerm.__name__ = func.__name__
+            ProfiledTerm.__qualname__ = func.__qualname__
+            ProfiledTerm.__module__ = func.__module__
+            return ProfiledTerm
+
+        @functools.wraps(func)
+        def profiled_term(*args, **kwargs):
+            output = timer.time(func, args, kwargs)
+            profiler._maybe_report(args)
+            return output
+
+        return profiled_term
+
+    """
+    Reporting.
+    """
+
+    def percentiles(self) -> dict[str, tuple[float, float]]:
+        """The (p50, p99) latencies of every term over its window (in ms). Synchronizes the device on CUDA."""
+        stats = {}
+        for name, timer in self._timers.items():
+            latencies = sorted(timer.latencies_ms())
+            if latencies:
+                stats[name] = (_percentile(latencies, 50.0), _percentile(latencies, 99.0))
+        return stats
+
+    def report(self, step: int):
+        """Write the p50/p99 latencies of every term to the TensorBoard writer."""
+        self._last_report_step = step
+        if self.writer is None:
+            return
+        for name, (p50, p99) in self.percentiles().items():
+            self.writer.add_scalar(f"Profile/{name}/p50_ms", p50, step)
+            self.writer.add_scalar(f"Profile/{name}/p99_ms", p99, step)
+
+    def summary(self) -> str:
+        """Table of the p50/p99 latencies and call counts of all terms, sorted by p50 (descending)."""
+        stats = self.percentiles()
+        width = max([len(name) for name in stats] + [4])
+        lines = [f"{'Term':<{width}} | {'p50 (ms)':>9} | {'p99 (ms)':>9} | {'calls':>9}", "-" * (width + 38)]
+        for name, (p50, p99) in sorted(stats.items(), key=lambda item: item[1][0], reverse=True):
+            lines.append(f"{name:<{width}} | {p50:>9.4f} | {p99:>9.4f} | {self._timers[name].num_calls:>9}")
+        total_p50 = sum(p50 for p50, _ in stats.values())
+        lines.append("-" * (width + 38))
+        lines.append(f"{'Sum':<{width}} | {total_p50:>9.4f} |")
+        return "\n".join(lines)
+
+    def _maybe_report(self, args: tuple):
+        """Report if ``report_interval`` env steps passed since the last report (the env is the first argument)."""
+        if self.writer is None or not args:
+            return
+        step = getattr(args[0], "common_step_counter", None)
+        if step is not None and step - self._last_report_step >= self.report_interval:
+            self.report(step)
@@ -0,0 +1,115 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Stub vectorized environment and models of the tests (skrl interfaces, no simulation).
+
+The benchmark scripts (``scripts/benchmarks/common.py``) keep their own copies.
+"""
+
+import torch
+
+from skrl.models.torch import DeterministicMixin, GaussianMixin, Model
+
+HIDDEN_LAYERS = [64, 64]
+"""Hidden layers of the policy and value networks of the test agents."""
+
+
+def make_mlp(num_inputs: int, num_outputs: int, layers: list[int]) -> torch.nn.Sequential:
+    """MLP with ELU activations, as instantiated by skrl's model instantiator."""
+    modules = []
+    for num_units in layers:
+        modules += [torch.nn.Linear(num_inputs, num_units), torch.nn.ELU()]
+        num_inputs = num_units
+    modules.append(torch.nn.Linear(num_inputs, num_outputs))
+    return torch.nn.Sequential(*modules)
+
+
+class ReachStubVecEnv:
+    """Point-mass reach task with the interface of skrl's environment wrappers.
+
+    The point moves with the (clipped) actions as velocity, integrated in ``substeps`` substeps (a stand-in for the
+    cost of the physics). The observations are its position and the offset to the target; the reward is the
+    negative distance. Episodes terminate when the target is reached and are truncated (time-out) after
+    ``episode_length`` steps; the environments reset automatically, as in Isaac Lab. Groups of environments can be
+    stepped on their own (:meth:`step_group`).
+    """
+
+    def __init__(self, num_envs: int, device: str, episode_length: int = 100, dt: float = 0.05, substeps: int = 1):
+        self.num_envs = num_envs
+        self.device = device
+        self.episode_length = episode_length
+        self.dt = dt
+        self.substeps = substeps
+        self.num_observations = 6
+        self.num_actions = 3
+        self.position = torch.zeros(num_envs, 3, device=device)
+        self.velocity = torch.zeros(num_envs, 3, device=device)
+        self.target = torch.zeros(num_envs, 3, device=device)
+        # note: staggered episodes, as after the first resets of a training
+        self.episode_step = torch.randint(0, episode_length, (num_envs,), device=device)
+
+    def _observations(self, env_ids: slice = slice(None)) -> torch.Tensor:
+        position = self.position[env_ids]
+        return torch.cat((position, self.target[env_ids] - position), dim=-1)
+
+    def _reset(self, env_ids: torch.Tensor):
+        self.position[env_ids] = torch.rand(len(env_ids), 3, device=self.device) - 0.5
+        self.velocity[env_ids] = 0.0
+        self.target[env_ids] = torch.rand(len(env_ids), 3, device=self.device) - 0.5
+        self.episode_step[env_ids] = 0
+
+    def reset(self) -> tuple[torch.Tensor, dict]:
+        self._reset(torch.arange(self.num_envs, device=self.device))
+        return self._observations(), {}
+
+    def step(self, actions: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, dict]:
+        return self.step_group(slice(None), actions)
+
+    def step_group(
+        self, env_ids: slice, actions: torch.Tensor
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, dict]:
+        position, velocity = self.position[env_ids], self.velocity[env_ids]
+        # first-order velocity tracking of the (clipped) actions
+        command = actions.clamp(-1.0, 1.0)
+        for _ in range(self.substeps):
+            velocity += (command - velocity) * (1.0 / self.substeps)
+            position += (self.dt / self.substeps) * velocity
+        episode_step = self.episode_step[env_ids]
+        episode_step += 1
+        distance = torch.linalg.norm(self.target[env_ids] - position, dim=-1)
+        rewards = -distance
+        terminated = distance < 0.05
+        truncated = (episode_step >= self.episode_length) & ~terminated
+        infos = {"log": {"distance": distance.mean()}}
+        done_ids = (terminated | truncated).nonzero(as_tuple=False).squeeze(-1)
+        if len(done_ids):
+            self._reset(done_ids + (env_ids.start or 0))
+        observations = self._observations(env_ids)
+        return observations, rewards.unsqueeze(-1), terminated.unsqueeze(-1), truncated.unsqueeze(-1), infos
+
+
+class StubPolicy(GaussianMixin, Model):
+    """Gaussian policy MLP (as instantiated by skrl's runner, with smaller layers)."""
+
+    def __init__(self, observation_space, action_space, device):
+        Model.__init__(self, observation_space, action_space, device)
+        GaussianMixin.__init__(self, clip_actions=False, clip_log_std=True, min_log_std=-20.0, max_log_std=2.0)
+        self.net = make_mlp(self.num_observations, self.num_actions, HIDDEN_LAYERS)
+        self.log_std_parameter = torch.nn.Parameter(torch.zeros(self.num_actions))
+
+    def compute(self, inputs, role=""):
+        return self.net(inputs["states"]), self.log_std_parameter, {}
+
+
+class StubValue(DeterministicMixin, Model):
+    """Value MLP (as instantiated by skrl's runner, with smaller layers)."""
+
+    def __init__(self, observation_space, action_space, device):
+        Model.__init__(self, observation_space, action_space, device)
+        DeterministicMixin.__init__(self, clip_actions=False)
+        self.net = make_mlp(self.num_observations, 1, HIDDEN_LAYERS)
+
+    def compute(self, inputs, role=""):
+        return self.net(inputs["states"]), {}
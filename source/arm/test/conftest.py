@@ -0,0 +1,66 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Shared fixtures of the tests: skrl PPO agents on the stub environments of :mod:`_stubs` (CPU only)."""
+
+import gymnasium as gym
+import math
+import pytest
+
+from _stubs import StubPolicy, StubValue
+
+from skrl.agents.torch.ppo import PPO, PPO_DEFAULT_CONFIG
+from skrl.memories.torch import RandomMemory
+
+
+@pytest.fixture
+def make_ppo_agent(tmp_path):
+    """Factory of initialized skrl PPO agents for a stub vectorized environment.
+
+    The agents write their checkpoints to the ``agent`` directory of the test's temporary directory and do not
+    write TensorBoard data (the tracking data accumulates in ``agent.tracking_data``).
+    """
+
+    def make(
+        env, memory: bool = True, timesteps: int = 0, agent_class: type = PPO, memory_class: type = RandomMemory, **cfg
+    ) -> PPO:
+        """Create the agent (the config entries override skrl's defaults) and initialize it.
+
+        Args:
+            env: Stub vectorized environment (``num_envs``, ``num_observations``, ``num_actions``, ``device``).
+            memory: Whether to create the rollout memory (of ``cfg["rollouts"]`` steps).
+            timesteps: Number of timesteps of the training (trainer config).
+            agent_class: Class of the agent (skrl's PPO or a subclass).
+            memory_class: Class of the memory (skrl's random memory or a subclass).
+        """
+        agent_cfg = {
+            **PPO_DEFAULT_CONFIG,
+            "experiment": {**PPO_DEFAULT_CONFIG["experiment"], "directory": str(tmp_path), "experiment_name": "agent"},
+        }
+        agent_cfg["experiment"]["write_interval"] = 0
+        agent_cfg["experiment"]["checkpoint_interval"] = 0
+        for key, value in cfg.items():
+            if key in agent_cfg["experiment"]:
+                agent_cfg["experiment"][key] = value
+            else:
+                agent_cfg[key] = value
+        observation_space = gym.spaces.Box(low=-math.inf, high=math.inf, shape=(env.num_observations,))
+        action_space = gym.spaces.Box(low=-math.inf, high=math.inf, shape=(env.num_actions,))
+        models = {
+            "policy": StubPolicy(observation_space, action_space, env.device),
+            "value": StubValue(observation_space, action_space, env.device),
+        }
+        agent = agent_class(
+            models=models,
+            memory=memory_class(agent_cfg["rollouts"], env.num_envs, env.device) if memory else None,
+            observation_space=observation_space,
+            action_space=action_space,
+            device=env.device,
+            cfg=agent_cfg,
+        )
+        agent.init(trainer_cfg={"timesteps": timesteps})
+        return agent
+
+    return make
@@ -0,0 +1,83 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Check the GAE backends against a per-step reference loop, with terminated and truncated episodes (CPU only)."""
+
+import pytest
+import torch
+
+from arm.utils.advantages import GAE_BACKENDS, compute_gae
+
+NUM_STEPS = 24
+NUM_ENVS = 16
+DISCOUNT_FACTOR = 0.99
+LAMBDA = 0.95
+
+
+def reference_gae(rewards, values, last_values, terminated, truncated, bootstrap_truncated: bool):
+    """Returns and advantages of every environment and step, one scalar at a time.
+
+    A terminated step has no next value. A truncated step bootstraps from its own value (the value of the last
+    observed state of the episode) or, without bootstrapping, is handled like a terminated step. Both end the trace.
+    """
+    advantages = torch.zeros_like(rewards)
+    for env in range(rewards.shape[1]):
+        advantage = 0.0
+        for t in reversed(range(rewards.shape[0])):
+            next_value = values[t + 1, env].item() if t < rewards.shape[0] - 1 else last_values[env].item()
+            if terminated[t, env]:
+                next_value = 0.0
+            elif truncated[t, env]:
+                next_value = values[t, env].item() if bootstrap_truncated else 0.0
+            if terminated[t, env] or truncated[t, env]:
+                advantage = 0.0
+            delta = rewards[t, env].item() + DISCOUNT_FACTOR * next_value - values[t, env].item()
+            advantage = delta + DISCOUNT_FACTOR * LAMBDA * advantage
+            advantages[t, env] = advantage
+    return advantages + values, advantages
+
+
+def random_rollout(generator: torch.Generator) -> dict[str, torch.Tensor]:
+    """Rollout with ~10% terminated and ~10% truncated steps (some of them both)."""
+    return {
+        "rewards": torch.randn(NUM_STEPS, NUM_ENVS, generator=generator),
+        "values": torch.randn(NUM_STEPS, NUM_ENVS, generator=generator) * 5.0,
+        "last_values": torch.randn(NUM_ENVS, generator=generator) * 5.0,
+        "terminated": torch.rand(NUM_STEPS, NUM_ENVS, generator=generator) < 0.1,
+        "truncated": torch.rand(NUM_STEPS, NUM_ENVS, generator=generator) < 0.1,
+    }
+
+
+@pytest.mark.parametrize("bootstrap_truncated", [True, False])
+@pytest.mark.parametrize("backend", GAE_BACKENDS)
+def test_gae_matches_reference(backend: str, bootstrap_truncated: bool):
+    """Every backend computes the returns and advantages of the reference loop."""
+    rollout = random_rollout(torch.Generator().manual_seed(0))
+    assert rollout["terminated"].any() and rollout["truncated"].any()
+    expected_returns, expected_advantages = reference_gae(**rollout, bootstrap_truncated=bootstrap_truncated)
+
+    returns, advantages = compute_gae(
+        **rollout,
+        discount_factor=DISCOUNT_FACTOR,
+        lambda_coefficient=LAMBDA,
+        bootstrap_truncated=bootstrap_truncated,
+        backend=backend,
+    )
+    torch.testing.assert_close(advantages, expected_advantages, rtol=1e-5, atol=1e-5)
+    torch.testing.assert_close(returns, expected_returns, rtol=1e-5, atol=1e-5)
+
+
+def test_gae_bootstraps_truncations():
+    """The truncation bootstrap only changes the advantages of the truncated episodes."""
+    rollout = random_rollout(torch.Generator().manual_seed(1))
+    rollout["terminated"].zero_()
+    rollout["truncated"][:, : NUM_ENVS // 2] = False
+    _, bootstrapped = compute_gae(**rollout, bootstrap_truncated=True)
+    _, not_bootstrapped = compute_gae(**rollout, bootstrap_truncated=False)
+
+    # the environments without truncations are the same, the truncated steps differ
+    untruncated = ~rollout["truncated"].any(dim=0)
+    torch.testing.assert_close(bootstrapped[:, untruncated], not_bootstrapped[:, untruncated])
+    assert not torch.allclose(bootstrapped[rollout["truncated"]], not_bootstrapped[rollout["truncated"]])
@@ -0,0 +1,70 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Train skrl's PPO and the GAE agent on the stub reach environment and compare their updates (CPU only)."""
+
+import pytest
+import torch
+
+from _stubs import ReachStubVecEnv
+
+from skrl.agents.torch.ppo import PPO
+
+from arm.utils.advantages import GAE_BACKENDS
+from arm.utils.gae_ppo import GAEPPO
+
+NUM_ENVS = 64
+ROLLOUTS = 16
+UPDATES = 3
+
+
+def train(make_ppo_agent, agent_class: type, **cfg) -> PPO:
+    """Train the agent (as skrl's sequential trainer does) from a fixed seed and return it."""
+    torch.manual_seed(0)
+    env = ReachStubVecEnv(NUM_ENVS, "cpu", episode_length=20)
+    timesteps = ROLLOUTS * UPDATES
+    agent = make_ppo_agent(
+        env, timesteps=timesteps, agent_class=agent_class, rollouts=ROLLOUTS, learning_epochs=2, mini_batches=4, **cfg
+    )
+    states, _ = env.reset()
+    for timestep in range(timesteps):
+        agent.pre_interaction(timestep, timesteps)
+        with torch.no_grad():
+            actions = agent.act(states, timestep, timesteps)[0]
+            next_states, rewards, terminated, truncated, infos = env.step(actions)
+            agent.record_transition(
+                states, actions, rewards, next_states, terminated, truncated, infos, timestep, timesteps
+            )
+        agent.post_interaction(timestep, timesteps)
+        states = next_states
+    return agent
+
+
+@pytest.mark.parametrize("backend", [backend for backend in GAE_BACKENDS if backend != "compile"])
+def test_gae_agent_matches_skrl_ppo(make_ppo_agent, backend: str):
+    """Without the truncation bootstrap, the GAE agent computes the same advantages and updates as skrl's PPO."""
+    expected = train(make_ppo_agent, PPO)
+    agent = train(make_ppo_agent, GAEPPO, gae_backend=backend, gae_bootstrap_truncated=False)
+
+    for name in ("returns", "advantages"):
+        torch.testing.assert_close(
+            agent.memory.get_tensor_by_name(name), expected.memory.get_tensor_by_name(name), rtol=1e-4, atol=1e-5
+        )
+    for tag in ("Loss / Policy loss", "Loss / Value loss", "Policy / Standard deviation"):
+        assert len(agent.tracking_data[tag]) == UPDATES
+        torch.testing.assert_close(
+            torch.tensor(agent.tracking_data[tag]), torch.tensor(expected.tracking_data[tag]), rtol=1e-4, atol=1e-5
+        )
+    for name in ("policy", "value"):
+        expected_state = getattr(expected, name).state_dict()
+        for key, tensor in getattr(agent, name).state_dict().items():
+            torch.testing.assert_close(tensor, expected_state[key], rtol=1e-4, atol=1e-5)
+
+
+def test_gae_agent_rejects_time_limit_bootstrap(make_ppo_agent):
+    """The truncations are bootstrapped by the GAE, not a second time by skrl's reward shaping."""
+    env = ReachStubVecEnv(NUM_ENVS, "cpu")
+    with pytest.raises(ValueError, match="time_limit_bootstrap"):
+        make_ppo_agent(env, agent_class=GAEPPO, rollouts=ROLLOUTS, time_limit_bootstrap=True)
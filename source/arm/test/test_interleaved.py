@@ -0,0 +1,32 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Check the merging of the infos of groups of environments (CPU only)."""
+
+import torch
+
+from arm.utils.interleaved import merge_group_infos, split_groups
+
+
+def test_merge_group_infos():
+    """Scalars are averaged by group size, per-environment tensors concatenated and other values kept."""
+    groups = split_groups(10, 3)
+    sizes = [group.stop - group.start for group in groups]
+    distances = torch.rand(10)
+    infos = [
+        {
+            "log": {"distance": distances[group].mean(), "name": f"group {index}"},
+            "time_outs": distances[group] > 0.5,
+        }
+        for index, group in enumerate(groups)
+    ]
+    infos[1]["log"]["success"] = torch.tensor(1.0)
+
+    merged = merge_group_infos(infos, sizes)
+    torch.testing.assert_close(merged["log"]["distance"], distances.mean())
+    assert torch.equal(merged["time_outs"], distances > 0.5)
+    assert merged["log"]["name"] == "group 2"
+    # only the groups that report a value are averaged
+    torch.testing.assert_close(merged["log"]["success"], torch.tensor(1.0))
@@ -0,0 +1,81 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Train the lean PPO learner on the stub reach environment and load its checkpoints with skrl (CPU only)."""
+
+import math
+import os
+import torch
+
+from _stubs import ReachStubVecEnv
+
+from arm.utils.checkpoint_format import checkpoint_timestep
+from arm.utils.lean_ppo import LeanPPO
+
+NUM_ENVS = 64
+ROLLOUTS = 16
+UPDATES = 4
+
+
+def test_checkpoint_loads_into_skrl_agent(make_ppo_agent):
+    """The checkpoint written through the agent during the lean training is loaded by a new skrl agent."""
+    torch.manual_seed(0)
+    env = ReachStubVecEnv(NUM_ENVS, "cpu")
+    timesteps = ROLLOUTS * UPDATES
+    agent = make_ppo_agent(
+        env, timesteps=timesteps, rollouts=ROLLOUTS, learning_epochs=2, mini_batches=4, checkpoint_interval=timesteps
+    )
+    learner = LeanPPO.from_skrl_agent(agent, env.num_envs)
+    assert agent.memory is None
+    learner.train(env, timesteps)
+
+    # one update per rollout, tracked through the agent
+    for tag in ("Loss / Policy loss", "Loss / Value loss", "Policy / Standard deviation"):
+        values = agent.tracking_data[tag]
+        assert len(values) == UPDATES
+        assert all(math.isfinite(value) for value in values)
+    assert len(agent.tracking_data["Info / distance"]) == timesteps
+
+    # the checkpoint of the last timestep is written by ``Agent.write_checkpoint`` (skrl's format)
+    path = os.path.join(agent.experiment_dir, "checkpoints", f"agent_{timesteps}.pt")
+    assert os.path.isfile(path)
+    checkpoint = torch.load(path, map_location="cpu", weights_only=False)
+    assert set(learner.state_dict()) <= set(checkpoint)
+
+    restored = make_ppo_agent(env, memory=False, rollouts=ROLLOUTS)
+    restored.load(path)
+    for name in ("policy", "value"):
+        expected = getattr(agent, name).state_dict()
+        for key, tensor in getattr(restored, name).state_dict().items():
+            torch.testing.assert_close(tensor, expected[key], rtol=0.0, atol=0.0)
+    # the restored optimizer continues from the trained moments
+    restored_state = restored.optimizer.state_dict()["state"]
+    assert restored_state.keys() == agent.optimizer.state_dict()["state"].keys()
+
+    # same actions as the trained policy
+    states, _ = env.reset()
+    with torch.no_grad():
+        _, _, outputs = agent.policy.act({"states": states}, role="policy")
+        _, _, restored_outputs = restored.policy.act({"states": states}, role="policy")
+    torch.testing.assert_close(restored_outputs["mean_actions"], outputs["mean_actions"])
+
+
+def test_resume_continues_timesteps(make_ppo_agent):
+    """A learner resumed from a checkpoint continues its timesteps (updates and checkpoint numbering)."""
+    torch.manual_seed(0)
+    env = ReachStubVecEnv(NUM_ENVS, "cpu")
+    timesteps = ROLLOUTS * UPDATES
+    cfg = {"rollouts": ROLLOUTS, "learning_epochs": 2, "mini_batches": 4, "checkpoint_interval": timesteps}
+    agent = make_ppo_agent(env, timesteps=timesteps, **cfg)
+    LeanPPO.from_skrl_agent(agent, env.num_envs).train(env, timesteps)
+    path = os.path.join(agent.experiment_dir, "checkpoints", f"agent_{timesteps}.pt")
+    assert checkpoint_timestep(path) == timesteps
+
+    resumed = make_ppo_agent(env, timesteps=2 * timesteps, **cfg)
+    resumed.load(path)
+    LeanPPO.from_skrl_agent(resumed, env.num_envs).train(env, 2 * timesteps, initial_timestep=checkpoint_timestep(path))
+    # only the remaining timesteps are trained, the next checkpoint is numbered after the resumed timesteps
+    assert len(resumed.tracking_data["Loss / Policy loss"]) == UPDATES
+    assert os.path.isfile(os.path.join(resumed.experiment_dir, "checkpoints", f"agent_{2 * timesteps}.pt"))
@@ -0,0 +1,122 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Train a skrl PPO agent in float32 and in mixed precision (bfloat16 rollouts) and compare them (CPU only)."""
+
+import math
+import torch
+
+from skrl.memories.torch import RandomMemory
+
+from arm.utils.mixed_precision import ReducedPrecisionMemory, configure_mixed_precision, memory_nbytes
+
+NUM_ENVS = 256
+NUM_OBSERVATIONS = 22
+NUM_ACTIONS = 8
+ROLLOUTS = 16
+UPDATES = 4
+
+
+class FixedStatesVecEnv:
+    """Vectorized environment whose states are a fixed random sequence (skrl wrapper interface).
+
+    The states do not depend on the actions, so both precision modes see the same rollouts up to the rounding of
+    the actions. The reward is the negative distance of the actions to a linear function of the states. All
+    episodes are truncated after ``episode_length`` steps.
+    """
+
+    def __init__(self, num_envs: int, episode_length: int = 32, seed: int = 0):
+        generator = torch.Generator().manual_seed(seed)
+        self.num_envs = num_envs
+        self.num_observations = NUM_OBSERVATIONS
+        self.num_actions = NUM_ACTIONS
+        self.device = "cpu"
+        self.episode_length = episode_length
+        # observations in the ranges of joint positions/velocities and positions
+        self.states = torch.randn(episode_length + 1, num_envs, NUM_OBSERVATIONS, generator=generator) * 3.0
+        self.projection = torch.randn(NUM_OBSERVATIONS, NUM_ACTIONS, generator=generator) / math.sqrt(NUM_OBSERVATIONS)
+        self.step_count = 0
+
+    def reset(self) -> tuple[torch.Tensor, dict]:
+        self.step_count = 0
+        return self.states[0], {}
+
+    def step(self, actions: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, dict]:
+        rewards = -torch.linalg.norm(actions.float() - self.states[self.step_count] @ self.projection, dim=-1)
+        self.step_count += 1
+        terminated = torch.zeros(self.num_envs, 1, dtype=torch.bool)
+        truncated = torch.full_like(terminated, self.step_count == self.episode_length)
+        next_states = self.states[self.step_count]
+        if self.step_count == self.episode_length:
+            self.step_count = 0
+        return next_states, rewards.unsqueeze(-1), terminated, truncated, {}
+
+
+def train(make_ppo_agent, mixed_precision: bool) -> tuple[dict, torch.Tensor, int, int]:
+    """Train the agent (as skrl's sequential trainer does) and return its tracking data and last returns.
+
+    Returns:
+        The tracking data, the returns of the last rollout, the memory size (bytes) and the bytes saved by the reduced
+        precision.
+    """
+    torch.manual_seed(0)
+    env = FixedStatesVecEnv(NUM_ENVS)
+    timesteps = ROLLOUTS * UPDATES
+    agent_cfg = {"agent": {"rollouts": ROLLOUTS, "learning_epochs": 4, "mini_batches": 4, "learning_rate": 1e-3}}
+    memory_class = RandomMemory
+    if mixed_precision:
+        configure_mixed_precision(agent_cfg, env.device, "bfloat16")
+        memory_class = ReducedPrecisionMemory
+    agent = make_ppo_agent(env, timesteps=timesteps, memory_class=memory_class, **agent_cfg["agent"])
+    saved = agent.memory.saved_nbytes if mixed_precision else 0
+
+    states, _ = env.reset()
+    for timestep in range(timesteps):
+        agent.pre_interaction(timestep, timesteps)
+        with torch.no_grad():
+            actions = agent.act(states, timestep, timesteps)[0]
+            next_states, rewards, terminated, truncated, infos = env.step(actions)
+            agent.record_transition(
+                states, actions, rewards, next_states, terminated, truncated, infos, timestep, timesteps
+            )
+        agent.post_interaction(timestep, timesteps)
+        states = next_states
+    returns = agent.memory.get_tensor_by_name("returns").clone()
+    return agent.tracking_data, returns, memory_nbytes(agent.memory), saved
+
+
+def test_mixed_precision_matches_float32(make_ppo_agent):
+    """The losses and returns of the mixed-precision training stay within a tolerance of the float32 training."""
+    fp32_data, fp32_returns, fp32_nbytes, _ = train(make_ppo_agent, mixed_precision=False)
+    mixed_data, mixed_returns, nbytes, saved = train(make_ppo_agent, mixed_precision=True)
+
+    # only the observations are stored in bfloat16: their 22 values per sample take 44 of 88 bytes, which saves
+    # 44 of the 142 bytes of a sample (~31%)
+    assert nbytes == fp32_nbytes - saved
+    assert math.isclose(saved / fp32_nbytes, 44 / 142, rel_tol=1e-6)
+
+    # the value loss is dominated by the (identical) rewards, the policy loss is a small clipped surrogate
+    for tag, rtol, atol in (("Loss / Value loss", 0.05, 0.0), ("Loss / Policy loss", 0.0, 0.01)):
+        assert len(fp32_data[tag]) == len(mixed_data[tag]) == UPDATES
+        torch.testing.assert_close(torch.tensor(mixed_data[tag]), torch.tensor(fp32_data[tag]), rtol=rtol, atol=atol)
+    assert mixed_returns.dtype == torch.float32
+    torch.testing.assert_close(mixed_returns, fp32_returns, rtol=0.05, atol=0.05)
+
+
+def test_reduced_precision_memory_samples_float32(make_ppo_agent):
+    """The observations are stored in bfloat16 and sampled (randomly or all) in float32."""
+    env = FixedStatesVecEnv(8)
+    agent = make_ppo_agent(env, memory_class=ReducedPrecisionMemory, rollouts=4)
+    memory = agent.memory
+    assert memory.get_tensor_by_name("states").dtype == torch.bfloat16
+    assert memory.get_tensor_by_name("actions").dtype == torch.float32
+    for step in range(4):
+        memory.add_samples(states=env.states[step], actions=torch.zeros(env.num_envs, NUM_ACTIONS))
+
+    for batches in (memory.sample(["states", "actions"], batch_size=16), memory.sample_all(["states"], mini_batches=2)):
+        for batch in batches:
+            assert all(tensor.dtype == torch.float32 for tensor in batch)
+    (states,) = memory.sample_all(["states"])[0]
+    torch.testing.assert_close(states, env.states[:4].reshape(-1, NUM_OBSERVATIONS), rtol=1e-2, atol=1e-2)
@@ -0,0 +1,188 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Check the reach reward kernels against the reward term functions (on CPU, without a simulator)."""
+
+import pytest
+import torch
+
+from arm.utils.reward_kernels import (
+    REACH_REWARD_KINDS,
+    REACH_TASK_REWARD_TERMS,
+    fused_reach_rewards,
+    reach_reward_terms,
+    reach_task_reward_terms,
+)
+
+NUM_ENVS = 1024
+NUM_JOINTS = 8
+L1_JOINT_IDS = [1, 2, 3, 4, 5, 6]
+
+"""
+Reference terms.
+
+Same computations as the term functions of :mod:`arm.tasks.manager_based.arm.mdp.rewards` (which need the
+simulator), on the quantities they read from the scene.
+"""
+
+
+def end_effector_position_to_marker_l2(ee_pos: torch.Tensor, target_pos: torch.Tensor) -> torch.Tensor:
+    return torch.norm(ee_pos - target_pos, dim=1)
+
+
+def distance_guidance_reward(distance: torch.Tensor, prev_distance: torch.Tensor, has_prev: torch.Tensor):
+    reward = torch.exp(distance * -3.0)
+    bonus = torch.clamp((prev_distance - distance) * 100.0, -5.0, 10.0)
+    return reward + bonus * has_prev
+
+
+def approach_progress_reward(distance: torch.Tensor) -> torch.Tensor:
+    approach_reward = torch.zeros_like(distance)
+    approach_reward[distance < 0.1] += 10.0
+    approach_reward[distance < 0.05] += 20.0
+    approach_reward[distance < 0.02] += 50.0
+    return approach_reward
+
+
+def joint_velocity_reward(joint_vel: torch.Tensor) -> torch.Tensor:
+    velocity_magnitude = torch.norm(joint_vel, dim=1)
+    velocity_reward = torch.exp(-torch.abs(velocity_magnitude - 2.0) / 2.0)
+    movement_bonus = torch.clamp(velocity_magnitude * 0.5, 0.0, 2.0)
+    return velocity_reward + movement_bonus
+
+
+def joint_vel_l1(joint_vel: torch.Tensor) -> torch.Tensor:
+    return torch.sum(torch.abs(joint_vel[:, L1_JOINT_IDS]), dim=1)
+
+
+"""
+Tests.
+"""
+
+
+def random_step(generator: torch.Generator) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Sample end-effector positions close to the targets (all approach thresholds are hit) and joint velocities."""
+    target_pos = torch.rand(NUM_ENVS, 3, generator=generator) * 0.6 - 0.3
+    ee_pos = target_pos + torch.randn(NUM_ENVS, 3, generator=generator) * 0.05
+    joint_vel = torch.randn(NUM_ENVS, NUM_JOINTS, generator=generator) * 2.0
+    return ee_pos, target_pos, joint_vel
+
+
+def test_reach_reward_terms():
+    """The unweighted terms match the term functions over a sequence of steps (with and without a previous step)."""
+    generator = torch.Generator().manual_seed(0)
+    prev_distance = torch.zeros(NUM_ENVS)
+    has_prev = torch.zeros(NUM_ENVS, dtype=torch.bool)
+    for _ in range(5):
+        ee_pos, target_pos, joint_vel = random_step(generator)
+        distance = end_effector_position_to_marker_l2(ee_pos, target_pos)
+        expected = torch.stack(
+            [
+                distance,
+                distance_guidance_reward(distance, prev_distance, has_prev),
+                approach_progress_reward(distance),
+                joint_velocity_reward(joint_vel),
+                joint_vel_l1(joint_vel),
+            ],
+            dim=1,
+        )
+        # same convention as the fused term: envs without a previous distance pass their current one
+        terms = reach_reward_terms(
+            distance, torch.where(has_prev, prev_distance, distance), joint_vel, joint_vel[:, L1_JOINT_IDS]
+        )
+        assert terms.shape == (NUM_ENVS, len(REACH_REWARD_KINDS))
+        torch.testing.assert_close(terms, expected, rtol=1e-5, atol=1e-6)
+        prev_distance = distance
+        # the first half of the envs get reset after every step
+        has_prev = torch.arange(NUM_ENVS) >= NUM_ENVS // 2
+
+
+@pytest.mark.parametrize(
+    "terms",
+    [
+        # the reward config of the task (the distance penalty stays a separate term, see ``fuse_reach_rewards``)
+        [("distance_guidance", 2.0), ("approach_progress", 1.0), ("joint_velocity", 0.1), ("joint_vel_l1", -5e-5)],
+        # all kinds, some of them more than once
+        [(kind, 0.5 * (index + 1)) for index, kind in enumerate(REACH_REWARD_KINDS + ("joint_vel_l1",))],
+    ],
+)
+def test_fused_reach_rewards(terms: list[tuple[str, float]]):
+    """The weighted breakdown and sum match the weighted term functions."""
+    generator = torch.Generator().manual_seed(1)
+    ee_pos, target_pos, joint_vel = random_step(generator)
+    prev_ee_pos, _, _ = random_step(generator)
+    distance = end_effector_position_to_marker_l2(ee_pos, target_pos)
+    prev_distance = end_effector_position_to_marker_l2(prev_ee_pos, target_pos)
+    reference = {
+        "end_effector_distance": distance,
+        "distance_guidance": distance_guidance_reward(distance, prev_distance, torch.ones(NUM_ENVS)),
+        "approach_progress": approach_progress_reward(distance),
+        "joint_velocity": joint_velocity_reward(joint_vel),
+        "joint_vel_l1": joint_vel_l1(joint_vel),
+    }
+    expected = torch.stack([reference[kind] * weight for kind, weight in terms], dim=1)
+
+    term_kinds = torch.tensor([REACH_REWARD_KINDS.index(kind) for kind, _ in terms], dtype=torch.long)
+    weights = torch.tensor([weight for _, weight in terms])
+    total, breakdown = fused_reach_rewards(
+        distance, prev_distance, joint_vel, joint_vel[:, L1_JOINT_IDS], term_kinds, weights
+    )
+    torch.testing.assert_close(breakdown, expected, rtol=1e-5, atol=1e-6)
+    torch.testing.assert_close(total, expected.sum(dim=1), rtol=1e-5, atol=1e-5)
+
+
+def test_reach_task_reward_terms_groups():
+    """Computing the terms group by group (on views of the buffers) gives the same terms and state as one pass."""
+    generator = torch.Generator().manual_seed(2)
+    num_buckets = 64
+    num_terms = len(REACH_TASK_REWARD_TERMS)
+
+    def make_state() -> dict[str, torch.Tensor]:
+        return {
+            "terms": torch.zeros(NUM_ENVS, num_terms),
+            "prev_distance": torch.zeros(NUM_ENVS),
+            "has_prev": torch.zeros(NUM_ENVS, dtype=torch.bool),
+            "stagnation_counter": torch.zeros(NUM_ENVS),
+            "visits": torch.zeros(NUM_ENVS, num_buckets, dtype=torch.int32),
+        }
+
+    def compute(state: dict[str, torch.Tensor], env_ids: slice, terminated, distance, ee_pos, joint_vel):
+        return reach_task_reward_terms(
+            state["terms"][env_ids],
+            terminated[env_ids],
+            distance[env_ids],
+            ee_pos[env_ids],
+            joint_vel[env_ids],
+            joint_vel[env_ids][:, L1_JOINT_IDS],
+            state["prev_distance"][env_ids],
+            state["has_prev"][env_ids],
+            state["stagnation_counter"][env_ids],
+            state["visits"][env_ids],
+            0.05,
+            300.0,
+            0.05,
+        )
+
+    full, grouped = make_state(), make_state()
+    groups = [slice(0, NUM_ENVS // 4), slice(NUM_ENVS // 4, NUM_ENVS)]
+    for _ in range(5):
+        ee_pos, target_pos, joint_vel = random_step(generator)
+        distance = end_effector_position_to_marker_l2(ee_pos, target_pos)
+        terminated = torch.rand(NUM_ENVS, generator=generator) < 0.1
+        reached = compute(full, slice(None), terminated, distance, ee_pos, joint_vel)
+        reached_groups = [compute(grouped, env_ids, terminated, distance, ee_pos, joint_vel) for env_ids in groups]
+        assert torch.equal(reached, distance < 0.05)
+        assert torch.equal(reached, torch.cat(reached_groups))
+        for name in full:
+            torch.testing.assert_close(grouped[name], full[name])
+    # the state holds the distances of the last step and one visit per step
+    torch.testing.assert_close(full["prev_distance"], distance)
+    assert torch.all(full["has_prev"])
+    assert torch.all(full["visits"].sum(dim=1) == 5)
+    # both L1 penalties see the same joints, only their weights differ
+    names = [name for name, _ in REACH_TASK_REWARD_TERMS]
+    expected_l1 = joint_vel_l1(joint_vel)
+    torch.testing.assert_close(full["terms"][:, names.index("joint_vel")], expected_l1)
+    torch.testing.assert_close(full["terms"][:, names.index("joint_vel_smooth")], expected_l1)